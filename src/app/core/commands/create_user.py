@@ -9,6 +9,7 @@ from app.core.commands.exceptions import UsernameAlreadyExistsError
 from app.core.commands.ports.flusher import Flusher
 from app.core.commands.ports.transaction_manager import TransactionManager
 from app.core.commands.ports.user_tx_storage import UserTxStorage
+from app.core.commands.ports.users_version import UsersVersion
 from app.core.commands.ports.utc_timer import UtcTimer
 from app.core.common.authorization.authorize import authorize
 from app.core.common.authorization.current_user_service import CurrentUserService
@@ -54,6 +55,7 @@ class CreateUser:
         user_tx_storage: UserTxStorage,
         flusher: Flusher,
         transaction_manager: TransactionManager,
+        users_version: UsersVersion,
     ) -> None:
         self._current_user_service = current_user_service
         self._user_service = user_service
@@ -61,6 +63,7 @@ class CreateUser:
         self._user_tx_storage = user_tx_storage
         self._flusher = flusher
         self._transaction_manager = transaction_manager
+        self._users_version = users_version
 
     async def execute(self, request: CreateUserRequest) -> CreateUserResponse:
         logger.info("Create user: started.")
@@ -76,6 +79,11 @@ class CreateUser:
         )
         username = Username(request.username)
         password = RawPassword(request.password)
+        # Cheap index probe before hashing; the unique constraint stays the final guard.
+        if await self._user_tx_storage.exists_by_username(username):
+            raise UsernameAlreadyExistsError
+
+        await self._transaction_manager.release()
         user = await self._user_service.create_user_with_raw_password(
             user_id=create_user_id(),
             username=username,
@@ -90,6 +98,7 @@ class CreateUser:
             raise
 
         await self._transaction_manager.commit()
+        await self._users_version.bump()
 
         logger.info("Create user: done.")
         return CreateUserResponse(
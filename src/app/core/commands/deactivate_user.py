@@ -5,6 +5,7 @@ from uuid import UUID
 from app.core.commands.exceptions import UserNotFoundError
 from app.core.commands.ports.transaction_manager import TransactionManager
 from app.core.commands.ports.user_tx_storage import UserTxStorage
+from app.core.commands.ports.users_version import UsersVersion
 from app.core.commands.ports.utc_timer import UtcTimer
 from app.core.common.authorization.authorize import authorize
 from app.core.common.authorization.current_user_service import CurrentUserService
@@ -42,6 +43,7 @@ class DeactivateUser:
         user_service: UserService,
         utc_timer: UtcTimer,
         transaction_manager: TransactionManager,
+        users_version: UsersVersion,
         access_revoker: AccessRevoker,
     ) -> None:
         self._current_user_service = current_user_service
@@ -49,6 +51,7 @@ class DeactivateUser:
         self._user_service = user_service
         self._utc_timer = utc_timer
         self._transaction_manager = transaction_manager
+        self._users_version = users_version
         self._access_revoker = access_revoker
 
     async def execute(self, request: DeactivateUserRequest) -> None:
@@ -83,6 +86,7 @@ class DeactivateUser:
             is_active=False,
         ):
             await self._transaction_manager.commit()
+            await self._users_version.bump()
 
         await self._access_revoker.remove_all_user_access(user.id_)
 
@@ -9,3 +9,7 @@ class UsernameAlreadyExistsError(BaseError):
 
 class UserNotFoundError(BaseError):
     default_message: ClassVar[str] = "User not found."
+
+
+class UserModifiedConcurrentlyError(BaseError):
+    default_message: ClassVar[str] = "User was modified concurrently. Please retry."
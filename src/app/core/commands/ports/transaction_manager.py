@@ -12,3 +12,11 @@ class TransactionManager(Protocol):
     @abstractmethod
     async def commit(self) -> None:
         """Commit the successful outcome of a business transaction."""
+
+    @abstractmethod
+    async def release(self) -> None:
+        """
+        End a read-only phase and return its connection before slow in-process work.
+        Loaded objects stay usable and tracked; the next storage call starts a new transaction.
+        Meant for phases without pending changes.
+        """
@@ -3,6 +3,7 @@ from typing import Protocol
 
 from app.core.common.entities.types_ import UserId
 from app.core.common.entities.user import User
+from app.core.common.value_objects.username import Username
 
 
 class UserTxStorage(Protocol):
@@ -18,3 +19,6 @@ class UserTxStorage(Protocol):
         *,
         for_update: bool = False,
     ) -> User | None: ...
+
+    @abstractmethod
+    async def exists_by_username(self, username: Username) -> bool: ...
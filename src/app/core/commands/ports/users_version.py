@@ -0,0 +1,12 @@
+from abc import abstractmethod
+from typing import Protocol
+
+
+class UsersVersion(Protocol):
+    """
+    Version of the users as a whole, for reads derived from them.
+    Call `bump` after committing any change to a user, so results read earlier stop being served.
+    """
+
+    @abstractmethod
+    async def bump(self) -> None: ...
@@ -5,6 +5,7 @@ from uuid import UUID
 from app.core.commands.exceptions import UserNotFoundError
 from app.core.commands.ports.transaction_manager import TransactionManager
 from app.core.commands.ports.user_tx_storage import UserTxStorage
+from app.core.commands.ports.users_version import UsersVersion
 from app.core.commands.ports.utc_timer import UtcTimer
 from app.core.common.authorization.authorize import authorize
 from app.core.common.authorization.current_user_service import CurrentUserService
@@ -39,12 +40,14 @@ class RevokeAdmin:
         user_service: UserService,
         utc_timer: UtcTimer,
         transaction_manager: TransactionManager,
+        users_version: UsersVersion,
     ) -> None:
         self._current_user_service = current_user_service
         self._user_tx_storage = user_tx_storage
         self._user_service = user_service
         self._utc_timer = utc_timer
         self._transaction_manager = transaction_manager
+        self._users_version = users_version
 
     async def execute(self, request: RevokeAdminRequest) -> None:
         logger.info("Revoke admin: started.")
@@ -78,5 +81,6 @@ class RevokeAdmin:
             is_admin=False,
         ):
             await self._transaction_manager.commit()
+            await self._users_version.bump()
 
         logger.info("Revoke admin: done.")
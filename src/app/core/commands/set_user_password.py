@@ -5,6 +5,7 @@ from uuid import UUID
 from app.core.commands.exceptions import UserNotFoundError
 from app.core.commands.ports.transaction_manager import TransactionManager
 from app.core.commands.ports.user_tx_storage import UserTxStorage
+from app.core.commands.ports.users_version import UsersVersion
 from app.core.commands.ports.utc_timer import UtcTimer
 from app.core.common.authorization.authorize import authorize
 from app.core.common.authorization.current_user_service import CurrentUserService
@@ -31,6 +32,7 @@ class SetUserPassword:
     """
     - Open to admins.
     - Admins can set passwords of subordinate users.
+    - Fails with a conflict if the user is changed concurrently.
     """
 
     def __init__(
@@ -40,12 +42,14 @@ class SetUserPassword:
         user_service: UserService,
         utc_timer: UtcTimer,
         transaction_manager: TransactionManager,
+        users_version: UsersVersion,
     ) -> None:
         self._current_user_service = current_user_service
         self._user_tx_storage = user_tx_storage
         self._user_service = user_service
         self._utc_timer = utc_timer
         self._transaction_manager = transaction_manager
+        self._users_version = users_version
 
     async def execute(self, request: SetUserPasswordRequest) -> None:
         logger.info("Set user password: started.")
@@ -60,10 +64,7 @@ class SetUserPassword:
         )
         user_id = UserId(request.user_id)
         password = RawPassword(request.password)
-        user = await self._user_tx_storage.get_by_id(
-            user_id,
-            for_update=True,
-        )
+        user = await self._user_tx_storage.get_by_id(user_id)
         if user is None:
             raise UserNotFoundError
 
@@ -74,11 +75,14 @@ class SetUserPassword:
                 target=user,
             ),
         )
+        # No row lock while hashing: commit fails if the user was changed meanwhile.
+        await self._transaction_manager.release()
         await self._user_service.change_password(
             user,
             password,
             now=self._utc_timer.now,
         )
         await self._transaction_manager.commit()
+        await self._users_version.bump()
 
         logger.info("Set user password: done.")
@@ -2,8 +2,10 @@ from abc import abstractmethod
 from typing import Protocol
 
 from app.core.common.entities.types_ import UserId
+from app.core.common.entities.user import User
 
 
 class IdentityProvider(Protocol):
     @abstractmethod
-    async def get_current_user_id(self) -> UserId: ...
+    async def get_current_user(self, *, for_update: bool = False) -> tuple[UserId, User | None]:
+        """Resolves the identity and loads its user together; the user is None if it no longer exists."""
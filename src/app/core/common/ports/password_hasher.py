@@ -9,5 +9,13 @@ class PasswordHasher(Protocol):
     @abstractmethod
     async def hash(self, raw_password: RawPassword) -> UserPasswordHash: ...
 
+    @abstractmethod
+    async def rehash(self, raw_password: RawPassword) -> UserPasswordHash:
+        """Like `hash`, at the lowest priority: fails as busy rather than wait for capacity others need."""
+
     @abstractmethod
     async def verify(self, raw_password: RawPassword, hashed_password: UserPasswordHash) -> bool: ...
+
+    @abstractmethod
+    async def needs_rehash(self, hashed_password: UserPasswordHash) -> bool:
+        """True when the hash was made with other parameters than the current ones."""
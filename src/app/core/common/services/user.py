@@ -73,6 +73,23 @@ class UserService:
         user.password_hash = await self._password_hasher.hash(raw_password)
         user.updated_at = now
 
+    async def needs_password_rehash(self, user: User) -> bool:
+        return await self._password_hasher.needs_rehash(user.password_hash)
+
+    async def rehash_password_if_needed(
+        self,
+        user: User,
+        raw_password: RawPassword,
+        *,
+        now: UtcDatetime,
+    ) -> bool:
+        """Call only after `raw_password` is verified against the stored hash."""
+        if not await self.needs_password_rehash(user):
+            return False
+        user.password_hash = await self._password_hasher.rehash(raw_password)
+        user.updated_at = now
+        return True
+
     def set_role(
         self,
         user: User,
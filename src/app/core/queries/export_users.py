@@ -0,0 +1,51 @@
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.core.common.authorization.authorize import authorize
+from app.core.common.authorization.current_user_service import CurrentUserService
+from app.core.common.authorization.permissions import CanManageRole, RoleManagementContext
+from app.core.common.entities.types_ import UserRole
+from app.core.queries.models.user import UserQm
+from app.core.queries.ports.user_reader import UserReader
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ExportUsersRequest:
+    # Resumes an interrupted export after the last ID received
+    after_id: UUID | None = None
+
+
+class ExportUsers:
+    """
+    - Open to admins.
+    - Streams every existing user in ID order, in batches, without counting or holding them all.
+    - Resumable: an interrupted export continues after the last ID it delivered.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        user_reader: UserReader,
+    ) -> None:
+        self._current_user_service = current_user_service
+        self._user_reader = user_reader
+
+    async def execute(self, request: ExportUsersRequest) -> AsyncIterator[list[UserQm]]:
+        logger.info("Export users: started.")
+
+        current_user = await self._current_user_service.get_current_user()
+
+        authorize(
+            CanManageRole(),
+            context=RoleManagementContext(
+                subject=current_user,
+                target_role=UserRole.USER,
+            ),
+        )
+
+        logger.info("Export users: streaming.")
+        return self._user_reader.stream_users(after_id=request.after_id)
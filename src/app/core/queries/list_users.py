@@ -1,14 +1,20 @@
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass
+from datetime import datetime
 from enum import StrEnum
+from typing import Final
 
 from app.core.common.authorization.authorize import authorize
 from app.core.common.authorization.current_user_service import CurrentUserService
 from app.core.common.authorization.permissions import CanManageRole, RoleManagementContext
 from app.core.common.entities.types_ import UserRole
-from app.core.queries.ports.user_reader import ListUsersQm, UserReader
+from app.core.queries.ports.user_reader import ListUsersPageQm, ListUsersQm, UserReader
+from app.core.queries.query_support.exceptions import PaginationError
+from app.core.queries.query_support.keyset_pagination import CursorValue, KeysetCursor, KeysetPaginationParams
 from app.core.queries.query_support.offset_pagination import OffsetPaginationParams
 from app.core.queries.query_support.sorting import SortingOrder, SortingParams
+from app.core.queries.query_support.total_count import TotalCountMode
 
 logger = logging.getLogger(__name__)
 
@@ -21,18 +27,34 @@ class UserSortingField(StrEnum):
     UPDATED_AT = "updated_at"
 
 
+USER_CURSOR_VALUE_TYPES: Final[Mapping[str, type[CursorValue]]] = {
+    UserSortingField.USERNAME: str,
+    UserSortingField.ROLE: UserRole,
+    UserSortingField.IS_ACTIVE: bool,
+    UserSortingField.CREATED_AT: datetime,
+    UserSortingField.UPDATED_AT: datetime,
+}
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class ListUsersRequest:
     limit: int
     offset: int
     sorting_field: UserSortingField
     sorting_order: SortingOrder
+    # Offset mode only: cursor pages carry no total
+    total_count: TotalCountMode = TotalCountMode.EXACT
+    # Cursor mode: `cursor` comes from the previous page's `next_cursor`; the first page has none.
+    paginate_by_cursor: bool = False
+    cursor: str | None = None
 
 
 class ListUsers:
     """
     - Open to admins.
     - Retrieves paginated list of existing users with relevant info.
+    - Pages by offset, with an exact, cached, estimated or no total,
+      or by cursor, where deep pages cost the same as the first.
     """
 
     def __init__(
@@ -43,7 +65,7 @@ class ListUsers:
         self._current_user_service = current_user_service
         self._user_reader = user_reader
 
-    async def execute(self, request: ListUsersRequest) -> ListUsersQm:
+    async def execute(self, request: ListUsersRequest) -> ListUsersQm | ListUsersPageQm:
         logger.info("List users: started.")
 
         current_user = await self._current_user_service.get_current_user()
@@ -54,18 +76,34 @@ class ListUsers:
                 target_role=UserRole.USER,
             ),
         )
-        pagination = OffsetPaginationParams(
-            limit=request.limit,
-            offset=request.offset,
-        )
         sorting = SortingParams(
             field=request.sorting_field,
             order=request.sorting_order,
         )
-        users = await self._user_reader.list_users(
-            pagination=pagination,
-            sorting=sorting,
-        )
+        users: ListUsersQm | ListUsersPageQm
+        if request.paginate_by_cursor or request.cursor is not None:
+            users = await self._user_reader.list_users_page(
+                pagination=self._keyset_pagination(request),
+                sorting=sorting,
+            )
+        else:
+            users = await self._user_reader.list_users(
+                pagination=OffsetPaginationParams(
+                    limit=request.limit,
+                    offset=request.offset,
+                ),
+                sorting=sorting,
+                total_count=request.total_count,
+            )
 
         logger.info("List users: done.")
         return users
+
+    @staticmethod
+    def _keyset_pagination(request: ListUsersRequest) -> KeysetPaginationParams:
+        if request.offset != 0:
+            raise PaginationError("Offset can't be combined with a cursor")
+        after = KeysetCursor.decode(request.cursor, USER_CURSOR_VALUE_TYPES) if request.cursor is not None else None
+        if after is not None and (after.field, after.order) != (request.sorting_field, request.sorting_order):
+            raise PaginationError("Cursor was issued for another sorting")
+        return KeysetPaginationParams(limit=request.limit, after=after)
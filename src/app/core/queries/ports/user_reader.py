@@ -1,18 +1,28 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 from typing import Protocol, TypedDict
+from uuid import UUID
 
 from app.core.queries.models.user import UserQm
+from app.core.queries.query_support.keyset_pagination import KeysetPaginationParams
 from app.core.queries.query_support.offset_pagination import OffsetPaginationParams
 from app.core.queries.query_support.sorting import SortingParams
+from app.core.queries.query_support.total_count import TotalCountMode
 
 
 class ListUsersQm(TypedDict):
     users: list[UserQm]
-    total: int
+    total: int | None
     limit: int
     offset: int
 
 
+class ListUsersPageQm(TypedDict):
+    users: list[UserQm]
+    limit: int
+    next_cursor: str | None
+
+
 class UserReader(Protocol):
     @abstractmethod
     async def list_users(
@@ -20,4 +30,19 @@ class UserReader(Protocol):
         *,
         pagination: OffsetPaginationParams,
         sorting: SortingParams,
-    ) -> ListUsersQm: ...
+        total_count: TotalCountMode,
+    ) -> ListUsersQm:
+        """`total` is None only when `total_count` is `none`."""
+
+    @abstractmethod
+    async def list_users_page(
+        self,
+        *,
+        pagination: KeysetPaginationParams,
+        sorting: SortingParams,
+    ) -> ListUsersPageQm:
+        """Seeks past `pagination.after` instead of skipping rows: every page costs the same."""
+
+    @abstractmethod
+    def stream_users(self, *, after_id: UUID | None) -> AsyncIterator[list[UserQm]]:
+        """All users in ID order, in batches, past `after_id` if given."""
@@ -0,0 +1,73 @@
+import base64
+import binascii
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, ClassVar
+from uuid import UUID
+
+from app.core.queries.query_support.exceptions import PaginationError
+from app.core.queries.query_support.offset_pagination import OffsetPaginationParams
+from app.core.queries.query_support.sorting import SortingOrder
+
+type CursorValue = str | bool | datetime
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class KeysetCursor:
+    """
+    Position after the last row of a page: its sort value and ID, which breaks ties.
+    Carries the sorting it was made for, so it can't be replayed against another one.
+    """
+
+    field: str
+    order: SortingOrder
+    value: CursorValue
+    id: UUID
+
+    def encode(self) -> str:
+        value: Any = {"dt": self.value.isoformat()} if isinstance(self.value, datetime) else self.value
+        raw = json.dumps([self.field, self.order.value, value, str(self.id)], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str, value_types: Mapping[str, type[CursorValue]]) -> "KeysetCursor":
+        """
+        `value_types` maps each sortable field to the type of its values; strings become `str` subtypes such as enums.
+        Datetimes must carry a time zone.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            field, order, value, id_ = json.loads(raw)
+            if isinstance(value, dict):
+                value = datetime.fromisoformat(value["dt"])
+                if value.tzinfo is None:
+                    raise ValueError
+            value_type = value_types.get(field) if isinstance(field, str) else None
+            if value_type is None or not isinstance(id_, str):
+                raise TypeError
+            if isinstance(value, str) and issubclass(value_type, str):
+                value = value_type(value)
+            if not isinstance(value, value_type):
+                raise TypeError
+            return cls(field=field, order=SortingOrder(order), value=value, id=UUID(id_))
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError, KeyError) as e:
+            raise PaginationError("Invalid cursor") from e
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class KeysetPaginationParams:
+    """`after` is None for the first page."""
+
+    MIN_LIMIT: ClassVar[int] = OffsetPaginationParams.MIN_LIMIT
+    MAX_INT32: ClassVar[int] = OffsetPaginationParams.MAX_INT32
+
+    limit: int
+    after: KeysetCursor | None
+
+    def __post_init__(self) -> None:
+        if self.limit < self.MIN_LIMIT:
+            raise PaginationError(f"Limit must be at least {self.MIN_LIMIT}")
+        if self.limit > self.MAX_INT32:
+            raise PaginationError(f"Limit must be at most {self.MAX_INT32}")
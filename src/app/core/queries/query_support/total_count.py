@@ -0,0 +1,16 @@
+from enum import StrEnum
+
+
+class TotalCountMode(StrEnum):
+    """
+    How a paginated listing computes its total:
+    - `exact`: counted on every request.
+    - `cached`: counted, then reused for a while; may lag behind recent writes.
+    - `estimated`: the planner's row estimate, free but approximate.
+    - `none`: omitted.
+    """
+
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATED = "estimated"
+    NONE = "none"
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, status
 from fastapi.security import APIKeyCookie
 from pydantic import BaseModel, ConfigDict
 
+from app.core.commands.exceptions import UserModifiedConcurrentlyError
 from app.core.common.authorization.exceptions import AuthorizationError
 from app.core.common.exceptions import BusinessTypeError
 from app.inbound.http.errors.callbacks import log_info
@@ -42,6 +43,7 @@ def make_change_password_router(*, cookie_name: str) -> APIRouter:
             AuthenticationChangeError: status.HTTP_400_BAD_REQUEST,
             ReAuthenticationError: status.HTTP_403_FORBIDDEN,
             PasswordHasherBusyError: HTTP_503_SERVICE_UNAVAILABLE_RULE,
+            UserModifiedConcurrentlyError: status.HTTP_409_CONFLICT,
         },
         status_code=status.HTTP_204_NO_CONTENT,
         dependencies=[Depends(APIKeyCookie(name=cookie_name))],
@@ -8,9 +8,9 @@ from app.core.common.authorization.exceptions import AuthorizationError
 from app.core.common.exceptions import BusinessTypeError
 from app.inbound.http.errors.callbacks import log_info
 from app.inbound.http.errors.router import make_error_aware_router
-from app.inbound.http.errors.rules import HTTP_503_SERVICE_UNAVAILABLE_RULE
+from app.inbound.http.errors.rules import HTTP_429_TOO_MANY_REQUESTS_RULE, HTTP_503_SERVICE_UNAVAILABLE_RULE
 from app.outbound.adapters.exceptions import PasswordHasherBusyError
-from app.outbound.auth_ctx.exceptions import AlreadyAuthenticatedError, AuthenticationError
+from app.outbound.auth_ctx.exceptions import AlreadyAuthenticatedError, AuthenticationError, LoginThrottledError
 from app.outbound.auth_ctx.handlers.log_in import LogIn, LogInRequest
 from app.outbound.exceptions import StorageError
 
@@ -26,6 +26,7 @@ def make_log_in_router() -> APIRouter:
             AlreadyAuthenticatedError: status.HTTP_403_FORBIDDEN,
             BusinessTypeError: status.HTTP_400_BAD_REQUEST,
             AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            LoginThrottledError: HTTP_429_TOO_MANY_REQUESTS_RULE,
             PasswordHasherBusyError: HTTP_503_SERVICE_UNAVAILABLE_RULE,
         },
         status_code=status.HTTP_204_NO_CONTENT,
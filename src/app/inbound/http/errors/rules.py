@@ -1,3 +1,5 @@
+import math
+from collections.abc import Mapping
 from typing import Final
 
 from fastapi_error_map import Rule, rule, structured
@@ -5,7 +7,20 @@ from starlette import status
 
 SERVICE_UNAVAILABLE_MESSAGE: Final[str] = "Service temporarily unavailable. Please try again later."
 
+
+def retry_after_header(err: Exception) -> Mapping[str, str]:
+    retry_after_s = getattr(err, "retry_after_s", None)
+    if retry_after_s is None:
+        return {}
+    return {"Retry-After": str(max(1, math.ceil(retry_after_s)))}
+
+
 HTTP_503_SERVICE_UNAVAILABLE_RULE: Final[Rule] = rule(
     status=status.HTTP_503_SERVICE_UNAVAILABLE,
     translator=structured(server_message=SERVICE_UNAVAILABLE_MESSAGE)(status.HTTP_503_SERVICE_UNAVAILABLE),
 )
+
+HTTP_429_TOO_MANY_REQUESTS_RULE: Final[Rule] = rule(
+    status=status.HTTP_429_TOO_MANY_REQUESTS,
+    headers=retry_after_header,
+)
@@ -0,0 +1,25 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.outbound.adapters.hasher_scheduler import HASHER_CLIENT_KEY
+
+
+class HasherClientMiddleware:
+    """
+    Tags hasher jobs with the client address for fair queuing.
+    Behind a proxy, run the server with proxy headers enabled so the address is the real one.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        token = HASHER_CLIENT_KEY.set(client[0] if client else None)
+        try:
+            await self._app(scope, receive, send)
+        finally:
+            HASHER_CLIENT_KEY.reset(token)
@@ -4,6 +4,8 @@ from fastapi import APIRouter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.inbound.http.health.checks import db_check
+from app.outbound.adapters.hasher_scheduler import HasherStats, HasherStatsSource
+from app.outbound.auth_ctx.session_cache import AuthSessionCache, AuthSessionCacheStats
 
 
 class InternalServerError(Exception):
@@ -32,6 +34,27 @@ def make_health_router(*, debug_mode: bool) -> APIRouter:
         return "OK"
 
     if debug_mode:
+        # Internal load figures: public ones would help time floods against the hasher or the session cache
+
+        @router.get(
+            "/hasherz/",
+            include_in_schema=False,
+        )
+        @inject
+        async def hasher_stats(
+            source: FromDishka[HasherStatsSource],
+        ) -> HasherStats:
+            return await source.stats()
+
+        @router.get(
+            "/session-cachez/",
+            include_in_schema=False,
+        )
+        @inject
+        async def session_cache_stats(
+            cache: FromDishka[AuthSessionCache],
+        ) -> AuthSessionCacheStats:
+            return cache.stats()
 
         @router.get(
             "/http_error/",
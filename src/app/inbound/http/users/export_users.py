@@ -0,0 +1,117 @@
+import csv
+import io
+from collections.abc import AsyncIterator, Callable
+from enum import StrEnum
+from inspect import getdoc
+from typing import Annotated
+from uuid import UUID
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import to_json
+from starlette import status
+
+from app.core.common.authorization.exceptions import AuthorizationError
+from app.core.queries.export_users import ExportUsers, ExportUsersRequest
+from app.core.queries.models.user import UserQm
+from app.inbound.http.errors.callbacks import log_info
+from app.inbound.http.errors.router import make_error_aware_router
+from app.inbound.http.errors.rules import HTTP_503_SERVICE_UNAVAILABLE_RULE
+from app.outbound.auth_ctx.exceptions import AuthenticationError
+from app.outbound.exceptions import ReaderError, StorageError
+
+CSV_COLUMNS = ("id", "username", "role", "is_active", "created_at", "updated_at")
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class ExportUsersRequestSchema(BaseModel):
+    """
+    Using Pydantic model here is generally unnecessary.
+    It's only implemented to render specific Swagger UI.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    format: Annotated[ExportFormat, Field()] = ExportFormat.NDJSON
+    # ID of the last user received before an interruption
+    after_id: Annotated[UUID | None, Field()] = None
+
+
+def encode_ndjson(users: list[UserQm]) -> bytes:
+    return b"".join(to_json(user) + b"\n" for user in users)
+
+
+def encode_csv(users: list[UserQm]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows(
+        (
+            user.id,
+            user.username,
+            user.role,
+            "true" if user.is_active else "false",
+            user.created_at.isoformat(),
+            user.updated_at.isoformat(),
+        )
+        for user in users
+    )
+    return buffer.getvalue().encode()
+
+
+async def encode_stream(
+    first_batch: list[UserQm],
+    batches: AsyncIterator[list[UserQm]],
+    encode: Callable[[list[UserQm]], bytes],
+    header: bytes,
+) -> AsyncIterator[bytes]:
+    yield header + encode(first_batch)
+    async for batch in batches:
+        yield encode(batch)
+
+
+def make_export_users_router() -> APIRouter:
+    router = make_error_aware_router(on_error=log_info)
+
+    @router.get(
+        "/export",
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            StorageError: HTTP_503_SERVICE_UNAVAILABLE_RULE,
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+            ReaderError: HTTP_503_SERVICE_UNAVAILABLE_RULE,
+        },
+        status_code=status.HTTP_200_OK,
+        description=getdoc(ExportUsers),
+        response_class=StreamingResponse,
+    )
+    @inject
+    async def export_users(
+        request_schema: Annotated[ExportUsersRequestSchema, Depends()],
+        interactor: FromDishka[ExportUsers],
+    ) -> StreamingResponse:
+        request = ExportUsersRequest(after_id=request_schema.after_id)
+        batches = await interactor.execute(request)
+        # Fetched before the response starts, so a failing query still gets its error status.
+        # Later failures can only cut the stream short; the client resumes after the last ID it got.
+        first_batch: list[UserQm] = await anext(batches, [])
+        if request_schema.format == ExportFormat.CSV:
+            header = (",".join(CSV_COLUMNS) + "\n").encode()
+            body = encode_stream(first_batch, batches, encode_csv, header)
+            media_type = "text/csv"
+        else:
+            body = encode_stream(first_batch, batches, encode_ndjson, b"")
+            media_type = "application/x-ndjson"
+        return StreamingResponse(
+            body,
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="users.{request_schema.format}"'},
+        )
+
+    return router
@@ -9,10 +9,11 @@ from starlette import status
 
 from app.core.common.authorization.exceptions import AuthorizationError
 from app.core.queries.list_users import ListUsers, ListUsersRequest, UserSortingField
-from app.core.queries.ports.user_reader import ListUsersQm
+from app.core.queries.ports.user_reader import ListUsersPageQm, ListUsersQm
 from app.core.queries.query_support.exceptions import PaginationError
 from app.core.queries.query_support.offset_pagination import OffsetPaginationParams
 from app.core.queries.query_support.sorting import SortingOrder
+from app.core.queries.query_support.total_count import TotalCountMode
 from app.inbound.http.errors.callbacks import log_info
 from app.inbound.http.errors.router import make_error_aware_router
 from app.inbound.http.errors.rules import HTTP_503_SERVICE_UNAVAILABLE_RULE
@@ -32,6 +33,10 @@ class ListUsersRequestSchema(BaseModel):
     offset: Annotated[int, Field(ge=0, le=OffsetPaginationParams.MAX_INT32)] = 0
     sorting_field: Annotated[UserSortingField, Field()] = UserSortingField.UPDATED_AT
     sorting_order: Annotated[SortingOrder, Field()] = SortingOrder.DESC
+    total_count: Annotated[TotalCountMode, Field()] = TotalCountMode.EXACT
+    # Cursor mode has no total; pass `next_cursor` back as `cursor` for the next page
+    paginate_by_cursor: Annotated[bool, Field()] = False
+    cursor: Annotated[str | None, Field(max_length=1024)] = None
 
 
 def make_list_users_router() -> APIRouter:
@@ -53,12 +58,15 @@ def make_list_users_router() -> APIRouter:
     async def list_users(
         request_schema: Annotated[ListUsersRequestSchema, Depends()],
         interactor: FromDishka[ListUsers],
-    ) -> ListUsersQm:
+    ) -> ListUsersQm | ListUsersPageQm:
         request = ListUsersRequest(
             limit=request_schema.limit,
             offset=request_schema.offset,
             sorting_field=request_schema.sorting_field,
             sorting_order=request_schema.sorting_order,
+            total_count=request_schema.total_count,
+            paginate_by_cursor=request_schema.paginate_by_cursor,
+            cursor=request_schema.cursor,
         )
         return await interactor.execute(request)
 
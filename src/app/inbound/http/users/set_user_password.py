@@ -8,7 +8,7 @@ from fastapi import APIRouter, Path
 from pydantic import BaseModel, ConfigDict
 from starlette import status
 
-from app.core.commands.exceptions import UserNotFoundError
+from app.core.commands.exceptions import UserModifiedConcurrentlyError, UserNotFoundError
 from app.core.commands.set_user_password import SetUserPassword, SetUserPasswordRequest
 from app.core.common.authorization.exceptions import AuthorizationError
 from app.core.common.exceptions import BusinessTypeError
@@ -43,6 +43,7 @@ def make_set_user_password_router() -> APIRouter:
             BusinessTypeError: status.HTTP_400_BAD_REQUEST,
             UserNotFoundError: status.HTTP_404_NOT_FOUND,
             PasswordHasherBusyError: HTTP_503_SERVICE_UNAVAILABLE_RULE,
+            UserModifiedConcurrentlyError: status.HTTP_409_CONFLICT,
         },
         status_code=status.HTTP_204_NO_CONTENT,
         description=getdoc(SetUserPassword),
@@ -7,6 +7,7 @@ from app.main.config.settings import (
     AppSettings,
     CookieSettings,
     JwtSettings,
+    LoginThrottleSettings,
     PasswordHasherSettings,
     PostgresSettings,
     SessionSettings,
@@ -50,6 +51,10 @@ class SessionEnvConfig(BaseSettings, SessionSettings):
     model_config = _DEFAULT_CONFIG_DICT | SettingsConfigDict(env_prefix="SESSION_")
 
 
+class LoginThrottleEnvConfig(BaseSettings, LoginThrottleSettings):
+    model_config = _DEFAULT_CONFIG_DICT | SettingsConfigDict(env_prefix="LOGIN_THROTTLE_")
+
+
 class CookieEnvConfig(BaseSettings, CookieSettings):
     model_config = _DEFAULT_CONFIG_DICT | SettingsConfigDict(env_prefix="COOKIE_")
 
@@ -78,5 +83,9 @@ def load_session_settings() -> SessionSettings:
     return _load_settings(SessionEnvConfig)
 
 
+def load_login_throttle_settings() -> LoginThrottleSettings:
+    return _load_settings(LoginThrottleEnvConfig)
+
+
 def load_cookie_settings() -> CookieSettings:
     return _load_settings(CookieEnvConfig)
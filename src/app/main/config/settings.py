@@ -1,4 +1,5 @@
 from datetime import timedelta
+from pathlib import Path
 from typing import Literal
 
 from pydantic import BaseModel, Field, PostgresDsn
@@ -41,18 +42,59 @@ class SqlaSettings(BaseModel):
     ECHO_POOL: bool = False
     POOL_SIZE: int = 15
     MAX_OVERFLOW: int = 0
+    # Primary and auth sessions of a request share one pooled connection
+    SHARED_CONNECTION: bool = False
+    # How long a counted listing total is reused with `total_count=cached`; 0 disables the cache
+    COUNT_CACHE_TTL_S: float = Field(ge=0, default=30.0)
+    # User listings are reused until a user changes here, and for at most the TTL (changes on other nodes);
+    # 0 for either disables the cache
+    LIST_CACHE_TTL_S: float = Field(ge=0, default=5.0)
+    LIST_CACHE_MAX_ENTRIES: int = Field(ge=0, default=1024)
 
 
 class PasswordHasherSettings(BaseModel):
     # https://www.ietf.org/archive/id/draft-ietf-kitten-password-storage-04.html#section-4.2
     PEPPER: str = Field(min_length=32)
 
+    # Algorithm for new hashes; stored hashes of any supported algorithm still verify
+    # and migrate to it on their next log-in
+    ALGORITHM: Literal["bcrypt", "argon2id", "scrypt"] = "bcrypt"
+
     # https://cheatsheetseries.owasp.org/cheatsheets/Password_Storage_Cheat_Sheet.html#introduction
     WORK_FACTOR: int = 11
-    # CPU-bound & GIL released: per-worker ≈ max(1, floor(effective vCPUs / workers))
+    # Optional startup calibration of the bcrypt cost: highest cost whose p95 hash time fits
+    # the budget, with WORK_FACTOR as the floor; stored hashes below the floor or more than
+    # one step off follow on their next log-in, so workers calibrated a step apart don't flip-flop
+    CALIBRATION_BUDGET_MS: float | None = None
+
+    # https://cheatsheetseries.owasp.org/cheatsheets/Password_Storage_Cheat_Sheet.html#argon2id
+    # Memory per hash multiplies by concurrent hashes (MAX_THREADS)
+    ARGON2_TIME_COST: int = Field(ge=1, default=2)
+    ARGON2_MEMORY_COST_KIB: int = Field(ge=8, default=19456)
+    ARGON2_PARALLELISM: int = Field(ge=1, default=1)
+
+    # https://cheatsheetseries.owasp.org/cheatsheets/Password_Storage_Cheat_Sheet.html#scrypt
+    # Memory per hash is 128 * 2^LOG2_N * R bytes
+    SCRYPT_LOG2_N: int = Field(ge=1, default=17)
+    SCRYPT_R: int = Field(ge=1, default=8)
+    SCRYPT_P: int = Field(ge=1, default=1)
+    # CPU-bound & GIL released: per-worker ≈ max(1, floor(effective vCPUs / workers));
+    # upper bound for the adaptive limit, which backs off when hash latency rises
     MAX_THREADS: int = 8
-    # Fail-fast cap: max semaphore wait before timeout (start ~1 second, tune to peak)
+    MIN_THREADS: int = Field(ge=1, default=1)
+    # Latency growth over the long-term average tolerated before the limit shrinks
+    LATENCY_TOLERANCE: float = Field(ge=1, default=1.5)
+    # Fail-fast cap: max queue wait before rejection (start ~1 second, tune to peak);
+    # requests whose estimated wait exceeds it are rejected without queuing
     SEMAPHORE_WAIT_TIMEOUT_S: float = 1.0
+    # Outdated hashes are upgraded in the background after log-in, only on idle hasher capacity;
+    # beyond this many queued upgrades, further ones wait for the user's next log-in
+    REHASH_MAX_PENDING: int = Field(ge=1, default=1000)
+    # Optional host-wide hasher daemon (`python -m app.main.hasher_daemon`) shared by all workers;
+    # when set, workers delegate hashing to it and the settings above apply to the daemon
+    DAEMON_SOCKET_PATH: Path | None = None
+    # Client-side cap on a daemon round trip: queue wait plus the hash itself
+    DAEMON_TIMEOUT_S: float = 5.0
 
 
 class JwtSettings(BaseModel):
@@ -60,16 +102,73 @@ class JwtSettings(BaseModel):
     SECRET: str = Field(min_length=32)
 
     ALGORITHM: JwtAlgorithm = "HS256"
+    # Per-process memo of verified tokens until their exp; only valid tokens are kept (0 disables)
+    VERIFY_CACHE_MAX_ENTRIES: int = Field(ge=0, default=10_000)
 
 
 class SessionSettings(BaseModel):
     TTL_MIN: int = Field(ge=1, default=5)
     REFRESH_THRESHOLD_RATIO: float = Field(gt=0, lt=1, default=0.2)
+    # Log-in beyond the cap evicts the user's least recently refreshed sessions
+    MAX_PER_USER: int = Field(ge=1, default=10)
+    # Session backend: Postgres, an in-process sharded dict, or a Redis-protocol key-value server (KV_*).
+    # "memory" is for a single worker process only: every process keeps its own sessions and forgets them
+    # on restart, so with several workers or nodes a session works only on the process that created it.
+    # Revocations reach stateless nodes only with "sqla"
+    STORE: Literal["sqla", "memory", "kv"] = "sqla"
+    MEMORY_STORE_SHARDS: int = Field(ge=1, default=64)
+    KV_HOST: str = "localhost"
+    KV_PORT: int = 6379
+    KV_POOL_SIZE: int = Field(ge=1, default=16)
+    KV_TIMEOUT_S: float = Field(gt=0, default=1.0)
+    # Expiration bumps are written behind in batches; unflushed ones are lost on a crash
+    REFRESH_FLUSH_INTERVAL_S: float = Field(gt=0, default=1.0)
+    # Background deletion of expired sessions, jittered per worker
+    REAPER_INTERVAL_S: float = Field(gt=0, default=300.0)
+    REAPER_BATCH_SIZE: int = Field(ge=1, default=1000)
+    REAPER_BATCH_PAUSE_S: float = Field(ge=0, default=0.1)
+    # Opt-in per-process cache of validated sessions (0 disables);
+    # a revocation or log-out on another node is honored here only after CACHE_TTL_S
+    CACHE_MAX_ENTRIES: int = Field(ge=1, default=10_000)
+    CACHE_TTL_S: float = Field(ge=0, default=0.0)
+    # Stateless mode: tokens carry the user ID and skip the session lookup for STATELESS_TOKEN_TTL_S,
+    # unless listed in the revocation set, which every node refreshes each REVOCATION_POLL_INTERVAL_S.
+    # The user itself is still loaded by ID on every request, so a request keeps one round trip:
+    # a primary-key read instead of the session joined with its user, and no session refresh writes
+    STATELESS: bool = False
+    STATELESS_TOKEN_TTL_S: int = Field(ge=1, default=60)
+    REVOCATION_POLL_INTERVAL_S: float = Field(gt=0, default=2.0)
+    REVOCATION_FILTER_CAPACITY: int = Field(ge=1, default=100_000)
 
     @property
     def ttl(self) -> timedelta:
         return timedelta(minutes=self.TTL_MIN)
 
+    @property
+    def stateless_ttl(self) -> timedelta | None:
+        return timedelta(seconds=self.STATELESS_TOKEN_TTL_S) if self.STATELESS else None
+
+
+class LoginThrottleSettings(BaseModel):
+    # Token buckets per username and client pair, per username alone (ACCOUNT_*) and per client address:
+    # burst, then steady attempts per minute. The account's are looser, so its owner can still log in
+    # while others guess its password from many addresses.
+    # Shared through the session key-value server when SESSION_STORE is "kv", otherwise kept per process
+    USERNAME_BURST: int = Field(ge=1, default=5)
+    USERNAME_REFILL_PER_MIN: float = Field(gt=0, default=6)
+    ACCOUNT_BURST: int = Field(ge=1, default=30)
+    ACCOUNT_REFILL_PER_MIN: float = Field(gt=0, default=20)
+    CLIENT_BURST: int = Field(ge=1, default=100)
+    CLIENT_REFILL_PER_MIN: float = Field(gt=0, default=100)
+    # Exponential backoff once a key's failures exceed *_FREE_FAILURES; forgotten after BACKOFF_MAX_S
+    USERNAME_FREE_FAILURES: int = Field(ge=1, default=5)
+    ACCOUNT_FREE_FAILURES: int = Field(ge=1, default=20)
+    CLIENT_FREE_FAILURES: int = Field(ge=1, default=50)
+    BACKOFF_BASE_S: float = Field(gt=0, default=1.0)
+    BACKOFF_MAX_S: float = Field(gt=0, default=900.0)
+    # LRU bound of the per-process store
+    MAX_KEYS: int = Field(ge=1, default=100_000)
+
 
 class CookieSettings(BaseModel):
     NAME: str = "auth_token"
@@ -0,0 +1,48 @@
+"""
+Host-wide hasher daemon: run one per machine and point every worker at it
+with `PASSWORD_DAEMON_SOCKET_PATH`.
+
+    python -m app.main.hasher_daemon
+"""
+
+import asyncio
+
+from dishka import make_async_container
+
+from app.main.config.loader import load_app_settings, load_password_hasher_settings
+from app.main.config.settings import PasswordHasherSettings
+from app.main.ioc.outbound import HasherThreadPoolProvider, make_password_hash_engines
+from app.main.setup import setup_logging
+from app.outbound.adapters.hasher_daemon import HasherDaemon
+from app.outbound.adapters.hasher_scheduler import HasherScheduler
+from app.outbound.adapters.peppered_password_hasher import HasherThreadPoolExecutor, PepperedPasswordHasher
+
+
+async def serve(settings: PasswordHasherSettings) -> None:
+    if settings.DAEMON_SOCKET_PATH is None:
+        raise SystemExit("PASSWORD_DAEMON_SOCKET_PATH is not set")
+
+    container = make_async_container(
+        HasherThreadPoolProvider(),
+        context={PasswordHasherSettings: settings},
+    )
+    try:
+        executor = await container.get(HasherThreadPoolExecutor)
+        hasher = PepperedPasswordHasher(
+            pepper=settings.PEPPER.encode(),
+            engines=await make_password_hash_engines(settings, executor),
+            executor=executor,
+            scheduler=await container.get(HasherScheduler),
+        )
+        await HasherDaemon(hasher).serve(settings.DAEMON_SOCKET_PATH)
+    finally:
+        await container.close()
+
+
+def main() -> None:
+    setup_logging(level=load_app_settings().LOGGING_LEVEL)
+    asyncio.run(serve(load_password_hasher_settings()))
+
+
+if __name__ == "__main__":
+    main()
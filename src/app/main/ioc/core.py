@@ -1,4 +1,7 @@
-from dishka import Provider, Scope, provide
+from pathlib import Path
+from typing import cast
+
+from dishka import AnyOf, Marker, Provider, Scope, activate, provide
 
 from app.core.commands.activate_user import ActivateUser
 from app.core.commands.create_user import CreateUser
@@ -7,30 +10,40 @@ from app.core.commands.grant_admin import GrantAdmin
 from app.core.commands.ports.flusher import Flusher
 from app.core.commands.ports.transaction_manager import TransactionManager
 from app.core.commands.ports.user_tx_storage import UserTxStorage
+from app.core.commands.ports.users_version import UsersVersion
 from app.core.commands.ports.utc_timer import UtcTimer
 from app.core.commands.revoke_admin import RevokeAdmin
 from app.core.commands.set_user_password import SetUserPassword
 from app.core.common.authorization.current_user_service import CurrentUserService
-from app.core.common.authorization.ports import AuthzUserFinder
 from app.core.common.ports.access_revoker import AccessRevoker
 from app.core.common.ports.identity_provider import IdentityProvider
 from app.core.common.ports.password_hasher import PasswordHasher
 from app.core.common.services.user import UserService
+from app.core.queries.export_users import ExportUsers
 from app.core.queries.list_users import ListUsers
 from app.core.queries.ports.user_reader import UserReader
-from app.main.config.settings import PasswordHasherSettings
+from app.main.config.settings import PasswordHasherSettings, SqlaSettings
 from app.outbound.adapters.auth_session_access_revoker import AuthSessionAccessRevoker
 from app.outbound.adapters.auth_session_identity_provider import AuthSessionIdentityProvider
-from app.outbound.adapters.bcrypt_password_hasher import (
-    BcryptPasswordHasher,
-    HasherSemaphore,
+from app.outbound.adapters.caching_user_reader import CachingUserReader
+from app.outbound.adapters.hasher_scheduler import HasherScheduler, HasherStatsSource
+from app.outbound.adapters.peppered_password_hasher import (
     HasherThreadPoolExecutor,
+    PasswordHashEngines,
+    PepperedPasswordHasher,
 )
+from app.outbound.adapters.row_count_cache import RowCountCache
+from app.outbound.adapters.socket_password_hasher import SocketPasswordHasher
 from app.outbound.adapters.sqla_flusher import SqlaFlusher
 from app.outbound.adapters.sqla_transaction_manager import SqlaTransactionManager
 from app.outbound.adapters.sqla_user_reader import SqlaUserReader
 from app.outbound.adapters.sqla_user_tx_storage import SqlaUserTxStorage
+from app.outbound.adapters.sqla_users_version import SqlaUsersVersion
 from app.outbound.adapters.system_utc_timer import SystemUtcTimer
+from app.outbound.adapters.user_list_cache import UserListCache
+
+# Active when workers delegate hashing to the host-wide daemon; only then is no in-process hasher built
+HASHER_DAEMON = Marker("hasher_daemon")
 
 
 class CoreProvider(Provider):
@@ -41,23 +54,35 @@ class CoreProvider(Provider):
     current_user_service = provide(CurrentUserService)
 
     # Common Ports
-    @provide(scope=Scope.APP)
+    @activate(HASHER_DAEMON)
+    def is_hasher_daemon(self, settings: PasswordHasherSettings) -> bool:
+        return settings.DAEMON_SOCKET_PATH is not None
+
+    @provide(scope=Scope.APP, provides=AnyOf[PasswordHasher, HasherStatsSource])
     def provide_password_hasher(
         self,
         settings: PasswordHasherSettings,
+        engines: PasswordHashEngines,
         executor: HasherThreadPoolExecutor,
-        semaphore: HasherSemaphore,
-    ) -> PasswordHasher:
-        return BcryptPasswordHasher(
+        scheduler: HasherScheduler,
+    ) -> PepperedPasswordHasher:
+        return PepperedPasswordHasher(
             pepper=settings.PEPPER.encode(),
-            work_factor=settings.WORK_FACTOR,
+            engines=engines,
             executor=executor,
-            semaphore=semaphore,
-            semaphore_wait_timeout_s=settings.SEMAPHORE_WAIT_TIMEOUT_S,
+            scheduler=scheduler,
+        )
+
+    @provide(scope=Scope.APP, provides=AnyOf[PasswordHasher, HasherStatsSource], when=HASHER_DAEMON)
+    def provide_socket_password_hasher(self, settings: PasswordHasherSettings) -> SocketPasswordHasher:
+        # Guaranteed by the marker
+        socket_path = cast(Path, settings.DAEMON_SOCKET_PATH)
+        return SocketPasswordHasher(
+            socket_path=socket_path,
+            timeout_s=settings.DAEMON_TIMEOUT_S,
         )
 
     identity_provider = provide(AuthSessionIdentityProvider, provides=IdentityProvider)
-    authz_user_finder = provide(SqlaUserTxStorage, provides=AuthzUserFinder)
     access_revoker = provide(AuthSessionAccessRevoker, provides=AccessRevoker)
 
     # Commands Ports
@@ -75,7 +100,29 @@ class CoreProvider(Provider):
     deactivate_user = provide(DeactivateUser)
 
     # Query Ports
-    user_reader = provide(SqlaUserReader, provides=UserReader)
+    @provide(scope=Scope.APP)
+    def provide_row_count_cache(self, settings: SqlaSettings) -> RowCountCache:
+        return RowCountCache(ttl_s=settings.COUNT_CACHE_TTL_S)
+
+    @provide(scope=Scope.APP)
+    def provide_user_list_cache(self, settings: SqlaSettings) -> UserListCache:
+        return UserListCache(
+            max_entries=settings.LIST_CACHE_MAX_ENTRIES,
+            ttl_s=settings.LIST_CACHE_TTL_S,
+        )
+
+    sqla_user_reader = provide(SqlaUserReader)
+    users_version = provide(SqlaUsersVersion, provides=AnyOf[SqlaUsersVersion, UsersVersion])
+
+    @provide
+    def provide_user_reader(
+        self,
+        reader: SqlaUserReader,
+        cache: UserListCache,
+        version: SqlaUsersVersion,
+    ) -> UserReader:
+        return CachingUserReader(reader, cache, version)
 
     # Queries
     list_users = provide(ListUsers)
+    export_users = provide(ExportUsers)
@@ -4,34 +4,105 @@ from collections.abc import AsyncIterator, Iterator
 from concurrent.futures import ThreadPoolExecutor
 from typing import cast
 
-from dishka import Provider, Scope, from_context, provide
+from dishka import Marker, Provider, Scope, activate, from_context, provide
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.util import greenlet_spawn
 from starlette.requests import Request
 
+from app.core.common.services.user import UserService
+from app.core.common.value_objects.raw_password import RawPassword
 from app.main.config.settings import (
     CookieSettings,
     JwtSettings,
+    LoginThrottleSettings,
     PasswordHasherSettings,
     PostgresSettings,
     SessionSettings,
     SqlaSettings,
 )
-from app.outbound.adapters.bcrypt_password_hasher import HasherSemaphore, HasherThreadPoolExecutor
+from app.outbound.adapters.gradient_limit import GradientLimit
+from app.outbound.adapters.hasher_scheduler import HasherScheduler
+from app.outbound.adapters.password_hash_engines import Argon2idEngine, BcryptEngine, PasswordHashEngine, ScryptEngine
+from app.outbound.adapters.peppered_password_hasher import (
+    HasherThreadPoolExecutor,
+    PasswordHashEngines,
+    PepperedPasswordHasher,
+)
 from app.outbound.auth_ctx.cookie_manager import CookieManager, CookieName
 from app.outbound.auth_ctx.handlers.change_password import ChangePassword
 from app.outbound.auth_ctx.handlers.log_in import LogIn
 from app.outbound.auth_ctx.handlers.log_out import LogOut
 from app.outbound.auth_ctx.handlers.sign_up import SignUp
 from app.outbound.auth_ctx.jwt_processor import JwtProcessor
-from app.outbound.auth_ctx.service import AuthService
+from app.outbound.auth_ctx.kv_session_store import KeyValueAuthSessionStore, KeyValueClient
+from app.outbound.auth_ctx.login_throttle import (
+    ClientAddress,
+    InMemoryLoginThrottleStore,
+    KeyValueLoginThrottleStore,
+    LoginThrottle,
+    LoginThrottleStore,
+    ThrottlePolicy,
+)
+from app.outbound.auth_ctx.memory_kv_client import ShardedMemoryKeyValueClient
+from app.outbound.auth_ctx.redis_kv_client import RedisKeyValueClient
+from app.outbound.auth_ctx.revocation_set import RevocationSet
+from app.outbound.auth_ctx.service import AuthService, MaxSessionsPerUser
+from app.outbound.auth_ctx.session_cache import AuthSessionCache
+from app.outbound.auth_ctx.session_store import AuthSessionStore
+from app.outbound.auth_ctx.sqla_password_rehasher import PasswordRehasher
+from app.outbound.auth_ctx.sqla_refresh_writer import AuthSessionRefreshWriter
+from app.outbound.auth_ctx.sqla_revocation_feed import AuthSessionRevocationFeed
+from app.outbound.auth_ctx.sqla_session_reaper import ExpiredSessionReaper
+from app.outbound.auth_ctx.sqla_session_store import SqlaAuthSessionStore
 from app.outbound.auth_ctx.sqla_transaction_manager import AuthSqlaTransactionManager
 from app.outbound.auth_ctx.sqla_tx_storage import AuthSessionSqlaTxStorage
 from app.outbound.auth_ctx.sqla_user_tx_storage import AuthSqlaUserTxStorage
 from app.outbound.auth_ctx.types_ import AuthAsyncSession
 from app.outbound.auth_ctx.utc_timer import AuthSessionUtcTimer
+from app.outbound.persistence_sqla.request_connection import RequestConnection, RequestConnectionSession
 
 logger = logging.getLogger(__name__)
 
+# Active for the matching `SESSION_STORE`; only then is a key-value client built
+MEMORY_SESSION_STORE = Marker("memory_session_store")
+KV_SESSION_STORE = Marker("kv_session_store")
+
+
+async def make_password_hash_engines(
+    settings: PasswordHasherSettings,
+    executor: HasherThreadPoolExecutor,
+) -> PasswordHashEngines:
+    """Primary engine first; the others remain for verifying and migrating stored hashes."""
+    work_factor = settings.WORK_FACTOR
+    min_work_factor = None
+    if settings.ALGORITHM == "bcrypt" and settings.CALIBRATION_BUDGET_MS is not None:
+        loop = asyncio.get_running_loop()
+        work_factor = await loop.run_in_executor(
+            executor,
+            BcryptEngine.calibrate_work_factor,
+            PepperedPasswordHasher.add_pepper(RawPassword("calibration-probe"), settings.PEPPER.encode()),
+            settings.CALIBRATION_BUDGET_MS / 1000,
+            settings.WORK_FACTOR,
+        )
+        min_work_factor = settings.WORK_FACTOR
+        logger.info("Hasher work factor calibrated to %d.", work_factor)
+
+    engines: dict[str, PasswordHashEngine] = {
+        "bcrypt": BcryptEngine(work_factor, min_work_factor=min_work_factor),
+        "argon2id": Argon2idEngine(
+            time_cost=settings.ARGON2_TIME_COST,
+            memory_cost_kib=settings.ARGON2_MEMORY_COST_KIB,
+            parallelism=settings.ARGON2_PARALLELISM,
+        ),
+        "scrypt": ScryptEngine(
+            log2_n=settings.SCRYPT_LOG2_N,
+            r=settings.SCRYPT_R,
+            p=settings.SCRYPT_P,
+        ),
+    }
+    primary = engines.pop(settings.ALGORITHM)
+    return PasswordHashEngines((primary, *engines.values()))
+
 
 class HasherThreadPoolProvider(Provider):
     scope = Scope.APP
@@ -44,7 +115,7 @@ class HasherThreadPoolProvider(Provider):
         executor = HasherThreadPoolExecutor(
             ThreadPoolExecutor(
                 max_workers=settings.MAX_THREADS,
-                thread_name_prefix="bcrypt",
+                thread_name_prefix="hasher",
             )
         )
         yield executor
@@ -53,8 +124,24 @@ class HasherThreadPoolProvider(Provider):
         logger.debug("Hasher threadpool executor is disposed.")
 
     @provide
-    def provide_hasher_semaphore(self, settings: PasswordHasherSettings) -> HasherSemaphore:
-        return HasherSemaphore(asyncio.Semaphore(settings.MAX_THREADS))
+    async def provide_password_hash_engines(
+        self,
+        settings: PasswordHasherSettings,
+        executor: HasherThreadPoolExecutor,
+    ) -> PasswordHashEngines:
+        return await make_password_hash_engines(settings, executor)
+
+    @provide
+    def provide_hasher_scheduler(self, settings: PasswordHasherSettings) -> HasherScheduler:
+        return HasherScheduler(
+            limit=GradientLimit(
+                initial_limit=settings.MAX_THREADS,
+                min_limit=settings.MIN_THREADS,
+                max_limit=settings.MAX_THREADS,
+                tolerance=settings.LATENCY_TOLERANCE,
+            ),
+            wait_timeout_s=settings.SEMAPHORE_WAIT_TIMEOUT_S,
+        )
 
 
 class PersistenceSqlaProvider(Provider):
@@ -93,14 +180,38 @@ class PersistenceSqlaProvider(Provider):
         logger.debug("Async session maker initialized.")
         return async_session_factory
 
+    @provide(scope=Scope.REQUEST)
+    async def provide_request_connection(
+        self,
+        engine: AsyncEngine,
+    ) -> AsyncIterator[RequestConnection]:
+        request_connection = RequestConnection(engine.sync_engine)
+        yield request_connection
+        await greenlet_spawn(request_connection.close)
+
+    @staticmethod
+    def _open_session(
+        async_session_factory: async_sessionmaker[AsyncSession],
+        sqla: SqlaSettings,
+        request_connection: RequestConnection,
+    ) -> AsyncSession:
+        if not sqla.SHARED_CONNECTION:
+            return async_session_factory()
+        return async_session_factory(
+            sync_session_class=RequestConnectionSession,
+            request_connection=request_connection,
+        )
+
     @provide(scope=Scope.REQUEST)
     async def provide_primary_async_session(
         self,
         async_session_factory: async_sessionmaker[AsyncSession],
+        sqla: SqlaSettings,
+        request_connection: RequestConnection,
     ) -> AsyncIterator[AsyncSession]:
         """Provides UoW (AsyncSession) for the primary context"""
         logger.debug("Starting primary async session...")
-        async with async_session_factory() as session:
+        async with self._open_session(async_session_factory, sqla, request_connection) as session:
             logger.debug("Primary async session started.")
             yield session
             logger.debug("Closing primary async session...")
@@ -110,10 +221,12 @@ class PersistenceSqlaProvider(Provider):
     async def provide_auth_async_session(
         self,
         async_session_factory: async_sessionmaker[AsyncSession],
+        sqla: SqlaSettings,
+        request_connection: RequestConnection,
     ) -> AsyncIterator[AuthAsyncSession]:
         """Provides UoW (AsyncSession) for the auth context."""
         logger.debug("Starting auth async session...")
-        async with async_session_factory() as session:
+        async with self._open_session(async_session_factory, sqla, request_connection) as session:
             logger.debug("Auth async session started.")
             yield cast(AuthAsyncSession, session)
             logger.debug("Closing auth async session...")
@@ -134,10 +247,113 @@ class AuthProvider(Provider):
         return AuthSessionUtcTimer(
             ttl=settings.ttl,
             refresh_threshold_ratio=settings.REFRESH_THRESHOLD_RATIO,
+            stateless_ttl=settings.stateless_ttl,
+        )
+
+    @provide(scope=Scope.APP)
+    def provide_refresh_writer(
+        self,
+        settings: SessionSettings,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> AuthSessionRefreshWriter:
+        return AuthSessionRefreshWriter(
+            session_factory=session_factory,
+            flush_interval_s=settings.REFRESH_FLUSH_INTERVAL_S,
+        )
+
+    @provide(scope=Scope.APP)
+    def provide_password_rehasher(
+        self,
+        settings: PasswordHasherSettings,
+        session_factory: async_sessionmaker[AsyncSession],
+        user_service: UserService,
+        utc_timer: AuthSessionUtcTimer,
+    ) -> PasswordRehasher:
+        return PasswordRehasher(
+            session_factory=session_factory,
+            user_service=user_service,
+            utc_timer=utc_timer,
+            max_pending=settings.REHASH_MAX_PENDING,
+        )
+
+    @provide(scope=Scope.APP)
+    def provide_session_reaper(
+        self,
+        settings: SessionSettings,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> ExpiredSessionReaper:
+        return ExpiredSessionReaper(
+            session_factory=session_factory,
+            batch_size=settings.REAPER_BATCH_SIZE,
+            interval_s=settings.REAPER_INTERVAL_S,
+            batch_pause_s=settings.REAPER_BATCH_PAUSE_S,
         )
 
+    @provide(scope=Scope.APP)
+    def provide_revocation_set(self, settings: SessionSettings) -> RevocationSet:
+        return RevocationSet(capacity=settings.REVOCATION_FILTER_CAPACITY)
+
+    @provide(scope=Scope.APP)
+    def provide_revocation_feed(
+        self,
+        settings: SessionSettings,
+        session_factory: async_sessionmaker[AsyncSession],
+        revocations: RevocationSet,
+    ) -> AuthSessionRevocationFeed:
+        return AuthSessionRevocationFeed(
+            session_factory=session_factory,
+            revocations=revocations,
+            poll_interval_s=settings.REVOCATION_POLL_INTERVAL_S,
+        )
+
+    @provide(scope=Scope.APP)
+    def provide_auth_session_cache(
+        self,
+        settings: SessionSettings,
+    ) -> AuthSessionCache:
+        return AuthSessionCache(
+            max_entries=settings.CACHE_MAX_ENTRIES,
+            ttl_s=settings.CACHE_TTL_S,
+        )
+
+    @provide(scope=Scope.APP)
+    def provide_max_sessions_per_user(self, settings: SessionSettings) -> MaxSessionsPerUser:
+        return MaxSessionsPerUser(settings.MAX_PER_USER)
+
     auth_session_tx_storage = provide(AuthSessionSqlaTxStorage)
     auth_tx_manager = provide(AuthSqlaTransactionManager)
+    sqla_auth_session_store = provide(SqlaAuthSessionStore, provides=AuthSessionStore)
+
+    @activate(MEMORY_SESSION_STORE)
+    def is_memory_session_store(self, settings: SessionSettings) -> bool:
+        return settings.STORE == "memory"
+
+    @activate(KV_SESSION_STORE)
+    def is_kv_session_store(self, settings: SessionSettings) -> bool:
+        return settings.STORE == "kv"
+
+    @provide(scope=Scope.APP, when=MEMORY_SESSION_STORE)
+    def provide_memory_key_value_client(self, settings: SessionSettings) -> KeyValueClient:
+        return ShardedMemoryKeyValueClient(shard_count=settings.MEMORY_STORE_SHARDS)
+
+    @provide(scope=Scope.APP, when=KV_SESSION_STORE)
+    async def provide_redis_key_value_client(self, settings: SessionSettings) -> AsyncIterator[KeyValueClient]:
+        client = RedisKeyValueClient(
+            host=settings.KV_HOST,
+            port=settings.KV_PORT,
+            pool_size=settings.KV_POOL_SIZE,
+            timeout_s=settings.KV_TIMEOUT_S,
+        )
+        yield client
+        await client.close()
+
+    @provide(when=MEMORY_SESSION_STORE | KV_SESSION_STORE)
+    def provide_key_value_auth_session_store(
+        self,
+        key_value_client: KeyValueClient,
+        user_tx_storage: AuthSqlaUserTxStorage,
+    ) -> AuthSessionStore:
+        return KeyValueAuthSessionStore(key_value_client, user_tx_storage)
 
     @provide(scope=Scope.APP)
     def provide_jwt_processor(
@@ -147,6 +363,7 @@ class AuthProvider(Provider):
         return JwtProcessor(
             secret=settings.SECRET,
             algorithm=settings.ALGORITHM,
+            cache_max_entries=settings.VERIFY_CACHE_MAX_ENTRIES,
         )
 
     @provide(scope=Scope.APP)
@@ -155,6 +372,48 @@ class AuthProvider(Provider):
 
     cookie_manager = provide(CookieManager)
 
+    @provide(scope=Scope.APP)
+    def provide_login_throttle_store(self, settings: LoginThrottleSettings) -> LoginThrottleStore:
+        return InMemoryLoginThrottleStore(max_keys=settings.MAX_KEYS)
+
+    shared_login_throttle_store = provide(
+        KeyValueLoginThrottleStore,
+        provides=LoginThrottleStore,
+        scope=Scope.APP,
+        when=KV_SESSION_STORE,
+    )
+
+    @provide(scope=Scope.APP)
+    def provide_login_throttle(
+        self,
+        settings: LoginThrottleSettings,
+        store: LoginThrottleStore,
+    ) -> LoginThrottle:
+        return LoginThrottle(
+            store,
+            username_policy=ThrottlePolicy(
+                burst=settings.USERNAME_BURST,
+                refill_per_s=settings.USERNAME_REFILL_PER_MIN / 60,
+                free_failures=settings.USERNAME_FREE_FAILURES,
+            ),
+            account_policy=ThrottlePolicy(
+                burst=settings.ACCOUNT_BURST,
+                refill_per_s=settings.ACCOUNT_REFILL_PER_MIN / 60,
+                free_failures=settings.ACCOUNT_FREE_FAILURES,
+            ),
+            client_policy=ThrottlePolicy(
+                burst=settings.CLIENT_BURST,
+                refill_per_s=settings.CLIENT_REFILL_PER_MIN / 60,
+                free_failures=settings.CLIENT_FREE_FAILURES,
+            ),
+            backoff_base_s=settings.BACKOFF_BASE_S,
+            backoff_max_s=settings.BACKOFF_MAX_S,
+        )
+
+    @provide
+    def provide_client_address(self, request: Request) -> ClientAddress | None:
+        return ClientAddress(request.client.host) if request.client is not None else None
+
     auth_sqla_user_tx_storage = provide(AuthSqlaUserTxStorage)
 
     # Account handlers
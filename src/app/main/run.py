@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 from collections.abc import AsyncIterator, Callable
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
 
@@ -5,11 +7,13 @@ from dishka import Provider, make_async_container
 from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI
 
+from app.core.common.ports.password_hasher import PasswordHasher
 from app.inbound.http.root_router import make_fastapi_root_router
 from app.main.config.loader import (
     load_app_settings,
     load_cookie_settings,
     load_jwt_settings,
+    load_login_throttle_settings,
     load_password_hasher_settings,
     load_postgres_settings,
     load_session_settings,
@@ -19,6 +23,7 @@ from app.main.config.settings import (
     AppSettings,
     CookieSettings,
     JwtSettings,
+    LoginThrottleSettings,
     PasswordHasherSettings,
     PostgresSettings,
     SessionSettings,
@@ -26,6 +31,10 @@ from app.main.config.settings import (
 )
 from app.main.ioc.provider_registry import get_providers
 from app.main.setup import setup_global_exception_handlers, setup_logging, setup_middlewares
+from app.outbound.auth_ctx.sqla_password_rehasher import PasswordRehasher
+from app.outbound.auth_ctx.sqla_refresh_writer import AuthSessionRefreshWriter
+from app.outbound.auth_ctx.sqla_revocation_feed import AuthSessionRevocationFeed
+from app.outbound.auth_ctx.sqla_session_reaper import ExpiredSessionReaper
 from app.outbound.persistence_sqla.mappings.all import map_tables
 
 
@@ -35,10 +44,35 @@ def make_lifespan() -> Callable[[FastAPI], AbstractAsyncContextManager[None]]:
         """Here one can bind APP-scoped dependencies to `app.state` and close them if needed"""
         # https://dishka.readthedocs.io/en/stable/integrations/fastapi.html
         container = app.state.dishka_container
+        background_tasks: list[asyncio.Task[None]] = []
+        refresh_writer: AuthSessionRefreshWriter | None = None
+        password_rehasher: PasswordRehasher | None = None
         try:
             map_tables()
+            # Built eagerly so work-factor calibration runs at startup, not on the first request.
+            await container.get(PasswordHasher)
+            password_rehasher = await container.get(PasswordRehasher)
+            background_tasks.append(asyncio.create_task(password_rehasher.run()))
+            session_settings = await container.get(SessionSettings)
+            if session_settings.STORE == "sqla":
+                refresh_writer = await container.get(AuthSessionRefreshWriter)
+                background_tasks.append(asyncio.create_task(refresh_writer.run()))
+                session_reaper = await container.get(ExpiredSessionReaper)
+                background_tasks.append(asyncio.create_task(session_reaper.run()))
+            if session_settings.STATELESS:
+                revocation_feed = await container.get(AuthSessionRevocationFeed)
+                await revocation_feed.poll()
+                background_tasks.append(asyncio.create_task(revocation_feed.run()))
             yield
         finally:
+            for task in background_tasks:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+            if refresh_writer is not None:
+                await refresh_writer.close()
+            if password_rehasher is not None:
+                password_rehasher.close()
             await container.close()
 
     return lifespan
@@ -52,6 +86,7 @@ def make_app(
     password_hasher_settings: PasswordHasherSettings | None = None,
     jwt_settings: JwtSettings | None = None,
     session_settings: SessionSettings | None = None,
+    login_throttle_settings: LoginThrottleSettings | None = None,
     cookie_settings: CookieSettings | None = None,
 ) -> FastAPI:
     """Pass providers to override existing ones for testing."""
@@ -70,6 +105,8 @@ def make_app(
         jwt_settings = load_jwt_settings()
     if session_settings is None:
         session_settings = load_session_settings()
+    if login_throttle_settings is None:
+        login_throttle_settings = load_login_throttle_settings()
     if cookie_settings is None:
         cookie_settings = load_cookie_settings()
 
@@ -91,6 +128,7 @@ def make_app(
             PasswordHasherSettings: password_hasher_settings,
             JwtSettings: jwt_settings,
             SessionSettings: session_settings,
+            LoginThrottleSettings: login_throttle_settings,
             CookieSettings: cookie_settings,
         },
     )
@@ -7,6 +7,7 @@ from starlette.responses import JSONResponse
 
 from app.inbound.http.auth_cookie_middleware import AuthCookieMiddleware
 from app.inbound.http.errors.internal_server_error import internal_server_error
+from app.inbound.http.hasher_client_middleware import HasherClientMiddleware
 from app.main.config.logging_ import DATEFMT, FMT, LoggingLevel
 from app.main.config.settings import CookieSettings
 
@@ -32,6 +33,7 @@ def setup_middlewares(app: FastAPI, cookie_settings: CookieSettings) -> None:
         cookie_secure=cookie_settings.SECURE,
         cookie_samesite=cookie_settings.SAMESITE,
     )
+    app.add_middleware(HasherClientMiddleware)
     logger.info("Middlewares are set up")
 
 
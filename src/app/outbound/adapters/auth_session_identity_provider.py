@@ -1,4 +1,5 @@
 from app.core.common.entities.types_ import UserId
+from app.core.common.entities.user import User
 from app.core.common.ports.identity_provider import IdentityProvider
 from app.outbound.auth_ctx.service import AuthService
 
@@ -7,5 +8,5 @@ class AuthSessionIdentityProvider(IdentityProvider):
     def __init__(self, auth_service: AuthService) -> None:
         self._auth_service = auth_service
 
-    async def get_current_user_id(self) -> UserId:
-        return await self._auth_service.get_current_user_id()
+    async def get_current_user(self, *, for_update: bool = False) -> tuple[UserId, User | None]:
+        return await self._auth_service.get_current_user(for_update=for_update)
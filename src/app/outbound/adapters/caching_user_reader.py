@@ -0,0 +1,60 @@
+from collections.abc import AsyncIterator
+from typing import cast
+from uuid import UUID
+
+from app.core.queries.models.user import UserQm
+from app.core.queries.ports.user_reader import ListUsersPageQm, ListUsersQm, UserReader
+from app.core.queries.query_support.keyset_pagination import KeysetPaginationParams
+from app.core.queries.query_support.offset_pagination import OffsetPaginationParams
+from app.core.queries.query_support.sorting import SortingParams
+from app.core.queries.query_support.total_count import TotalCountMode
+from app.outbound.adapters.sqla_users_version import SqlaUsersVersion
+from app.outbound.adapters.user_list_cache import UserListCache
+
+
+class CachingUserReader(UserReader):
+    """
+    Read-through cache in front of another reader: repeated listings with the same parameters
+    are served from `UserListCache` until a user changes. Exports always stream from the source.
+    Each listing first reads the shared users version, a lookup far cheaper than the listing it saves.
+    """
+
+    def __init__(self, reader: UserReader, cache: UserListCache, version: SqlaUsersVersion) -> None:
+        self._reader = reader
+        self._cache = cache
+        self._version = version
+
+    async def list_users(
+        self,
+        *,
+        pagination: OffsetPaginationParams,
+        sorting: SortingParams,
+        total_count: TotalCountMode,
+    ) -> ListUsersQm:
+        key = ("offset", pagination.limit, pagination.offset, sorting.field, sorting.order, total_count)
+        # The key's first element tells the listing kinds apart.
+        version = await self._version.current()
+        cached = cast(ListUsersQm | None, self._cache.get(key, version=version))
+        if cached is not None:
+            return cached
+        users = await self._reader.list_users(pagination=pagination, sorting=sorting, total_count=total_count)
+        self._cache.put(key, users, version=version)
+        return users
+
+    async def list_users_page(
+        self,
+        *,
+        pagination: KeysetPaginationParams,
+        sorting: SortingParams,
+    ) -> ListUsersPageQm:
+        key = ("keyset", pagination.limit, pagination.after, sorting.field, sorting.order)
+        version = await self._version.current()
+        cached = cast(ListUsersPageQm | None, self._cache.get(key, version=version))
+        if cached is not None:
+            return cached
+        users = await self._reader.list_users_page(pagination=pagination, sorting=sorting)
+        self._cache.put(key, users, version=version)
+        return users
+
+    def stream_users(self, *, after_id: UUID | None) -> AsyncIterator[list[UserQm]]:
+        return self._reader.stream_users(after_id=after_id)
@@ -3,3 +3,7 @@ from app.core.common.exceptions import BaseError
 
 class PasswordHasherBusyError(BaseError):
     pass
+
+
+class PasswordHasherProtocolError(BaseError):
+    """The hasher daemon refused a request as invalid: a mismatch between versions or settings, not load."""
@@ -0,0 +1,63 @@
+class GradientLimit:
+    """
+    Concurrency limit driven by measured latency, after Gradient2 from Netflix concurrency-limits.
+    - A slow moving average of latency is the target, a fast one the current sample.
+    - Sample above target (CPU contention, throttling) shrinks the limit proportionally.
+    - Sample within tolerance grows it additively, but only while the limit is actually used.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2,
+        short_window: int = 10,
+        long_window: int = 100,
+    ) -> None:
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._tolerance = tolerance
+        self._smoothing = smoothing
+        self._short_alpha = 2 / (short_window + 1)
+        self._long_alpha = 2 / (long_window + 1)
+        self._estimate = float(self._clamp(initial_limit))
+        self._short_latency_s = 0.0
+        self._long_latency_s = 0.0
+
+    @property
+    def limit(self) -> int:
+        return int(self._estimate)
+
+    @property
+    def short_latency_s(self) -> float:
+        return self._short_latency_s
+
+    @property
+    def long_latency_s(self) -> float:
+        return self._long_latency_s
+
+    def update(self, latency_s: float, in_flight: int) -> int:
+        if self._long_latency_s == 0.0:
+            self._short_latency_s = self._long_latency_s = latency_s
+        else:
+            self._short_latency_s += self._short_alpha * (latency_s - self._short_latency_s)
+            self._long_latency_s += self._long_alpha * (latency_s - self._long_latency_s)
+        if self._long_latency_s > 2 * self._short_latency_s:
+            # Load dropped sharply: let the target catch up instead of growing unchecked.
+            self._long_latency_s *= 0.95
+
+        if in_flight < self._estimate / 2:
+            return self.limit
+
+        gradient = max(0.5, min(1.0, self._tolerance * self._long_latency_s / self._short_latency_s))
+        # Threads are the resource itself, so there is no queue headroom to add: grow by one step.
+        proposed = self._estimate + 1 if gradient == 1.0 else self._estimate * gradient
+        self._estimate = self._clamp(
+            self._estimate * (1 - self._smoothing) + proposed * self._smoothing,
+        )
+        return self.limit
+
+    def _clamp(self, value: float) -> float:
+        return max(float(self._min_limit), min(float(self._max_limit), value))
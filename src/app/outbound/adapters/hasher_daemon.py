@@ -0,0 +1,153 @@
+import asyncio
+import base64
+import contextlib
+import json
+import logging
+import struct
+from collections import Counter
+from pathlib import Path
+from typing import Any, Final
+
+from app.core.common.entities.types_ import UserPasswordHash
+from app.core.common.exceptions import BusinessTypeError
+from app.core.common.value_objects.raw_password import RawPassword
+from app.outbound.adapters.exceptions import PasswordHasherBusyError
+from app.outbound.adapters.hasher_scheduler import HASHER_CLIENT_KEY
+from app.outbound.adapters.peppered_password_hasher import PepperedPasswordHasher
+
+logger = logging.getLogger(__name__)
+
+type Frame = dict[str, Any]
+
+FRAME_HEADER: Final[struct.Struct] = struct.Struct("!I")
+MAX_FRAME_BYTES: Final[int] = 64 * 1024
+SOCKET_MODE: Final[int] = 0o600
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Frame | None:
+    """Reads one length-prefixed JSON frame; `None` on a clean end of stream."""
+    try:
+        header = await reader.readexactly(FRAME_HEADER.size)
+    except asyncio.IncompleteReadError as e:
+        if e.partial:
+            raise
+        return None
+    (size,) = FRAME_HEADER.unpack(header)
+    if size > MAX_FRAME_BYTES:
+        raise ValueError(f"Frame of {size} bytes exceeds {MAX_FRAME_BYTES}")
+    frame: Frame = json.loads(await reader.readexactly(size))
+    return frame
+
+
+async def write_frame(writer: asyncio.StreamWriter, frame: Frame) -> None:
+    payload = json.dumps(frame).encode()
+    writer.write(FRAME_HEADER.pack(len(payload)) + payload)
+    await writer.drain()
+
+
+def encode_bytes(value: bytes) -> str:
+    return base64.b64encode(value).decode()
+
+
+def decode_bytes(value: str) -> bytes:
+    return base64.b64decode(value, validate=True)
+
+
+class HasherDaemon:
+    """
+    Host-wide hashing service shared by all workers over a Unix socket.
+    - One hasher, so one thread pool and one admission queue, for the whole machine.
+    - Priority and per-client fairness are applied host-wide from the client key each request carries.
+    - Requests on a connection are served one at a time; workers open a connection per job.
+    - A client hanging up mid-request cancels its job, like a cancelled caller in-process.
+    """
+
+    def __init__(self, hasher: PepperedPasswordHasher) -> None:
+        self._hasher = hasher
+        self._counters: Counter[str] = Counter()
+        self._connections = 0
+
+    async def start(self, socket_path: Path) -> asyncio.Server:
+        self._remove_stale_socket(socket_path)
+        server = await asyncio.start_unix_server(self._handle_connection, path=socket_path)
+        socket_path.chmod(SOCKET_MODE)  # noqa: ASYNC240
+        logger.info("Hasher daemon listening on %s", socket_path)
+        return server
+
+    async def serve(self, socket_path: Path) -> None:
+        server = await self.start(socket_path)
+        async with server:
+            await server.serve_forever()
+
+    @staticmethod
+    def _remove_stale_socket(socket_path: Path) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            socket_path.unlink()
+
+    async def stats(self) -> dict[str, float]:
+        return {
+            **await self._hasher.stats(),
+            **self._counters,
+            "connections": self._connections,
+        }
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._connections += 1
+        try:
+            while (request := await read_frame(reader)) is not None:
+                response = await self._dispatch_until_hangup(request, reader)
+                if response is None:
+                    self._counters["abandoned"] += 1
+                    break
+                await write_frame(writer, response)
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            logger.warning("Dropping malformed or broken hasher connection")
+        finally:
+            self._connections -= 1
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _dispatch_until_hangup(self, request: Frame, reader: asyncio.StreamReader) -> Frame | None:
+        """Clients send nothing until answered, so any read completing means they hung up."""
+        dispatch = asyncio.create_task(self._dispatch(request))
+        hangup = asyncio.create_task(reader.read(1))
+        try:
+            await asyncio.wait((dispatch, hangup), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            hangup.cancel()
+            abandoned = not dispatch.done()
+            if abandoned:
+                dispatch.cancel()
+        return None if abandoned else dispatch.result()
+
+    async def _dispatch(self, request: Frame) -> Frame:
+        op = request.get("op")
+        token = HASHER_CLIENT_KEY.set(request.get("client"))
+        try:
+            if op in {"hash", "rehash"}:
+                hash_ = self._hasher.hash if op == "hash" else self._hasher.rehash
+                hashed = await hash_(RawPassword(request["password"]))
+                self._counters["hashed"] += 1
+                return {"ok": True, "hash": encode_bytes(hashed)}
+            if op == "verify":
+                valid = await self._hasher.verify(
+                    raw_password=RawPassword(request["password"]),
+                    hashed_password=UserPasswordHash(decode_bytes(request["hash"])),
+                )
+                self._counters["verified"] += 1
+                return {"ok": True, "valid": valid}
+            if op == "needs_rehash":
+                needs_rehash = await self._hasher.needs_rehash(UserPasswordHash(decode_bytes(request["hash"])))
+                return {"ok": True, "needs_rehash": needs_rehash}
+            if op == "stats":
+                return {"ok": True, "stats": await self.stats()}
+        except PasswordHasherBusyError:
+            self._counters["rejected"] += 1
+            return {"ok": False, "error": "busy"}
+        except (KeyError, TypeError, ValueError, BusinessTypeError) as e:
+            logger.warning("Hasher daemon: bad %r request: %r", op, e)
+            return {"ok": False, "error": "bad_request", "message": f"{type(e).__name__}: {e}"}
+        finally:
+            HASHER_CLIENT_KEY.reset(token)
+        return {"ok": False, "error": "unknown_op", "message": f"Unknown op {op!r}"}
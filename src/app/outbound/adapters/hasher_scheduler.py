@@ -0,0 +1,193 @@
+import asyncio
+import contextlib
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from concurrent.futures import Executor, Future
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, Final, Protocol
+
+from app.outbound.adapters.exceptions import PasswordHasherBusyError
+from app.outbound.adapters.gradient_limit import GradientLimit
+
+HASHER_CLIENT_KEY: Final[ContextVar[str | None]] = ContextVar("hasher_client_key", default=None)
+ANONYMOUS_CLIENT: Final[str] = ""
+
+type HasherStats = dict[str, float]
+
+
+class HasherStatsSource(Protocol):
+    async def stats(self) -> HasherStats: ...
+
+
+class HasherPriority(IntEnum):
+    """Lower value is served first; `REHASH` only takes a free permit and never queues."""
+
+    VERIFY = 0
+    HASH = 1
+    REHASH = 2
+
+
+class HasherScheduler:
+    """
+    Admission queue in front of the hasher threads.
+    - Strict priority between classes, round-robin between clients within a class.
+    - Rejects up front when the estimated wait exceeds the deadline,
+      estimated from the client's fair position and observed job durations.
+    - A released permit is handed directly to the next waiter.
+    - Capacity follows the adaptive limit; permits above a lowered limit are retired on release.
+    - Executor jobs hold their permit until the thread is done, even if the caller is gone.
+    """
+
+    def __init__(
+        self,
+        limit: GradientLimit,
+        wait_timeout_s: float,
+        duration_smoothing: float = 0.2,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._limit = limit
+        self._wait_timeout_s = wait_timeout_s
+        self._duration_smoothing = duration_smoothing
+        self._clock = clock
+        self._in_use = 0
+        self._avg_duration_s = 0.0
+        self._queues: dict[HasherPriority, OrderedDict[str, deque[asyncio.Future[None]]]] = {
+            priority: OrderedDict() for priority in HasherPriority
+        }
+
+    @property
+    def limit(self) -> int:
+        return self._limit.limit
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(queue) for clients in self._queues.values() for queue in clients.values())
+
+    @property
+    def avg_duration_s(self) -> float:
+        return self._avg_duration_s
+
+    def stats(self) -> HasherStats:
+        return {
+            "limit": self.limit,
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "avg_duration_s": self.avg_duration_s,
+        }
+
+    async def run[*Ts, R](
+        self,
+        priority: HasherPriority,
+        client: str | None,
+        executor: Executor,
+        fn: Callable[[*Ts], R],
+        *args: *Ts,
+    ) -> R:
+        """
+        Cancelling the caller drops a job that has not started yet;
+        a running one keeps its permit until it finishes, so the pool is never oversubscribed.
+        """
+        await self._acquire(priority, client if client is not None else ANONYMOUS_CLIENT)
+        loop = asyncio.get_running_loop()
+        started = self._clock()
+        try:
+            job = executor.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        job.add_done_callback(lambda done: self._finish_threadsafe(loop, done, started))
+        return await asyncio.wrap_future(job)
+
+    def _finish_threadsafe(self, loop: asyncio.AbstractEventLoop, job: Future[Any], started: float) -> None:
+        # Runs in the worker thread; a closed loop means shutdown, with nothing left to release.
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(self._finish, job, self._clock() - started)
+
+    def _finish(self, job: Future[Any], duration_s: float) -> None:
+        if not job.cancelled() and job.exception() is None:
+            self._observe(duration_s)
+        self._release()
+
+    def estimated_wait_s(self, priority: HasherPriority, client: str) -> float:
+        if self._in_use < self._limit.limit:
+            return 0.0
+        same_class = self._queues[priority]
+        own = len(same_class.get(client, ())) + 1
+        ahead = sum(len(queue) for p in HasherPriority if p < priority for queue in self._queues[p].values())
+        ahead += sum(min(len(queue), own) for c, queue in same_class.items() if c != client)
+        return (ahead + own) * self._avg_duration_s / self._limit.limit
+
+    async def _acquire(self, priority: HasherPriority, client: str) -> None:
+        if self._in_use < self._limit.limit:
+            self._in_use += 1
+            return
+
+        if priority is HasherPriority.REHASH or self.estimated_wait_s(priority, client) > self._wait_timeout_s:
+            raise PasswordHasherBusyError
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queues[priority].setdefault(client, deque()).append(waiter)
+        try:
+            async with asyncio.timeout(self._wait_timeout_s):
+                await waiter
+        except TimeoutError as e:
+            self._abandon(priority, client, waiter)
+            raise PasswordHasherBusyError from e
+        except asyncio.CancelledError:
+            self._abandon(priority, client, waiter)
+            raise
+
+    def _abandon(self, priority: HasherPriority, client: str, waiter: asyncio.Future[None]) -> None:
+        if waiter.done() and not waiter.cancelled():
+            # Granted while being cancelled: pass the permit on.
+            self._release()
+            return
+        waiter.cancel()
+        clients = self._queues[priority]
+        queue = clients.get(client)
+        if queue is None:
+            return
+        if waiter in queue:
+            queue.remove(waiter)
+        if not queue:
+            del clients[client]
+
+    def _release(self) -> None:
+        waiter = self._next_waiter() if self._in_use <= self._limit.limit else None
+        if waiter is None:
+            self._in_use -= 1
+        else:
+            waiter.set_result(None)
+
+    def _grant_headroom(self) -> None:
+        while self._in_use < self._limit.limit and (waiter := self._next_waiter()) is not None:
+            self._in_use += 1
+            waiter.set_result(None)
+
+    def _next_waiter(self) -> asyncio.Future[None] | None:
+        for priority in HasherPriority:
+            clients = self._queues[priority]
+            while clients:
+                client, queue = next(iter(clients.items()))
+                waiter = queue.popleft()
+                if queue:
+                    clients.move_to_end(client)
+                else:
+                    del clients[client]
+                if not waiter.done():
+                    return waiter
+        return None
+
+    def _observe(self, duration_s: float) -> None:
+        if self._avg_duration_s == 0.0:
+            self._avg_duration_s = duration_s
+        else:
+            self._avg_duration_s += self._duration_smoothing * (duration_s - self._avg_duration_s)
+        self._limit.update(duration_s, self._in_use)
+        self._grant_headroom()
@@ -0,0 +1,192 @@
+import base64
+import hashlib
+import hmac
+import math
+import os
+import time
+from abc import abstractmethod
+from typing import Final, Protocol
+
+import argon2
+import bcrypt
+
+BCRYPT_MAX_WORK_FACTOR: Final[int] = 31
+BCRYPT_HASH_LEN: Final[int] = 60
+# Calibrated workers may land one step apart; hashes within that step are kept, so they don't flip-flop.
+BCRYPT_CALIBRATED_TOLERANCE: Final[int] = 1
+CALIBRATION_SAMPLES: Final[int] = 5
+CALIBRATION_PERCENTILE: Final[float] = 0.95
+SCRYPT_SALT_BYTES: Final[int] = 16
+SCRYPT_KEY_BYTES: Final[int] = 32
+
+
+class PasswordHashEngine(Protocol):
+    """One hashing algorithm and its stored format; inputs are already peppered."""
+
+    @abstractmethod
+    def identifies(self, hashed: bytes) -> bool:
+        """True when `hashed` is in this engine's format, whatever its parameters."""
+
+    @abstractmethod
+    def hash(self, secret: bytes) -> bytes: ...
+
+    @abstractmethod
+    def verify(self, secret: bytes, hashed: bytes) -> bool: ...
+
+    @abstractmethod
+    def needs_rehash(self, hashed: bytes) -> bool:
+        """True when `hashed` is in this engine's format but with other parameters."""
+
+
+class BcryptEngine(PasswordHashEngine):
+    """
+    Work factor:
+    https://cheatsheetseries.owasp.org/cheatsheets/Password_Storage_Cheat_Sheet.html#bcrypt
+    """
+
+    def __init__(self, work_factor: int, *, min_work_factor: int | None = None) -> None:
+        """
+        `min_work_factor` marks a calibrated `work_factor`: stored costs from that floor
+        and within one step of `work_factor` are then accepted as they are.
+        """
+        self._work_factor = work_factor
+        self._min_work_factor = work_factor if min_work_factor is None else min_work_factor
+        self._tolerance = 0 if min_work_factor is None else BCRYPT_CALIBRATED_TOLERANCE
+
+    def identifies(self, hashed: bytes) -> bool:
+        return hashed.startswith((b"$2a$", b"$2b$", b"$2y$"))
+
+    def hash(self, secret: bytes) -> bytes:
+        return bcrypt.hashpw(secret, bcrypt.gensalt(rounds=self._work_factor))
+
+    def verify(self, secret: bytes, hashed: bytes) -> bool:
+        try:
+            return bcrypt.checkpw(secret, hashed)
+        except ValueError:
+            # Malformed hash
+            return False
+
+    def needs_rehash(self, hashed: bytes) -> bool:
+        # Modular crypt format: $2b$<cost>$<salt+hash>
+        cost = hashed.split(b"$")[2]
+        if not cost.isdigit() or len(hashed) != BCRYPT_HASH_LEN:
+            return True
+        return int(cost) < self._min_work_factor or abs(int(cost) - self._work_factor) > self._tolerance
+
+    @staticmethod
+    def calibrate_work_factor(probe: bytes, budget_s: float, min_work_factor: int) -> int:
+        """
+        Highest cost whose p95 hash time fits the budget, never below `min_work_factor`.
+        Each cost step doubles the time, so the sweep stops before a step that would overshoot.
+        """
+        chosen = min_work_factor
+        for work_factor in range(min_work_factor, BCRYPT_MAX_WORK_FACTOR + 1):
+            durations = []
+            for _ in range(CALIBRATION_SAMPLES):
+                started = time.perf_counter()
+                bcrypt.hashpw(probe, bcrypt.gensalt(rounds=work_factor))
+                durations.append(time.perf_counter() - started)
+            p95 = sorted(durations)[math.ceil(CALIBRATION_PERCENTILE * len(durations)) - 1]
+            if p95 > budget_s:
+                break
+            chosen = work_factor
+            if 2 * p95 > budget_s:
+                break
+        return chosen
+
+
+class Argon2idEngine(PasswordHashEngine):
+    """
+    Memory-hard; trades CPU time for memory per hash:
+    https://cheatsheetseries.owasp.org/cheatsheets/Password_Storage_Cheat_Sheet.html#argon2id
+    """
+
+    def __init__(self, time_cost: int, memory_cost_kib: int, parallelism: int) -> None:
+        self._hasher = argon2.PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost_kib,
+            parallelism=parallelism,
+            type=argon2.Type.ID,
+        )
+
+    def identifies(self, hashed: bytes) -> bool:
+        return hashed.startswith(b"$argon2id$")
+
+    def hash(self, secret: bytes) -> bytes:
+        return self._hasher.hash(secret).encode()
+
+    def verify(self, secret: bytes, hashed: bytes) -> bool:
+        try:
+            return self._hasher.verify(hashed, secret)
+        except (argon2.exceptions.VerificationError, argon2.exceptions.InvalidHashError):
+            return False
+
+    def needs_rehash(self, hashed: bytes) -> bool:
+        try:
+            return self._hasher.check_needs_rehash(hashed.decode())
+        except (argon2.exceptions.InvalidHashError, UnicodeDecodeError):
+            return True
+
+
+class ScryptEngine(PasswordHashEngine):
+    """
+    Stored as `$scrypt$ln=<log2 N>,r=<r>,p=<p>$<salt>$<key>`, base64 without padding:
+    https://cheatsheetseries.owasp.org/cheatsheets/Password_Storage_Cheat_Sheet.html#scrypt
+    """
+
+    PREFIX: Final[bytes] = b"$scrypt$"
+
+    def __init__(self, log2_n: int, r: int, p: int) -> None:
+        self._params = (log2_n, r, p)
+
+    def identifies(self, hashed: bytes) -> bool:
+        return hashed.startswith(self.PREFIX)
+
+    def hash(self, secret: bytes) -> bytes:
+        log2_n, r, p = self._params
+        salt = os.urandom(SCRYPT_SALT_BYTES)
+        key = self._derive(secret, salt, log2_n, r, p)
+        return b"$scrypt$ln=%d,r=%d,p=%d$%s$%s" % (log2_n, r, p, self._b64(salt), self._b64(key))
+
+    def verify(self, secret: bytes, hashed: bytes) -> bool:
+        try:
+            (log2_n, r, p), salt, key = self._parse(hashed)
+            derived = self._derive(secret, salt, log2_n, r, p)
+        except (ValueError, KeyError, OverflowError):
+            # Malformed hash or parameters out of range
+            return False
+        return hmac.compare_digest(derived, key)
+
+    def needs_rehash(self, hashed: bytes) -> bool:
+        try:
+            params, _, _ = self._parse(hashed)
+        except (ValueError, KeyError):
+            return True
+        return params != self._params
+
+    @staticmethod
+    def _derive(secret: bytes, salt: bytes, log2_n: int, r: int, p: int) -> bytes:
+        n = 1 << log2_n
+        return hashlib.scrypt(
+            secret,
+            salt=salt,
+            n=n,
+            r=r,
+            p=p,
+            maxmem=2 * 128 * n * r * p,
+            dklen=SCRYPT_KEY_BYTES,
+        )
+
+    @staticmethod
+    def _parse(hashed: bytes) -> tuple[tuple[int, int, int], bytes, bytes]:
+        _, _, params, salt, key = hashed.split(b"$")
+        values = dict(item.split(b"=") for item in params.split(b","))
+        return (
+            (int(values[b"ln"]), int(values[b"r"]), int(values[b"p"])),
+            base64.b64decode(salt + b"=" * (-len(salt) % 4)),
+            base64.b64decode(key + b"=" * (-len(key) % 4)),
+        )
+
+    @staticmethod
+    def _b64(value: bytes) -> bytes:
+        return base64.b64encode(value).rstrip(b"=")
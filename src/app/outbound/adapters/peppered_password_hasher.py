@@ -0,0 +1,105 @@
+import base64
+import hashlib
+import hmac
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import NewType
+
+from app.core.common.entities.types_ import UserPasswordHash
+from app.core.common.ports.password_hasher import PasswordHasher
+from app.core.common.value_objects.raw_password import RawPassword
+from app.outbound.adapters.hasher_scheduler import (
+    HASHER_CLIENT_KEY,
+    HasherPriority,
+    HasherScheduler,
+    HasherStats,
+    HasherStatsSource,
+)
+from app.outbound.adapters.password_hash_engines import PasswordHashEngine
+
+HasherThreadPoolExecutor = NewType("HasherThreadPoolExecutor", ThreadPoolExecutor)
+PasswordHashEngines = NewType("PasswordHashEngines", tuple[PasswordHashEngine, ...])
+
+
+class PepperedPasswordHasher(PasswordHasher, HasherStatsSource):
+    """
+    - New hashes use the primary engine, the first of `engines`.
+    - Stored hashes are verified by whichever engine recognizes their format.
+    - Hashes of another format, or of the primary's format with other parameters, need a rehash.
+    """
+
+    def __init__(
+        self,
+        pepper: bytes,
+        engines: Sequence[PasswordHashEngine],
+        executor: HasherThreadPoolExecutor,
+        scheduler: HasherScheduler,
+    ) -> None:
+        self._pepper = pepper
+        self._primary, *_ = self._engines = tuple(engines)
+        self._executor = executor
+        self._scheduler = scheduler
+
+    async def hash(self, raw_password: RawPassword) -> UserPasswordHash:
+        return await self._scheduler.run(
+            HasherPriority.HASH,
+            HASHER_CLIENT_KEY.get(),
+            self._executor,
+            self.hash_sync,
+            raw_password,
+        )
+
+    async def rehash(self, raw_password: RawPassword) -> UserPasswordHash:
+        return await self._scheduler.run(
+            HasherPriority.REHASH,
+            HASHER_CLIENT_KEY.get(),
+            self._executor,
+            self.hash_sync,
+            raw_password,
+        )
+
+    async def verify(
+        self,
+        raw_password: RawPassword,
+        hashed_password: UserPasswordHash,
+    ) -> bool:
+        return await self._scheduler.run(
+            HasherPriority.VERIFY,
+            HASHER_CLIENT_KEY.get(),
+            self._executor,
+            self.verify_sync,
+            raw_password,
+            hashed_password,
+        )
+
+    async def needs_rehash(self, hashed_password: UserPasswordHash) -> bool:
+        if not self._primary.identifies(hashed_password):
+            return True
+        return self._primary.needs_rehash(hashed_password)
+
+    async def stats(self) -> HasherStats:
+        return self._scheduler.stats()
+
+    def hash_sync(self, raw_password: RawPassword) -> UserPasswordHash:
+        """
+        Pre-hashing:
+        https://cheatsheetseries.owasp.org/cheatsheets/Password_Storage_Cheat_Sheet.html#pre-hashing-passwords-with-bcrypt
+        """
+        base64_hmac_peppered = self.add_pepper(raw_password, self._pepper)
+        return UserPasswordHash(self._primary.hash(base64_hmac_peppered))
+
+    def verify_sync(self, raw_password: RawPassword, hashed_password: UserPasswordHash) -> bool:
+        engine = next((engine for engine in self._engines if engine.identifies(hashed_password)), None)
+        if engine is None:
+            return False
+        base64_hmac_peppered = self.add_pepper(raw_password, self._pepper)
+        return engine.verify(base64_hmac_peppered, hashed_password)
+
+    @staticmethod
+    def add_pepper(raw_password: RawPassword, pepper: bytes) -> bytes:
+        hmac_password = hmac.new(
+            key=pepper,
+            msg=raw_password.value,
+            digestmod=hashlib.sha384,
+        ).digest()
+        return base64.b64encode(hmac_password)
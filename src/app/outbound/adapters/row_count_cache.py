@@ -0,0 +1,30 @@
+import time
+from collections.abc import Callable
+
+
+class RowCountCache:
+    """
+    Exact row counts, reused for `ttl_s` so repeated listings don't each count the whole table.
+    - Keyed by table name.
+    - Per process: rows written elsewhere show up once the entry goes stale.
+      A zero `ttl_s` disables caching.
+    """
+
+    def __init__(self, ttl_s: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self._entries: dict[str, tuple[int, float]] = {}
+
+    def get(self, key: str) -> int | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        count, stale_at = entry
+        if stale_at <= self._clock():
+            del self._entries[key]
+            return None
+        return count
+
+    def put(self, key: str, count: int) -> None:
+        if self._ttl_s > 0:
+            self._entries[key] = (count, self._clock() + self._ttl_s)
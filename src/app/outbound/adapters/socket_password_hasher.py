@@ -0,0 +1,85 @@
+import asyncio
+import logging
+from pathlib import Path
+
+from app.core.common.entities.types_ import UserPasswordHash
+from app.core.common.ports.password_hasher import PasswordHasher
+from app.core.common.value_objects.raw_password import RawPassword
+from app.outbound.adapters.exceptions import PasswordHasherBusyError, PasswordHasherProtocolError
+from app.outbound.adapters.hasher_daemon import Frame, decode_bytes, encode_bytes, read_frame, write_frame
+from app.outbound.adapters.hasher_scheduler import HASHER_CLIENT_KEY, HasherStats, HasherStatsSource
+
+logger = logging.getLogger(__name__)
+
+
+class SocketPasswordHasher(PasswordHasher, HasherStatsSource):
+    """
+    Delegates to the host-wide hasher daemon.
+    - An unreachable or saturated daemon counts as busy, which callers may retry.
+    - A request the daemon refuses as invalid raises `PasswordHasherProtocolError`, which retrying won't fix.
+    """
+
+    def __init__(self, socket_path: Path, timeout_s: float) -> None:
+        self._socket_path = socket_path
+        self._timeout_s = timeout_s
+
+    async def hash(self, raw_password: RawPassword) -> UserPasswordHash:
+        response = await self._call(
+            {
+                "op": "hash",
+                "client": HASHER_CLIENT_KEY.get(),
+                "password": raw_password.value.decode(),
+            }
+        )
+        return UserPasswordHash(decode_bytes(response["hash"]))
+
+    async def rehash(self, raw_password: RawPassword) -> UserPasswordHash:
+        response = await self._call(
+            {
+                "op": "rehash",
+                "client": HASHER_CLIENT_KEY.get(),
+                "password": raw_password.value.decode(),
+            }
+        )
+        return UserPasswordHash(decode_bytes(response["hash"]))
+
+    async def verify(self, raw_password: RawPassword, hashed_password: UserPasswordHash) -> bool:
+        response = await self._call(
+            {
+                "op": "verify",
+                "client": HASHER_CLIENT_KEY.get(),
+                "password": raw_password.value.decode(),
+                "hash": encode_bytes(hashed_password),
+            }
+        )
+        return bool(response["valid"])
+
+    async def needs_rehash(self, hashed_password: UserPasswordHash) -> bool:
+        response = await self._call({"op": "needs_rehash", "hash": encode_bytes(hashed_password)})
+        return bool(response["needs_rehash"])
+
+    async def stats(self) -> HasherStats:
+        response = await self._call({"op": "stats"})
+        stats: HasherStats = response["stats"]
+        return stats
+
+    async def _call(self, request: Frame) -> Frame:
+        try:
+            async with asyncio.timeout(self._timeout_s):
+                reader, writer = await asyncio.open_unix_connection(self._socket_path)
+                try:
+                    await write_frame(writer, request)
+                    response = await read_frame(reader)
+                finally:
+                    writer.close()
+        except (OSError, TimeoutError, asyncio.IncompleteReadError) as e:
+            raise PasswordHasherBusyError from e
+        if response is None:
+            raise PasswordHasherBusyError
+        if not response.get("ok"):
+            error = response.get("error")
+            if error == "busy":
+                raise PasswordHasherBusyError
+            logger.error("Hasher daemon refused %r: %s (%s).", request.get("op"), error, response.get("message"))
+            raise PasswordHasherProtocolError
+        return response
@@ -3,12 +3,16 @@ from typing import Final
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
 
+from app.core.commands.exceptions import UserModifiedConcurrentlyError
 from app.core.commands.ports.transaction_manager import TransactionManager
 from app.outbound.exceptions import StorageError
 
 DB_COMMIT_DONE: Final[str] = "Commit was done."
 DB_COMMIT_FAILED: Final[str] = "Commit failed."
+DB_RELEASE_DONE: Final[str] = "Connection was released."
+DB_RELEASE_FAILED: Final[str] = "Connection release failed."
 
 logger = logging.getLogger(__name__)
 
@@ -22,5 +26,17 @@ class SqlaTransactionManager(TransactionManager):
             await self._session.commit()
             logger.debug("%s.", DB_COMMIT_DONE)
 
+        except StaleDataError as e:
+            raise UserModifiedConcurrentlyError from e
+
         except SQLAlchemyError as e:
             raise StorageError(DB_COMMIT_FAILED) from e
+
+    async def release(self) -> None:
+        """Commits instead of closing so loaded objects stay attached and can be changed later."""
+        try:
+            await self._session.commit()
+            logger.debug("%s.", DB_RELEASE_DONE)
+
+        except SQLAlchemyError as e:
+            raise StorageError(DB_RELEASE_FAILED) from e
@@ -1,76 +1,190 @@
-from sqlalchemy import func, select
+from collections.abc import AsyncIterator
+from typing import Any, ClassVar
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Row, Select, func, literal, select, text, tuple_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.queries.models.user import UserQm
-from app.core.queries.ports.user_reader import ListUsersQm, UserReader
+from app.core.queries.ports.user_reader import ListUsersPageQm, ListUsersQm, UserReader
 from app.core.queries.query_support.exceptions import SortingError
+from app.core.queries.query_support.keyset_pagination import KeysetCursor, KeysetPaginationParams
 from app.core.queries.query_support.offset_pagination import OffsetPaginationParams
 from app.core.queries.query_support.sorting import SortingOrder, SortingParams
+from app.core.queries.query_support.total_count import TotalCountMode
+from app.outbound.adapters.row_count_cache import RowCountCache
 from app.outbound.exceptions import ReaderError
 from app.outbound.persistence_sqla.mappings.user import users_table
 
 
 class SqlaUserReader(UserReader):
-    def __init__(self, session: AsyncSession) -> None:
+    STREAM_BATCH_SIZE: ClassVar[int] = 1000
+
+    def __init__(self, session: AsyncSession, count_cache: RowCountCache) -> None:
         self._session = session
+        self._count_cache = count_cache
 
     async def list_users(
         self,
         *,
         pagination: OffsetPaginationParams,
         sorting: SortingParams,
+        total_count: TotalCountMode,
     ) -> ListUsersQm:
-        sorting_column = users_table.c.get(sorting.field)
-        if sorting_column is None:
-            raise SortingError("Invalid sorting field")
-        order_by_expression = sorting_column.asc() if sorting.order == SortingOrder.ASC else sorting_column.desc()
-        secondary_order_by = users_table.c.id.asc() if sorting.order == SortingOrder.ASC else users_table.c.id.desc()
-        stmt = (
-            select(
-                users_table.c.id,
-                users_table.c.username,
-                users_table.c.role,
-                users_table.c.is_active,
-                users_table.c.created_at,
-                users_table.c.updated_at,
-                func.count().over().label("total"),
-            )
-            .order_by(order_by_expression, secondary_order_by)
-            .limit(pagination.limit)
-            .offset(pagination.offset)
-        )
+        # No window count: the page query stops at LIMIT instead of reading and sorting every row.
+        stmt = self._select_users(sorting).limit(pagination.limit).offset(pagination.offset)
         try:
-            result = await self._session.execute(stmt)
-            rows = result.all()
+            rows = (await self._session.execute(stmt)).all()
         except SQLAlchemyError as e:
             raise ReaderError from e
-        if not rows:
-            total_stmt = select(func.count()).select_from(users_table)
-            try:
-                total = int(await self._session.scalar(total_stmt) or 0)
-            except SQLAlchemyError as e:
-                raise ReaderError from e
-            return ListUsersQm(
-                users=[],
-                total=total,
-                limit=pagination.limit,
-                offset=pagination.offset,
-            )
-        users = [
-            UserQm(
-                id=row.id,
-                username=row.username,
-                role=row.role,
-                is_active=row.is_active,
-                created_at=row.created_at,
-                updated_at=row.updated_at,
-            )
-            for row in rows
-        ]
         return ListUsersQm(
-            users=users,
-            total=rows[0].total,
+            users=[self._to_qm(row) for row in rows],
+            total=await self._get_total(total_count, pagination, len(rows)),
             limit=pagination.limit,
             offset=pagination.offset,
         )
+
+    async def list_users_page(
+        self,
+        *,
+        pagination: KeysetPaginationParams,
+        sorting: SortingParams,
+    ) -> ListUsersPageQm:
+        sorting_column = self._get_sorting_column(sorting)
+        # One extra row tells whether there is a next page.
+        stmt = self._select_users(sorting).limit(pagination.limit + 1)
+        if pagination.after is not None:
+            # Row-value comparison: a single index range scan on (field, id) in either direction.
+            position = tuple_(sorting_column, users_table.c.id)
+            after = tuple_(
+                literal(pagination.after.value, sorting_column.type),
+                literal(pagination.after.id, users_table.c.id.type),
+            )
+            stmt = stmt.where(position > after if sorting.order == SortingOrder.ASC else position < after)
+        try:
+            rows = (await self._session.execute(stmt)).all()
+        except SQLAlchemyError as e:
+            raise ReaderError from e
+        page = rows[: pagination.limit]
+        next_cursor = None
+        if len(rows) > pagination.limit:
+            last = page[-1]
+            next_cursor = KeysetCursor(
+                field=sorting.field,
+                order=sorting.order,
+                value=getattr(last, sorting_column.name),
+                id=last.id,
+            ).encode()
+        return ListUsersPageQm(
+            users=[self._to_qm(row) for row in page],
+            limit=pagination.limit,
+            next_cursor=next_cursor,
+        )
+
+    async def stream_users(self, *, after_id: UUID | None) -> AsyncIterator[list[UserQm]]:
+        """
+        Server-side cursor: rows are fetched `STREAM_BATCH_SIZE` at a time as the consumer asks for them,
+        so memory stays flat however many users there are. The primary key index serves the order.
+        """
+        stmt = self._select_user_columns().order_by(users_table.c.id.asc())
+        if after_id is not None:
+            stmt = stmt.where(users_table.c.id > after_id)
+        try:
+            result = await self._session.stream(stmt.execution_options(yield_per=self.STREAM_BATCH_SIZE))
+            try:
+                async for rows in result.partitions():
+                    yield [self._to_qm(row) for row in rows]
+            finally:
+                await result.close()
+        except SQLAlchemyError as e:
+            raise ReaderError from e
+
+    async def _get_total(
+        self,
+        total_count: TotalCountMode,
+        pagination: OffsetPaginationParams,
+        page_size: int,
+    ) -> int | None:
+        if total_count == TotalCountMode.NONE:
+            return None
+        # A short page ends the table, as does an empty first one: the page itself gives the exact total.
+        if 0 < page_size < pagination.limit or (page_size == 0 and pagination.offset == 0):
+            total = pagination.offset + page_size
+            self._count_cache.put(users_table.name, total)
+            return total
+        # A full page proves at least this many rows; an empty one past the end proves nothing.
+        seen = pagination.offset + page_size if page_size else 0
+        if total_count == TotalCountMode.ESTIMATED:
+            estimate = await self._estimate_count()
+            if estimate is not None:
+                return max(estimate, seen)
+        elif total_count == TotalCountMode.CACHED:
+            cached = self._count_cache.get(users_table.name)
+            if cached is not None:
+                return max(cached, seen)
+        total = await self._count()
+        self._count_cache.put(users_table.name, total)
+        return total
+
+    async def _count(self) -> int:
+        stmt = select(func.count()).select_from(users_table)
+        try:
+            total: int = (await self._session.execute(stmt)).scalar_one()
+        except SQLAlchemyError as e:
+            raise ReaderError from e
+        return total
+
+    async def _estimate_count(self) -> int | None:
+        """
+        The planner's estimate, as EXPLAIN would report it for the whole table:
+        tuple density from the last ANALYZE, scaled to the table's current size.
+        None if the table was never analyzed.
+        """
+        stmt = text(
+            "SELECT CASE WHEN relpages > 0 "
+            "THEN reltuples / relpages * (pg_relation_size(oid) / current_setting('block_size')::int) END "
+            "FROM pg_class WHERE oid = CAST(:table AS regclass)",
+        ).bindparams(table=users_table.name)
+        try:
+            estimate = (await self._session.execute(stmt)).scalar_one()
+        except SQLAlchemyError as e:
+            raise ReaderError from e
+        return round(estimate) if estimate is not None and estimate >= 0 else None
+
+    @staticmethod
+    def _get_sorting_column(sorting: SortingParams) -> ColumnElement[Any]:
+        sorting_column = users_table.c.get(sorting.field)
+        if sorting_column is None:
+            raise SortingError("Invalid sorting field")
+        return sorting_column
+
+    def _select_users(self, sorting: SortingParams) -> Select[Any]:
+        sorting_column = self._get_sorting_column(sorting)
+        if sorting.order == SortingOrder.ASC:
+            order_by = (sorting_column.asc(), users_table.c.id.asc())
+        else:
+            order_by = (sorting_column.desc(), users_table.c.id.desc())
+        return self._select_user_columns().order_by(*order_by)
+
+    @staticmethod
+    def _select_user_columns() -> Select[Any]:
+        return select(
+            users_table.c.id,
+            users_table.c.username,
+            users_table.c.role,
+            users_table.c.is_active,
+            users_table.c.created_at,
+            users_table.c.updated_at,
+        )
+
+    @staticmethod
+    def _to_qm(row: Row[Any]) -> UserQm:
+        return UserQm(
+            id=row.id,
+            username=row.username,
+            role=row.role,
+            is_active=row.is_active,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
@@ -1,14 +1,16 @@
+from sqlalchemy import exists, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.commands.ports.user_tx_storage import UserTxStorage
-from app.core.common.authorization.ports import AuthzUserFinder
 from app.core.common.entities.types_ import UserId
 from app.core.common.entities.user import User
+from app.core.common.value_objects.username import Username
 from app.outbound.exceptions import StorageError
+from app.outbound.persistence_sqla.mappings.user import users_table
 
 
-class SqlaUserTxStorage(UserTxStorage, AuthzUserFinder):
+class SqlaUserTxStorage(UserTxStorage):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
@@ -32,3 +34,10 @@ class SqlaUserTxStorage(UserTxStorage, AuthzUserFinder):
             )
         except SQLAlchemyError as e:
             raise StorageError from e
+
+    async def exists_by_username(self, username: Username) -> bool:
+        stmt = select(exists().where(users_table.c.username == username.value))
+        try:
+            return bool(await self._session.scalar(stmt))
+        except SQLAlchemyError as e:
+            raise StorageError from e
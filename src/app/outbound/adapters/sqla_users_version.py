@@ -0,0 +1,42 @@
+import logging
+
+from sqlalchemy import BigInteger, Boolean, Select, case, column, select, table
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.commands.ports.users_version import UsersVersion
+from app.outbound.exceptions import ReaderError
+from app.outbound.persistence_sqla.mappings.user import users_version_seq
+
+logger = logging.getLogger(__name__)
+
+
+class SqlaUsersVersion(UsersVersion):
+    """
+    Version of the users shared by every process: a database sequence, advanced after each committed change.
+    - Sequences are not transactional and take no row lock, so writers never wait on each other to bump it.
+    - Bumped after the commit, so a reader seeing the new version also sees the change.
+      A bump that fails, or a crash before it, leaves cached reads stale until their TTL runs out.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def bump(self) -> None:
+        try:
+            await self._session.execute(select(users_version_seq.next_value()))
+            # Ends the transaction the statement began, so the connection goes back to the pool
+            await self._session.commit()
+        except SQLAlchemyError as e:
+            logger.warning("Users version: bump failed: %s.", e)
+
+    async def current(self) -> int:
+        # `last_value` already holds the start value before the first `nextval`, which returns that same value,
+        # so an untouched sequence counts as version 0
+        stmt: Select[tuple[int]] = select(
+            case((column("is_called", Boolean), column("last_value", BigInteger)), else_=0),
+        ).select_from(table(users_version_seq.name))
+        try:
+            return (await self._session.execute(stmt)).scalar_one()
+        except SQLAlchemyError as e:
+            raise ReaderError from e
@@ -0,0 +1,50 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+from app.core.queries.ports.user_reader import ListUsersPageQm, ListUsersQm
+
+type UserListKey = tuple[Hashable, ...]
+type UserList = ListUsersQm | ListUsersPageQm
+
+
+class UserListCache:
+    """
+    User listings already read, keyed by their parameters, each valid only for the version of the users it was read at.
+    - Callers pass the current version, shared by every process, so a change committed anywhere
+      invalidates every entry read before it.
+    - Bounded by `max_entries` (least recently used go first) and by `ttl_s`.
+      A zero `ttl_s` or `max_entries` disables caching.
+    - Entries are shared between requests and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self._entries: OrderedDict[UserListKey, tuple[UserList, int, float]] = OrderedDict()
+
+    def get(self, key: UserListKey, *, version: int) -> UserList | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        users, read_at_version, stale_at = entry
+        if read_at_version != version or stale_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return users
+
+    def put(self, key: UserListKey, users: UserList, *, version: int) -> None:
+        """`version` is the one read before the query that produced `users`."""
+        if self._ttl_s <= 0 or self._max_entries <= 0:
+            return
+        self._entries[key] = (users, version, self._clock() + self._ttl_s)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
@@ -15,5 +15,13 @@ class ReAuthenticationError(BaseError):
     default_message: ClassVar[str] = "Invalid password."
 
 
+class LoginThrottledError(BaseError):
+    default_message: ClassVar[str] = "Too many log-in attempts. Please try again later."
+
+    def __init__(self, *, retry_after_s: float) -> None:
+        super().__init__()
+        self.retry_after_s = retry_after_s
+
+
 class AuthenticationChangeError(BaseError):
     default_message: ClassVar[str] = "New password must differ from current password."
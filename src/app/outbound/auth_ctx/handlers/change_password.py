@@ -2,6 +2,7 @@ import logging
 from dataclasses import dataclass
 
 from app.core.commands.ports.transaction_manager import TransactionManager
+from app.core.commands.ports.users_version import UsersVersion
 from app.core.commands.ports.utc_timer import UtcTimer
 from app.core.common.authorization.current_user_service import CurrentUserService
 from app.core.common.services.user import UserService
@@ -25,6 +26,7 @@ class ChangePassword:
     - Open to authenticated users.
     - Current user can change their password.
     - New password must differ from current password.
+    - Fails with a conflict if the user is changed concurrently.
     """
 
     def __init__(
@@ -33,21 +35,25 @@ class ChangePassword:
         user_service: UserService,
         utc_timer: UtcTimer,
         transaction_manager: TransactionManager,
+        users_version: UsersVersion,
     ) -> None:
         self._current_user_service = current_user_service
         self._user_service = user_service
         self._utc_timer = utc_timer
         self._transaction_manager = transaction_manager
+        self._users_version = users_version
 
     async def execute(self, request: ChangePasswordRequest) -> None:
         logger.info("Change password: started.")
 
-        current_user = await self._current_user_service.get_current_user(for_update=True)
+        current_user = await self._current_user_service.get_current_user()
         current_password = RawPassword(request.current_password)
         new_password = RawPassword(request.new_password)
         if current_password == new_password:
             raise AuthenticationChangeError
 
+        # No row lock while hashing: commit fails if the user was changed meanwhile.
+        await self._transaction_manager.release()
         if not await self._user_service.is_password_valid(current_user, current_password):
             raise ReAuthenticationError
 
@@ -57,5 +63,6 @@ class ChangePassword:
             now=self._utc_timer.now,
         )
         await self._transaction_manager.commit()
+        await self._users_version.bump()
 
         logger.info("Change password: done.")
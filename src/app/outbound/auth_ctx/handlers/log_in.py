@@ -2,7 +2,10 @@ import logging
 from dataclasses import dataclass
 from typing import Final
 
+from app.core.commands.ports.transaction_manager import TransactionManager
 from app.core.common.authorization.current_user_service import CurrentUserService
+from app.core.common.entities.user import User
+from app.core.common.exceptions import BaseError
 from app.core.common.services.user import UserService
 from app.core.common.value_objects.raw_password import RawPassword
 from app.core.common.value_objects.username import Username
@@ -10,7 +13,9 @@ from app.outbound.auth_ctx.exceptions import (
     AlreadyAuthenticatedError,
     AuthenticationError,
 )
+from app.outbound.auth_ctx.login_throttle import ClientAddress, LoginThrottle
 from app.outbound.auth_ctx.service import AuthService
+from app.outbound.auth_ctx.sqla_password_rehasher import PasswordRehasher, RehashJob
 from app.outbound.auth_ctx.sqla_user_tx_storage import AuthSqlaUserTxStorage
 
 AUTH_ACCOUNT_INACTIVE: Final[str] = "Your account is inactive. Please contact support."
@@ -28,9 +33,11 @@ class LogIn:
     """
     - Open to everyone.
     - Authenticates registered user, sets JWT with session ID in cookies, and creates session.
+    - Repeated attempts per username and client, per username or per client are throttled before any lookup or hashing.
     - Logged-in user cannot log in again until session expires or is terminated.
     - Authentication renews automatically when accessing protected routes before expiration.
     - If JWT is invalid, expired, or session is terminated, user loses authentication.
+    - Stored password hash is upgraded to current hashing parameters after success, in the background, best-effort.
     """
 
     def __init__(
@@ -39,33 +46,59 @@ class LogIn:
         user_tx_storage: AuthSqlaUserTxStorage,
         user_service: UserService,
         auth_service: AuthService,
+        transaction_manager: TransactionManager,
+        password_rehasher: PasswordRehasher,
+        throttle: LoginThrottle,
+        client: ClientAddress | None,
     ) -> None:
         self._current_user_service = current_user_service
         self._user_tx_storage = user_tx_storage
         self._user_service = user_service
         self._auth_service = auth_service
+        self._transaction_manager = transaction_manager
+        self._password_rehasher = password_rehasher
+        self._throttle = throttle
+        self._client = client
 
     async def execute(self, request: LogInRequest) -> None:
         logger.info("Log in: started.")
 
+        username = Username(request.username)
+        password = RawPassword(request.password)
+        await self._throttle.acquire(username, self._client)
+
         try:
             await self._current_user_service.get_current_user()
             raise AlreadyAuthenticatedError
         except AuthenticationError:
             pass
 
-        username = Username(request.username)
-        password = RawPassword(request.password)
         user = await self._user_tx_storage.get_by_username(username)
         if user is None:
+            await self._throttle.record_failure(username, self._client)
             raise AuthenticationError
 
+        await self._transaction_manager.release()
         if not await self._user_service.is_password_valid(user, password):
+            await self._throttle.record_failure(username, self._client)
             raise AuthenticationError
+        await self._throttle.record_success(username, self._client)
 
         if not user.is_active:
             raise AuthenticationError(AUTH_ACCOUNT_INACTIVE)
 
         await self._auth_service.issue_session(user.id_)
+        await self._rehash_password_if_needed(user, password)
 
         logger.info("Log in: done.")
+
+    async def _rehash_password_if_needed(self, user: User, password: RawPassword) -> None:
+        try:
+            if not await self._user_service.needs_password_rehash(user):
+                return
+        except BaseError:
+            logger.warning("Log in: password rehash check skipped.", exc_info=True)
+            return
+        job = RehashJob(user_id=user.id_, verified_hash=user.password_hash, raw_password=password)
+        if not self._password_rehasher.schedule(job):
+            logger.warning("Log in: password rehash dropped, too many pending.")
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from app.core.commands.exceptions import UsernameAlreadyExistsError
 from app.core.commands.ports.flusher import Flusher
 from app.core.commands.ports.transaction_manager import TransactionManager
+from app.core.commands.ports.users_version import UsersVersion
 from app.core.commands.ports.utc_timer import UtcTimer
 from app.core.common.authorization.current_user_service import CurrentUserService
 from app.core.common.factories.id_factory import create_user_id
@@ -41,6 +42,7 @@ class SignUp:
         user_tx_storage: AuthSqlaUserTxStorage,
         flusher: Flusher,
         transaction_manager: TransactionManager,
+        users_version: UsersVersion,
     ) -> None:
         self._current_user_service = current_user_service
         self._utc_timer = utc_timer
@@ -48,6 +50,7 @@ class SignUp:
         self._user_tx_storage = user_tx_storage
         self._flusher = flusher
         self._transaction_manager = transaction_manager
+        self._users_version = users_version
 
     async def execute(self, request: SignUpRequest) -> None:
         logger.info("Sign up: started.")
@@ -60,6 +63,11 @@ class SignUp:
 
         username = Username(request.username)
         password = RawPassword(request.password)
+        # Cheap index probe before hashing; the unique constraint stays the final guard.
+        if await self._user_tx_storage.exists_by_username(username):
+            raise UsernameAlreadyExistsError
+
+        await self._transaction_manager.release()
         now = self._utc_timer.now
         user = await self._user_service.create_user_with_raw_password(
             user_id=create_user_id(),
@@ -74,5 +82,6 @@ class SignUp:
             raise
 
         await self._transaction_manager.commit()
+        await self._users_version.bump()
 
         logger.info("Sign up: done.")
@@ -1,33 +1,115 @@
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from typing import Any, ClassVar
+from uuid import UUID
 
 import jwt
 
+from app.core.common.entities.types_ import UserId
+from app.core.common.value_objects.utc_datetime import UtcDatetime
 from app.outbound.auth_ctx.jwt_types import JwtAlgorithm
 from app.outbound.auth_ctx.model import AuthSession, SessionId
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class JwtClaims:
+    session_id: SessionId
+    user_id: UserId | None
+    stateless_until: UtcDatetime | None
+
+
 class JwtProcessor:
+    """
+    Verified tokens are memoized by digest, so a cookie resent on every request is verified once.
+    - Only tokens that pass verification are cached: random tokens cost a full check and no memory.
+    - Bounded by `cache_max_entries` (least recently used go first); zero disables the cache.
+    - An entry is dropped once the token's `exp` passes, as verification would then fail.
+    """
+
     SESSION_ID_CLAIM: ClassVar[str] = "sid"
+    USER_ID_CLAIM: ClassVar[str] = "uid"
     EXPIRATION_CLAIM: ClassVar[str] = "exp"
+    STATELESS_UNTIL_CLAIM: ClassVar[str] = "svx"
 
-    def __init__(self, secret: str, algorithm: JwtAlgorithm) -> None:
+    def __init__(
+        self,
+        secret: str,
+        algorithm: JwtAlgorithm,
+        cache_max_entries: int = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
         self._secret = secret
         self._algorithm = algorithm
+        self._cache_max_entries = cache_max_entries
+        self._clock = clock
+        self._verified: OrderedDict[bytes, tuple[JwtClaims, float]] = OrderedDict()
 
-    def encode(self, auth_session: AuthSession) -> str:
+    @property
+    def cached_tokens(self) -> int:
+        return len(self._verified)
+
+    def encode(self, auth_session: AuthSession, *, stateless_until: UtcDatetime | None = None) -> str:
+        """`stateless_until` lets the token authenticate without a session lookup until then."""
         payload: dict[str, Any] = {
             self.SESSION_ID_CLAIM: auth_session.id_,
             self.EXPIRATION_CLAIM: auth_session.expiration.value.timestamp(),
         }
+        if stateless_until is not None:
+            payload[self.USER_ID_CLAIM] = str(auth_session.user_id)
+            payload[self.STATELESS_UNTIL_CLAIM] = stateless_until.value.timestamp()
         return jwt.encode(payload, key=self._secret, algorithm=self._algorithm)
 
-    def decode_session_id(self, token: str) -> SessionId | None:
+    def decode(self, token: str) -> JwtClaims | None:
+        if self._cache_max_entries <= 0:
+            claims, _ = self._verify(token)
+            return claims
+
+        digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        cached = self._verified.get(digest)
+        if cached is not None:
+            cached_claims, cached_until = cached
+            if self._clock() < cached_until:
+                self._verified.move_to_end(digest)
+                return cached_claims
+            del self._verified[digest]
+            return None
+
+        claims, expires_at = self._verify(token)
+        if claims is not None and expires_at is not None:
+            self._verified[digest] = (claims, expires_at)
+            if len(self._verified) > self._cache_max_entries:
+                self._verified.popitem(last=False)
+        return claims
+
+    def _verify(self, token: str) -> tuple[JwtClaims | None, float | None]:
         try:
             payload = jwt.decode(token, key=self._secret, algorithms=[self._algorithm])
         except jwt.PyJWTError:
+            return None, None
+
+        expiration = payload.get(self.EXPIRATION_CLAIM)
+        expires_at = float(expiration) if isinstance(expiration, int | float) else None
+        return self._parse_claims(payload), expires_at
+
+    def _parse_claims(self, payload: dict[str, Any]) -> JwtClaims | None:
+        session_id = payload.get(self.SESSION_ID_CLAIM)
+        if not isinstance(session_id, str):
             return None
 
-        value = payload.get(self.SESSION_ID_CLAIM)
-        if not isinstance(value, str):
+        user_id = payload.get(self.USER_ID_CLAIM)
+        stateless_until = payload.get(self.STATELESS_UNTIL_CLAIM)
+        if not isinstance(user_id, str) or not isinstance(stateless_until, int | float):
+            return JwtClaims(session_id=SessionId(session_id), user_id=None, stateless_until=None)
+        try:
+            parsed_user_id = UserId(UUID(user_id))
+        except ValueError:
             return None
-        return SessionId(value)
+        return JwtClaims(
+            session_id=SessionId(session_id),
+            user_id=parsed_user_id,
+            stateless_until=UtcDatetime(datetime.fromtimestamp(stateless_until, UTC)),
+        )
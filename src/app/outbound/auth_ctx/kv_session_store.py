@@ -0,0 +1,179 @@
+import json
+import time
+from abc import abstractmethod
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime
+from typing import Protocol
+from uuid import UUID
+
+from app.core.common.entities.types_ import UserId
+from app.core.common.entities.user import User
+from app.core.common.value_objects.utc_datetime import UtcDatetime
+from app.outbound.auth_ctx.model import AuthSession, SessionId
+from app.outbound.auth_ctx.revocation_set import RevokedSession
+from app.outbound.auth_ctx.session_store import AuthSessionStore
+from app.outbound.auth_ctx.sqla_user_tx_storage import AuthSqlaUserTxStorage
+
+
+class KeyValueClient(Protocol):
+    """
+    String values and string sets, each key expiring after its own TTL.
+    Commands map one-to-one onto Redis ones, so any server speaking that protocol can back it.
+    """
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> list[str | None]: ...
+
+    @abstractmethod
+    async def put(self, key: str, value: str, *, ttl_s: float, only_existing: bool = False) -> bool:
+        """Returns whether the value was written, which `only_existing` prevents for a missing key."""
+
+    @abstractmethod
+    async def delete(self, keys: Sequence[str]) -> None: ...
+
+    @abstractmethod
+    async def set_add(self, key: str, member: str, *, ttl_s: float) -> None:
+        """Adds to the set and resets its TTL."""
+
+    @abstractmethod
+    async def set_remove(self, key: str, members: Sequence[str]) -> None: ...
+
+    @abstractmethod
+    async def set_members(self, key: str) -> set[str]: ...
+
+
+class KeyValueAuthSessionStore(AuthSessionStore):
+    """
+    Sessions in a key-value backend: no WAL, no row versions, one write per log-in and refresh.
+    - A session key expires with the session. The user's set holds `<session ID> <expiration>` members,
+      pruned only once that expiration passes, so a session is in it before its key exists and until it expires.
+    - Set commands are atomic: revoking all of a user's sessions never misses an indexed one.
+      The cap is best effort: concurrent log-ins of one user may overshoot it until the next log-in.
+    - Durability is the backend's: an in-process backend forgets every session on restart.
+    - Deletions are not logged for stateless nodes, which learn of them only through their own revocations.
+    """
+
+    SESSION_KEY_PREFIX = "auth:session:"
+    USER_KEY_PREFIX = "auth:user-sessions:"
+
+    def __init__(
+        self,
+        client: KeyValueClient,
+        user_tx_storage: AuthSqlaUserTxStorage,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._client = client
+        self._user_tx_storage = user_tx_storage
+        self._clock = clock
+
+    async def add(self, session: AuthSession, *, max_per_user: int) -> list[RevokedSession]:
+        others, members = await self._get_user_sessions(session.user_id)
+        others.sort(key=lambda s: (s.expiration.value, s.id_), reverse=True)
+        evicted = others[max_per_user - 1 :]
+        if evicted:
+            await self._remove(session.user_id, evicted, members)
+        ttl_s = self._ttl_s(session)
+        if ttl_s > 0:
+            await self._client.set_add(self._user_key(session.user_id), self._member(session), ttl_s=ttl_s)
+            await self._client.put(self._session_key(session.id_), self._encode(session), ttl_s=ttl_s)
+        return [self._revoked(s) for s in evicted]
+
+    async def get_with_user(
+        self,
+        session_id: SessionId,
+        *,
+        for_update: bool = False,
+    ) -> tuple[AuthSession, User | None] | None:
+        session = await self._get(session_id)
+        if session is None:
+            return None
+        return session, await self._user_tx_storage.get_by_id(session.user_id, for_update=for_update)
+
+    async def refresh(self, session_id: SessionId, expiration: UtcDatetime) -> UtcDatetime:
+        session = await self._get(session_id)
+        if session is None:
+            return expiration
+        session.expiration = expiration
+        ttl_s = self._ttl_s(session)
+        await self._client.set_add(self._user_key(session.user_id), self._member(session), ttl_s=ttl_s)
+        # Only an existing key is overwritten, so a refresh racing a deletion cannot bring the session back.
+        await self._client.put(self._session_key(session_id), self._encode(session), ttl_s=ttl_s, only_existing=True)
+        return expiration
+
+    async def delete(self, session_id: SessionId) -> list[RevokedSession]:
+        session = await self._get(session_id)
+        if session is None:
+            return []
+        members = await self._client.set_members(self._user_key(session.user_id))
+        await self._remove(session.user_id, [session], members)
+        return [self._revoked(session)]
+
+    async def delete_all_for_user(self, user_id: UserId) -> list[RevokedSession]:
+        sessions, members = await self._get_user_sessions(user_id)
+        await self._remove(user_id, sessions, members)
+        return [self._revoked(s) for s in sessions]
+
+    async def _get(self, session_id: SessionId) -> AuthSession | None:
+        [value] = await self._client.get_many([self._session_key(session_id)])
+        return self._decode(session_id, value) if value is not None else None
+
+    async def _get_user_sessions(self, user_id: UserId) -> tuple[list[AuthSession], set[str]]:
+        members = await self._client.set_members(self._user_key(user_id))
+        now = self._clock()
+        expired = {member for member in members if self._member_expiration(member) <= now}
+        if expired:
+            await self._client.set_remove(self._user_key(user_id), sorted(expired))
+            members -= expired
+        session_ids = sorted({SessionId(self._member_session_id(member)) for member in members})
+        values = await self._client.get_many([self._session_key(id_) for id_ in session_ids])
+        sessions = [
+            self._decode(id_, value) for id_, value in zip(session_ids, values, strict=True) if value is not None
+        ]
+        return sessions, members
+
+    async def _remove(self, user_id: UserId, sessions: Sequence[AuthSession], members: set[str]) -> None:
+        if not sessions:
+            return
+        session_ids = {s.id_ for s in sessions}
+        await self._client.delete([self._session_key(id_) for id_ in sorted(session_ids)])
+        removed = sorted(member for member in members if self._member_session_id(member) in session_ids)
+        if removed:
+            await self._client.set_remove(self._user_key(user_id), removed)
+
+    def _ttl_s(self, session: AuthSession) -> float:
+        return session.expiration.value.timestamp() - self._clock()
+
+    def _session_key(self, session_id: SessionId) -> str:
+        return f"{self.SESSION_KEY_PREFIX}{session_id}"
+
+    def _user_key(self, user_id: UserId) -> str:
+        return f"{self.USER_KEY_PREFIX}{user_id}"
+
+    @staticmethod
+    def _member(session: AuthSession) -> str:
+        return f"{session.id_} {session.expiration.value.timestamp()}"
+
+    @staticmethod
+    def _member_session_id(member: str) -> str:
+        return member.partition(" ")[0]
+
+    @staticmethod
+    def _member_expiration(member: str) -> float:
+        return float(member.partition(" ")[2])
+
+    @staticmethod
+    def _revoked(session: AuthSession) -> RevokedSession:
+        return RevokedSession(session_id=session.id_, expiration=session.expiration)
+
+    @staticmethod
+    def _encode(session: AuthSession) -> str:
+        return json.dumps([str(session.user_id), session.expiration.value.timestamp()])
+
+    @staticmethod
+    def _decode(session_id: SessionId, value: str) -> AuthSession:
+        user_id, expiration = json.loads(value)
+        return AuthSession(
+            id_=session_id,
+            user_id=UserId(UUID(user_id)),
+            expiration=UtcDatetime(datetime.fromtimestamp(expiration, UTC)),
+        )
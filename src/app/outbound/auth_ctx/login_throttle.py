@@ -0,0 +1,190 @@
+import json
+import time
+from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, replace
+from typing import NewType, Protocol
+
+from app.core.common.value_objects.username import Username
+from app.outbound.auth_ctx.exceptions import LoginThrottledError
+from app.outbound.auth_ctx.kv_session_store import KeyValueClient
+
+ClientAddress = NewType("ClientAddress", str)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ThrottleState:
+    tokens: float
+    updated_at: float
+    failures: int = 0
+    last_failure_at: float = 0.0
+    blocked_until: float = 0.0
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ThrottlePolicy:
+    """Token bucket of `burst` attempts refilled at `refill_per_s`; backoff starts after `free_failures`."""
+
+    burst: int
+    refill_per_s: float
+    free_failures: int
+
+
+class LoginThrottleStore(Protocol):
+    """
+    Keyed throttle state. Implement over a shared backend to throttle across nodes;
+    timestamps are wall-clock seconds so they stay comparable between nodes.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> ThrottleState | None: ...
+
+    @abstractmethod
+    async def put(self, key: str, state: ThrottleState, *, ttl_s: float) -> None:
+        """`ttl_s` is how long the state matters; a store may forget it afterward."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+
+class InMemoryLoginThrottleStore(LoginThrottleStore):
+    """Per-process store for single-node deployments; least recently used keys are evicted beyond `max_keys`."""
+
+    def __init__(self, max_keys: int) -> None:
+        self._max_keys = max_keys
+        self._states: OrderedDict[str, ThrottleState] = OrderedDict()
+
+    async def get(self, key: str) -> ThrottleState | None:
+        state = self._states.get(key)
+        if state is not None:
+            self._states.move_to_end(key)
+        return state
+
+    async def put(self, key: str, state: ThrottleState, *, ttl_s: float) -> None:
+        self._states[key] = state
+        self._states.move_to_end(key)
+        while len(self._states) > self._max_keys:
+            self._states.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._states.pop(key, None)
+
+
+class KeyValueLoginThrottleStore(LoginThrottleStore):
+    """
+    Shared store: every node sees the same buckets, each key expiring once its state no longer matters.
+    Updates are read-modify-write, so concurrent attempts on one key may each spend the same token.
+    """
+
+    KEY_PREFIX = "auth:login-throttle:"
+
+    def __init__(self, client: KeyValueClient) -> None:
+        self._client = client
+
+    async def get(self, key: str) -> ThrottleState | None:
+        (value,) = await self._client.get_many([self.KEY_PREFIX + key])
+        return ThrottleState(**json.loads(value)) if value is not None else None
+
+    async def put(self, key: str, state: ThrottleState, *, ttl_s: float) -> None:
+        await self._client.put(self.KEY_PREFIX + key, json.dumps(asdict(state)), ttl_s=ttl_s)
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete([self.KEY_PREFIX + key])
+
+
+class LoginThrottle:
+    """
+    - Every attempt takes a token from the bucket of its username and client pair, from the username's bucket
+      and from the client's bucket. An attempt from an unknown client counts against the username alone.
+    - The pair's tight policy stops one client guessing a password; the username's looser one stops guessing
+      spread over many clients, while leaving room for the account's owner during such an attack.
+    - Failures beyond the policy's free ones block the key with exponential backoff.
+    - Failures are forgotten after `backoff_max_s` without a new one.
+    - A success clears the pair's failures only; the username's and client's stay,
+      as they may come from other clients or accounts.
+    """
+
+    def __init__(
+        self,
+        store: LoginThrottleStore,
+        *,
+        username_policy: ThrottlePolicy,
+        account_policy: ThrottlePolicy,
+        client_policy: ThrottlePolicy,
+        backoff_base_s: float,
+        backoff_max_s: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._store = store
+        self._username_policy = username_policy
+        self._account_policy = account_policy
+        self._client_policy = client_policy
+        self._backoff_base_s = backoff_base_s
+        self._backoff_max_s = backoff_max_s
+        self._clock = clock
+
+    async def acquire(self, username: Username, client: ClientAddress | None) -> None:
+        """Checks every key before charging any, so a rejection costs nothing."""
+        now = self._clock()
+        keys = self._keys(username, client)
+        states: dict[str, ThrottleState] = {}
+        for key, policy in keys:
+            state = self._refilled(await self._store.get(key), policy, now)
+            if state.blocked_until > now:
+                raise LoginThrottledError(retry_after_s=state.blocked_until - now)
+            if state.tokens < 1:
+                raise LoginThrottledError(retry_after_s=(1 - state.tokens) / policy.refill_per_s)
+            states[key] = state
+        for key, policy in keys:
+            state = states[key]
+            await self._store.put(key, replace(state, tokens=state.tokens - 1), ttl_s=self._ttl_s(policy))
+
+    async def record_failure(self, username: Username, client: ClientAddress | None) -> None:
+        now = self._clock()
+        for key, policy in self._keys(username, client):
+            state = self._refilled(await self._store.get(key), policy, now)
+            failures = state.failures + 1 if now - state.last_failure_at < self._backoff_max_s else 1
+            blocked_until = state.blocked_until
+            if failures > policy.free_failures:
+                backoff_s = self._backoff_base_s * 2 ** (failures - policy.free_failures - 1)
+                blocked_until = now + min(backoff_s, self._backoff_max_s)
+            await self._store.put(
+                key,
+                replace(state, failures=failures, last_failure_at=now, blocked_until=blocked_until),
+                ttl_s=self._ttl_s(policy),
+            )
+
+    async def record_success(self, username: Username, client: ClientAddress | None) -> None:
+        if client is not None:
+            await self._store.delete(self._pair_key(username, client))
+
+    def _keys(self, username: Username, client: ClientAddress | None) -> list[tuple[str, ThrottlePolicy]]:
+        account_key = (self._account_key(username), self._account_policy)
+        if client is None:
+            return [account_key]
+        return [
+            (self._pair_key(username, client), self._username_policy),
+            account_key,
+            (f"client:{client}", self._client_policy),
+        ]
+
+    @staticmethod
+    def _account_key(username: Username) -> str:
+        return f"username:{username.value.lower()}"
+
+    @classmethod
+    def _pair_key(cls, username: Username, client: ClientAddress) -> str:
+        return f"{cls._account_key(username)}:client:{client}"
+
+    def _ttl_s(self, policy: ThrottlePolicy) -> float:
+        """Until the bucket is full again and the failures are forgotten."""
+        return max(policy.burst / policy.refill_per_s, self._backoff_max_s)
+
+    @staticmethod
+    def _refilled(state: ThrottleState | None, policy: ThrottlePolicy, now: float) -> ThrottleState:
+        if state is None:
+            return ThrottleState(tokens=policy.burst, updated_at=now)
+        elapsed = max(0.0, now - state.updated_at)
+        tokens = min(float(policy.burst), state.tokens + elapsed * policy.refill_per_s)
+        return replace(state, tokens=tokens, updated_at=now)
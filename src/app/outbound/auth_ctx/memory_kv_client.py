@@ -0,0 +1,95 @@
+import heapq
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+from app.outbound.auth_ctx.kv_session_store import KeyValueClient
+
+
+@dataclass(slots=True)
+class _Shard:
+    values: dict[str, tuple[str | set[str], float]] = field(default_factory=dict)
+    # (expires_at, key); an entry is stale once its key was rewritten with another expiry
+    expiries: list[tuple[float, str]] = field(default_factory=list)
+
+
+class ShardedMemoryKeyValueClient(KeyValueClient):
+    """
+    Per-process backend for single-node and test deployments; everything is lost on restart.
+    - Keys are spread over `shard_count` dicts, each with its own expiry heap,
+      so the expired keys a write sweeps are found in the heap of one shard, not by a scan.
+    - Expired keys are also ignored on read, so a key never outlives its TTL.
+    """
+
+    def __init__(self, shard_count: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self._shards = tuple(_Shard() for _ in range(shard_count))
+        self._clock = clock
+
+    def __len__(self) -> int:
+        return sum(len(shard.values) for shard in self._shards)
+
+    async def get_many(self, keys: Sequence[str]) -> list[str | None]:
+        values: list[str | None] = []
+        for key in keys:
+            value = self._get(key)
+            values.append(value if isinstance(value, str) else None)
+        return values
+
+    async def put(self, key: str, value: str, *, ttl_s: float, only_existing: bool = False) -> bool:
+        if only_existing and self._get(key) is None:
+            return False
+        self._put(key, value, ttl_s)
+        return True
+
+    async def delete(self, keys: Sequence[str]) -> None:
+        for key in keys:
+            self._shard(key).values.pop(key, None)
+
+    async def set_add(self, key: str, member: str, *, ttl_s: float) -> None:
+        members = self._get(key)
+        updated = set(members) if isinstance(members, set) else set()
+        updated.add(member)
+        self._put(key, updated, ttl_s)
+
+    async def set_remove(self, key: str, members: Sequence[str]) -> None:
+        shard = self._shard(key)
+        current = self._get(key)
+        if not isinstance(current, set):
+            return
+        current.difference_update(members)
+        if not current:
+            del shard.values[key]
+
+    async def set_members(self, key: str) -> set[str]:
+        members = self._get(key)
+        return set(members) if isinstance(members, set) else set()
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _get(self, key: str) -> str | set[str] | None:
+        shard = self._shard(key)
+        entry = shard.values.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= self._clock():
+            del shard.values[key]
+            return None
+        return value
+
+    def _put(self, key: str, value: str | set[str], ttl_s: float) -> None:
+        shard = self._shard(key)
+        now = self._clock()
+        self._sweep(shard, now)
+        expires_at = now + ttl_s
+        shard.values[key] = (value, expires_at)
+        heapq.heappush(shard.expiries, (expires_at, key))
+
+    @staticmethod
+    def _sweep(shard: _Shard, now: float) -> None:
+        while shard.expiries and shard.expiries[0][0] <= now:
+            expires_at, key = heapq.heappop(shard.expiries)
+            entry = shard.values.get(key)
+            if entry is not None and entry[1] == expires_at:
+                del shard.values[key]
@@ -0,0 +1,90 @@
+import logging
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import cast
+
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.backoff import NoBackoff
+from redis.exceptions import RedisError
+from redis.retry import Retry
+
+from app.outbound.auth_ctx.kv_session_store import KeyValueClient
+from app.outbound.exceptions import StorageError
+
+logger = logging.getLogger(__name__)
+
+
+class RedisKeyValueClient(KeyValueClient):
+    """
+    `redis-py` client over a pool of at most `pool_size` connections: Redis, Valkey
+    or any server speaking the commands used here can serve as the backend.
+    - A command waits up to `timeout_s` for a free connection, and as long again for each round trip.
+    - Failed commands are not retried; failures surface as `StorageError`.
+    """
+
+    def __init__(self, host: str, port: int, pool_size: int, timeout_s: float) -> None:
+        pool = BlockingConnectionPool(
+            host=host,
+            port=port,
+            max_connections=pool_size,
+            timeout=timeout_s,
+            socket_timeout=timeout_s,
+            socket_connect_timeout=timeout_s,
+            retry=Retry(NoBackoff(), retries=0),
+            decode_responses=True,
+            # RESP2 is spoken by every server version and stand-in; the commands used here gain nothing from RESP3
+            protocol=2,
+        )
+        self._redis = Redis(connection_pool=pool)
+
+    async def get_many(self, keys: Sequence[str]) -> list[str | None]:
+        if not keys:
+            return []
+        with _storage_errors():
+            values = await self._redis.mget(keys)
+        # `decode_responses` makes every reply a string
+        return cast(list[str | None], values)
+
+    async def put(self, key: str, value: str, *, ttl_s: float, only_existing: bool = False) -> bool:
+        with _storage_errors():
+            written = await self._redis.set(key, value, px=_ttl_ms(ttl_s), xx=only_existing)
+        return written is not None
+
+    async def delete(self, keys: Sequence[str]) -> None:
+        if keys:
+            with _storage_errors():
+                await self._redis.delete(*keys)
+
+    async def set_add(self, key: str, member: str, *, ttl_s: float) -> None:
+        with _storage_errors():
+            async with self._redis.pipeline(transaction=False) as pipeline:
+                # Staged as raw commands: the typed ones are annotated as awaitables, which they aren't in a pipeline
+                pipeline.execute_command("SADD", key, member)
+                pipeline.execute_command("PEXPIRE", key, _ttl_ms(ttl_s))
+                await pipeline.execute()
+
+    async def set_remove(self, key: str, members: Sequence[str]) -> None:
+        if members:
+            with _storage_errors():
+                await self._redis.srem(key, *members)
+
+    async def set_members(self, key: str) -> set[str]:
+        with _storage_errors():
+            members = await self._redis.smembers(key)
+        return cast(set[str], members)
+
+    async def close(self) -> None:
+        await self._redis.aclose(close_connection_pool=True)
+
+
+def _ttl_ms(ttl_s: float) -> int:
+    return max(1, round(ttl_s * 1000))
+
+
+@contextmanager
+def _storage_errors() -> Iterator[None]:
+    try:
+        yield
+    except RedisError as e:
+        logger.warning("Key-value backend: command failed: %s.", e)
+        raise StorageError from e
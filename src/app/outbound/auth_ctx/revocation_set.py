@@ -0,0 +1,80 @@
+import hashlib
+import math
+from dataclasses import dataclass
+
+from app.core.common.value_objects.utc_datetime import UtcDatetime
+from app.outbound.auth_ctx.model import SessionId
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RevokedSession:
+    session_id: SessionId
+    expiration: UtcDatetime
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, false_positive_rate: float) -> None:
+        self._capacity = capacity
+        self._size_bits = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self._hash_count = max(1, round(self._size_bits / capacity * math.log(2)))
+        self._bits = bytearray((self._size_bits + 7) // 8)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def add(self, item: str) -> None:
+        for index in self._indexes(item):
+            self._bits[index >> 3] |= 1 << (index & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[index >> 3] & (1 << (index & 7)) for index in self._indexes(item))
+
+    def _indexes(self, item: str) -> list[int]:
+        # Double hashing: k indexes from two 64-bit halves of one digest.
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._size_bits for i in range(self._hash_count)]
+
+
+class RevocationSet:
+    """
+    Revoked sessions that have not expired yet.
+    - The bloom filter answers the common "not revoked" case; the exact set confirms its positives.
+    - Entries are dropped once their session would have expired anyway.
+    - The filter is rebuilt on pruning, growing when it runs past capacity.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01) -> None:
+        self._false_positive_rate = false_positive_rate
+        self._filter = BloomFilter(capacity, false_positive_rate)
+        self._revoked: dict[SessionId, UtcDatetime] = {}
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def __contains__(self, session_id: SessionId) -> bool:
+        return session_id in self._filter and session_id in self._revoked
+
+    def add(self, revoked: RevokedSession) -> None:
+        if revoked.session_id in self._revoked:
+            return
+        self._revoked[revoked.session_id] = revoked.expiration
+        self._filter.add(revoked.session_id)
+        if len(self._revoked) > self._filter.capacity:
+            self._rebuild()
+
+    def prune(self, now: UtcDatetime) -> None:
+        expired = [session_id for session_id, expiration in self._revoked.items() if expiration <= now]
+        if not expired:
+            return
+        for session_id in expired:
+            del self._revoked[session_id]
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        capacity = max(self._filter.capacity, 2 * len(self._revoked))
+        self._filter = BloomFilter(capacity, self._false_positive_rate)
+        for session_id in self._revoked:
+            self._filter.add(session_id)
@@ -1,74 +1,134 @@
+from typing import NewType
+
 from app.core.common.entities.types_ import UserId
+from app.core.common.entities.user import User
 from app.outbound.auth_ctx.cookie_manager import CookieManager
 from app.outbound.auth_ctx.exceptions import AuthenticationError
 from app.outbound.auth_ctx.id_factory import create_session_id
-from app.outbound.auth_ctx.jwt_processor import JwtProcessor
+from app.outbound.auth_ctx.jwt_processor import JwtClaims, JwtProcessor
 from app.outbound.auth_ctx.model import AuthSession, SessionId
-from app.outbound.auth_ctx.sqla_transaction_manager import AuthSqlaTransactionManager
-from app.outbound.auth_ctx.sqla_tx_storage import AuthSessionSqlaTxStorage
+from app.outbound.auth_ctx.revocation_set import RevocationSet
+from app.outbound.auth_ctx.session_cache import AuthSessionCache
+from app.outbound.auth_ctx.session_store import AuthSessionStore
+from app.outbound.auth_ctx.sqla_user_tx_storage import AuthSqlaUserTxStorage
 from app.outbound.auth_ctx.utc_timer import AuthSessionUtcTimer
 
+MaxSessionsPerUser = NewType("MaxSessionsPerUser", int)
+
 
 class AuthService:
     def __init__(
         self,
         session_timer: AuthSessionUtcTimer,
-        session_tx_storage: AuthSessionSqlaTxStorage,
-        transaction_manager: AuthSqlaTransactionManager,
+        session_store: AuthSessionStore,
+        user_tx_storage: AuthSqlaUserTxStorage,
         jwt_processor: JwtProcessor,
         cookie_manager: CookieManager,
+        session_cache: AuthSessionCache,
+        revocations: RevocationSet,
+        max_sessions_per_user: MaxSessionsPerUser,
     ) -> None:
         self._session_timer = session_timer
-        self._session_tx_storage = session_tx_storage
-        self._transaction_manager = transaction_manager
+        self._session_store = session_store
+        self._user_tx_storage = user_tx_storage
         self._jwt_processor = jwt_processor
         self._cookie_manager = cookie_manager
+        self._session_cache = session_cache
+        self._revocations = revocations
+        self._max_sessions_per_user = max_sessions_per_user
 
     async def issue_session(self, user_id: UserId) -> None:
+        """Evicts the user's least recently refreshed sessions beyond the cap in the same transaction."""
         session = AuthSession(
             id_=create_session_id(),
             user_id=user_id,
             expiration=self._session_timer.expiration_from_now,
         )
-        self._session_tx_storage.add(session)
-        await self._transaction_manager.commit()
-        token = self._jwt_processor.encode(session)
-        self._cookie_manager.stage_set(token)
+        evicted = await self._session_store.add(session, max_per_user=self._max_sessions_per_user)
+        for revoked in evicted:
+            self._session_cache.invalidate(revoked.session_id)
+            self._revocations.add(revoked)
+        self._stage_token(session)
 
-    async def get_current_user_id(self) -> UserId:
-        session_id = self._get_session_id()
-        if session_id is None:
+    async def get_current_user(self, *, for_update: bool = False) -> tuple[UserId, User | None]:
+        claims = self._get_claims()
+        if claims is None:
             raise AuthenticationError
 
-        session = await self._session_tx_storage.get_by_id(session_id)
-        if session is None:
+        user_id = self._authenticate_stateless(claims)
+        if user_id is None:
+            user_id = self._authenticate_cached(claims.session_id)
+        if user_id is not None:
+            return user_id, await self._user_tx_storage.get_by_id(user_id, for_update=for_update)
+
+        # A cached copy may have been revoked on another node: go to the store.
+        epoch = self._session_cache.epoch
+        loaded = await self._session_store.get_with_user(claims.session_id, for_update=for_update)
+        if loaded is None:
             raise AuthenticationError
+        session, user = loaded
+        await self._accept_session(session, epoch=epoch)
+        return session.user_id, user
+
+    def _authenticate_stateless(self, claims: JwtClaims) -> UserId | None:
+        """
+        Trusts the signed user ID until the token's stateless deadline unless the session is revoked.
+        Skips the session, not the user: the caller still loads the user by ID.
+        """
+        if not self._session_timer.is_stateless or claims.user_id is None or claims.stateless_until is None:
+            return None
+        if not self._session_timer.is_before(claims.stateless_until):
+            return None
+        if claims.session_id in self._revocations:
+            return None
+        return claims.user_id
 
+    def _authenticate_cached(self, session_id: SessionId) -> UserId | None:
+        session = self._session_cache.get(session_id)
+        if session is None or self._session_timer.needs_refresh(session) or self._session_timer.is_stateless:
+            return None
+        return session.user_id
+
+    async def _accept_session(self, session: AuthSession, *, epoch: int) -> None:
         if self._session_timer.is_expired(session):
             raise AuthenticationError
 
-        if self._session_timer.needs_refresh(session):
-            session.expiration = self._session_timer.expiration_from_now
-            await self._session_tx_storage.update(session)
-            await self._transaction_manager.commit()
-            token = self._jwt_processor.encode(session)
-            self._cookie_manager.stage_set(token)
+        refreshed = self._session_timer.needs_refresh(session)
+        if refreshed:
+            session.expiration = await self._session_store.refresh(
+                session.id_,
+                self._session_timer.expiration_from_now,
+            )
+        self._session_cache.put(session, epoch=epoch)
 
-        return session.user_id
+        if refreshed or self._session_timer.is_stateless:
+            # A stateless token that fell back here has run out of its window; grant a new one.
+            self._stage_token(session)
 
     async def logout_current_session(self) -> None:
         self._cookie_manager.stage_delete()
-        session_id = self._get_session_id()
-        if session_id is not None:
-            await self._session_tx_storage.delete(session_id)
-            await self._transaction_manager.commit()
+        claims = self._get_claims()
+        if claims is not None:
+            revoked = await self._session_store.delete(claims.session_id)
+            self._session_cache.invalidate(claims.session_id)
+            for session in revoked:
+                self._revocations.add(session)
 
     async def revoke_all_sessions(self, user_id: UserId) -> None:
-        await self._session_tx_storage.delete_all_for_user(user_id)
-        await self._transaction_manager.commit()
+        revoked = await self._session_store.delete_all_for_user(user_id)
+        self._session_cache.invalidate_user(user_id)
+        for session in revoked:
+            self._revocations.add(session)
+
+    def _stage_token(self, session: AuthSession) -> None:
+        token = self._jwt_processor.encode(
+            session,
+            stateless_until=self._session_timer.stateless_until(session),
+        )
+        self._cookie_manager.stage_set(token)
 
-    def _get_session_id(self) -> SessionId | None:
+    def _get_claims(self) -> JwtClaims | None:
         token = self._cookie_manager.read()
         if token is None:
             return None
-        return self._jwt_processor.decode_session_id(token)
+        return self._jwt_processor.decode(token)
@@ -0,0 +1,114 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from app.core.common.entities.types_ import UserId
+from app.core.common.value_objects.utc_datetime import UtcDatetime
+from app.outbound.auth_ctx.model import AuthSession, SessionId
+
+type AuthSessionCacheStats = dict[str, float]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _CachedSession:
+    user_id: UserId
+    expiration: UtcDatetime
+    stale_at: float
+
+
+class AuthSessionCache:
+    """
+    Sessions already read from the database, keyed by ID.
+    - Bounded by `max_entries` (least recently used go first) and by `ttl_s`.
+    - An entry never outlives the session's expiration.
+    - Invalidation advances the epoch; fills that started earlier are dropped,
+      so a lookup racing a revocation cannot bring the session back.
+    - Per process: a revocation on another node is seen here within `ttl_s`.
+      A zero `ttl_s` disables caching.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_s: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self._entries: OrderedDict[SessionId, _CachedSession] = OrderedDict()
+        self._by_user: dict[UserId, set[SessionId]] = {}
+        self._epoch = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def epoch(self) -> int:
+        return self._epoch
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def stats(self) -> AuthSessionCacheStats:
+        return {
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+    def get(self, session_id: SessionId) -> AuthSession | None:
+        """Returns a detached copy, safe to modify."""
+        entry = self._entries.get(session_id)
+        if entry is None:
+            self._misses += 1
+            return None
+        if entry.stale_at <= self._clock():
+            self._remove(session_id)
+            self._misses += 1
+            return None
+        self._entries.move_to_end(session_id)
+        self._hits += 1
+        return AuthSession(id_=session_id, user_id=entry.user_id, expiration=entry.expiration)
+
+    def put(self, session: AuthSession, *, epoch: int) -> None:
+        """`epoch` is the value read before the session was loaded."""
+        if epoch != self._epoch or self._ttl_s <= 0:
+            return
+        stale_at = min(self._clock() + self._ttl_s, session.expiration.value.timestamp())
+        self._remove(session.id_)
+        self._entries[session.id_] = _CachedSession(
+            user_id=session.user_id,
+            expiration=session.expiration,
+            stale_at=stale_at,
+        )
+        self._by_user.setdefault(session.user_id, set()).add(session.id_)
+        while len(self._entries) > self._max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def invalidate(self, session_id: SessionId) -> None:
+        self._epoch += 1
+        self._remove(session_id)
+
+    def invalidate_user(self, user_id: UserId) -> None:
+        self._epoch += 1
+        for session_id in self._by_user.pop(user_id, set()):
+            self._entries.pop(session_id, None)
+
+    def _remove(self, session_id: SessionId) -> None:
+        entry = self._entries.pop(session_id, None)
+        if entry is None:
+            return
+        user_sessions = self._by_user.get(entry.user_id)
+        if user_sessions is None:
+            return
+        user_sessions.discard(session_id)
+        if not user_sessions:
+            del self._by_user[entry.user_id]
@@ -0,0 +1,38 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from app.core.common.entities.types_ import UserId
+from app.core.common.entities.user import User
+from app.core.common.value_objects.utc_datetime import UtcDatetime
+from app.outbound.auth_ctx.model import AuthSession, SessionId
+from app.outbound.auth_ctx.revocation_set import RevokedSession
+
+
+class AuthSessionStore(Protocol):
+    """
+    Where sessions live. Every write is durable, to the backend's standard, once the call returns;
+    deletions return what they removed so callers can drop it from caches and revocation sets.
+    """
+
+    @abstractmethod
+    async def add(self, session: AuthSession, *, max_per_user: int) -> list[RevokedSession]:
+        """Evicts the user's least recently refreshed sessions beyond `max_per_user`, including the new one."""
+
+    @abstractmethod
+    async def get_with_user(
+        self,
+        session_id: SessionId,
+        *,
+        for_update: bool = False,
+    ) -> tuple[AuthSession, User | None] | None:
+        """The user is loaded into the primary UoW (and locked, if asked); the session comes back detached."""
+
+    @abstractmethod
+    async def refresh(self, session_id: SessionId, expiration: UtcDatetime) -> UtcDatetime:
+        """Returns the expiration to issue, which may be one already scheduled by a concurrent refresh."""
+
+    @abstractmethod
+    async def delete(self, session_id: SessionId) -> list[RevokedSession]: ...
+
+    @abstractmethod
+    async def delete_all_for_user(self, user_id: UserId) -> list[RevokedSession]: ...
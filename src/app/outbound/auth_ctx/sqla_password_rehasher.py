@@ -0,0 +1,117 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm.exc import StaleDataError
+
+from app.core.common.entities.types_ import UserId, UserPasswordHash
+from app.core.common.entities.user import User
+from app.core.common.exceptions import BaseError
+from app.core.common.services.user import UserService
+from app.core.common.value_objects.raw_password import RawPassword
+from app.outbound.auth_ctx.utc_timer import AuthSessionUtcTimer
+from app.outbound.exceptions import StorageError
+from app.outbound.persistence_sqla.mappings.user import users_version_seq
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RehashJob:
+    user_id: UserId
+    verified_hash: UserPasswordHash
+    raw_password: RawPassword
+
+
+class PasswordRehasher:
+    """
+    Upgrades stored password hashes to the current parameters off the log-in path.
+    - Log-ins queue the password they verified; one background task works through the queue.
+    - Hashes at the hasher's lowest priority, which only takes idle capacity: a busy hasher skips the job.
+    - At most `max_pending` jobs wait; beyond that, and on shutdown, jobs are dropped.
+      A dropped job costs nothing but the upgrade, which the user's next log-in retries.
+    - The new hash is written only if the user still has the verified one,
+      and not over a change made concurrently.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        user_service: UserService,
+        utc_timer: AuthSessionUtcTimer,
+        max_pending: int,
+    ) -> None:
+        self._session_factory = session_factory
+        self._user_service = user_service
+        self._utc_timer = utc_timer
+        self._jobs: asyncio.Queue[RehashJob] = asyncio.Queue(maxsize=max_pending)
+
+    @property
+    def pending(self) -> int:
+        return self._jobs.qsize()
+
+    def schedule(self, job: RehashJob) -> bool:
+        """Returns False if the queue is full and the job was dropped."""
+        try:
+            self._jobs.put_nowait(job)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def rehash(self, job: RehashJob) -> bool:
+        """Returns whether a new hash was stored."""
+        async with self._session_factory() as session:
+            try:
+                user = await session.get(User, job.user_id)
+                # Hands the connection back for the length of the hash
+                await session.commit()
+            except SQLAlchemyError as e:
+                raise StorageError from e
+            if user is None or user.password_hash != job.verified_hash:
+                return False
+            if not await self._user_service.rehash_password_if_needed(
+                user,
+                job.raw_password,
+                now=self._utc_timer.now,
+            ):
+                return False
+            try:
+                await session.commit()
+            except StaleDataError:
+                return False
+            except SQLAlchemyError as e:
+                raise StorageError from e
+            await self._bump_users_version(session)
+        return True
+
+    async def join(self) -> None:
+        """Waits until every queued job is done."""
+        await self._jobs.join()
+
+    async def run(self) -> None:
+        while True:
+            job = await self._jobs.get()
+            try:
+                if await self.rehash(job):
+                    logger.info("Password rehash: hash upgraded.")
+            except BaseError:
+                logger.warning("Password rehash: skipped, retried on the next log-in.", exc_info=True)
+            finally:
+                self._jobs.task_done()
+
+    def close(self) -> None:
+        """Drops queued jobs, and the passwords they hold, on shutdown."""
+        while not self._jobs.empty():
+            self._jobs.get_nowait()
+            self._jobs.task_done()
+
+    @staticmethod
+    async def _bump_users_version(session: AsyncSession) -> None:
+        try:
+            await session.execute(select(users_version_seq.next_value()))
+            await session.commit()
+        except SQLAlchemyError as e:
+            logger.warning("Password rehash: users version bump failed: %s.", e)
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+
+from sqlalchemy import DateTime, String, column, update, values
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.common.value_objects.utc_datetime import UtcDatetime
+from app.outbound.auth_ctx.model import SessionId
+from app.outbound.exceptions import StorageError
+from app.outbound.persistence_sqla.mappings.auth_session import auth_sessions_table
+
+logger = logging.getLogger(__name__)
+
+
+class AuthSessionRefreshWriter:
+    """
+    Write-behind for session expiration bumps.
+    - Concurrent refreshes of one session share the first scheduled expiration and a single write.
+    - Pending bumps are flushed in one `UPDATE ... FROM (VALUES ...)` per interval.
+    - An update never moves an expiration backwards and never recreates a deleted session.
+    - Bumps not yet flushed are lost on a crash: the session then expires at its previous time.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        flush_interval_s: float,
+    ) -> None:
+        self._session_factory = session_factory
+        self._flush_interval_s = flush_interval_s
+        self._pending: dict[SessionId, UtcDatetime] = {}
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def schedule(self, session_id: SessionId, expiration: UtcDatetime) -> UtcDatetime:
+        """Returns the expiration to issue, which is the pending one if a refresh is already queued."""
+        return self._pending.setdefault(session_id, expiration)
+
+    async def flush(self) -> int:
+        """Returns the number of sessions written."""
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, {}
+        bumps = values(
+            column("id", String),
+            column("expiration", DateTime(timezone=True)),
+            name="bumps",
+        ).data([(session_id, expiration.value) for session_id, expiration in batch.items()])
+        stmt = (
+            update(auth_sessions_table)
+            .where(auth_sessions_table.c.id == bumps.c.id)
+            .where(auth_sessions_table.c.expiration < bumps.c.expiration)
+            .values(expiration=bumps.c.expiration)
+        )
+        try:
+            async with self._session_factory() as session:
+                await session.execute(stmt)
+                await session.commit()
+        except SQLAlchemyError as e:
+            for session_id, expiration in batch.items():
+                self._pending[session_id] = max(expiration, self._pending.get(session_id, expiration))
+            raise StorageError from e
+        return len(batch)
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval_s)
+            try:
+                await self.flush()
+            except StorageError:
+                logger.exception("Session refresh: flush failed, retrying in %ss.", self._flush_interval_s)
+
+    async def close(self) -> None:
+        """Final flush on shutdown."""
+        try:
+            await self.flush()
+        except StorageError:
+            logger.exception("Session refresh: final flush failed, %s bumps lost.", len(self._pending))
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Final
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.common.value_objects.utc_datetime import UtcDatetime
+from app.outbound.auth_ctx.model import SessionId
+from app.outbound.auth_ctx.revocation_set import RevocationSet, RevokedSession
+from app.outbound.exceptions import StorageError
+from app.outbound.persistence_sqla.mappings.auth_session import auth_session_revocations_table
+
+logger = logging.getLogger(__name__)
+
+# Rows are stamped at transaction start, so a slow transaction can commit a row stamped before the last poll.
+LATE_COMMIT_OVERLAP: Final[timedelta] = timedelta(seconds=10)
+
+
+class AuthSessionRevocationFeed:
+    """
+    Keeps a `RevocationSet` in step with the revocation log written by every node.
+    - Each poll reads rows stamped since the previous poll, minus an overlap for late commits.
+    - Log rows of sessions that have expired anyway are deleted.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        revocations: RevocationSet,
+        poll_interval_s: float,
+    ) -> None:
+        self._session_factory = session_factory
+        self._revocations = revocations
+        self._poll_interval_s = poll_interval_s
+        self._last_polled_at: datetime | None = None
+
+    async def poll(self) -> int:
+        """Returns the number of rows read."""
+        table = auth_session_revocations_table
+        stmt = select(table.c.session_id, table.c.expiration).where(table.c.expiration > func.now())
+        if self._last_polled_at is not None:
+            stmt = stmt.where(table.c.revoked_at >= self._last_polled_at - LATE_COMMIT_OVERLAP)
+        try:
+            async with self._session_factory() as session:
+                polled_at = await session.scalar(select(func.now()))
+                rows = (await session.execute(stmt)).all()
+                await session.execute(delete(table).where(table.c.expiration <= func.now()))
+                await session.commit()
+        except SQLAlchemyError as e:
+            raise StorageError from e
+
+        for session_id, expiration in rows:
+            self._revocations.add(RevokedSession(session_id=SessionId(session_id), expiration=UtcDatetime(expiration)))
+        self._last_polled_at = polled_at
+        self._revocations.prune(UtcDatetime(datetime.now(UTC)))
+        return len(rows)
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self._poll_interval_s)
+            try:
+                await self.poll()
+            except StorageError:
+                logger.exception("Revocation feed: poll failed, retrying in %ss.", self._poll_interval_s)
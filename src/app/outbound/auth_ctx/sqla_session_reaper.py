@@ -0,0 +1,83 @@
+import asyncio
+import logging
+import random
+from collections.abc import Callable
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, delete, func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.outbound.exceptions import StorageError
+from app.outbound.persistence_sqla.mappings.auth_session import auth_sessions_table
+
+logger = logging.getLogger(__name__)
+
+
+class ExpiredSessionReaper:
+    """
+    Deletes expired sessions in the background.
+    - Batches of at most `batch_size` rows, each in its own short transaction.
+    - `SKIP LOCKED` lets workers reaping at the same time take disjoint rows.
+    - Runs are jittered by ±50% of `interval_s` so workers started together spread out,
+      and batches are separated by `batch_pause_s` to leave the pool to requests.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int,
+        interval_s: float,
+        batch_pause_s: float,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._interval_s = interval_s
+        self._batch_pause_s = batch_pause_s
+        self._jitter = jitter
+        self._removed = 0
+
+    @property
+    def removed(self) -> int:
+        """Total since startup."""
+        return self._removed
+
+    async def reap_batch(self) -> int:
+        expired = (
+            select(auth_sessions_table.c.id)
+            .where(auth_sessions_table.c.expiration < func.now())
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = delete(auth_sessions_table).where(auth_sessions_table.c.id.in_(expired.scalar_subquery()))
+        try:
+            async with self._session_factory() as session:
+                result = cast(CursorResult[Any], await session.execute(stmt))
+                await session.commit()
+        except SQLAlchemyError as e:
+            raise StorageError from e
+        removed = result.rowcount
+        self._removed += removed
+        return removed
+
+    async def reap(self) -> int:
+        """Deletes batches until one comes back short; returns the number of rows removed."""
+        total = 0
+        while True:
+            removed = await self.reap_batch()
+            total += removed
+            if removed < self._batch_size:
+                return total
+            await asyncio.sleep(self._batch_pause_s)
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval_s * (0.5 + self._jitter()))
+            try:
+                removed = await self.reap()
+            except StorageError:
+                logger.exception("Session reaper: run failed, retrying later.")
+                continue
+            if removed:
+                logger.info("Session reaper: removed %s expired sessions.", removed)
@@ -0,0 +1,57 @@
+from app.core.common.entities.types_ import UserId
+from app.core.common.entities.user import User
+from app.core.common.value_objects.utc_datetime import UtcDatetime
+from app.outbound.auth_ctx.model import AuthSession, SessionId
+from app.outbound.auth_ctx.revocation_set import RevokedSession
+from app.outbound.auth_ctx.session_store import AuthSessionStore
+from app.outbound.auth_ctx.sqla_refresh_writer import AuthSessionRefreshWriter
+from app.outbound.auth_ctx.sqla_transaction_manager import AuthSqlaTransactionManager
+from app.outbound.auth_ctx.sqla_tx_storage import AuthSessionSqlaTxStorage
+from app.outbound.auth_ctx.sqla_user_tx_storage import AuthSqlaUserTxStorage
+
+
+class SqlaAuthSessionStore(AuthSessionStore):
+    """
+    Sessions in Postgres, next to the users.
+    - The session and its user come back in one query.
+    - Refreshes are written behind in batches; deletions are logged for stateless nodes.
+    """
+
+    def __init__(
+        self,
+        session_tx_storage: AuthSessionSqlaTxStorage,
+        user_tx_storage: AuthSqlaUserTxStorage,
+        transaction_manager: AuthSqlaTransactionManager,
+        refresh_writer: AuthSessionRefreshWriter,
+    ) -> None:
+        self._session_tx_storage = session_tx_storage
+        self._user_tx_storage = user_tx_storage
+        self._transaction_manager = transaction_manager
+        self._refresh_writer = refresh_writer
+
+    async def add(self, session: AuthSession, *, max_per_user: int) -> list[RevokedSession]:
+        evicted = await self._session_tx_storage.delete_oldest_for_user(session.user_id, keep=max_per_user - 1)
+        self._session_tx_storage.add(session)
+        await self._transaction_manager.commit()
+        return evicted
+
+    async def get_with_user(
+        self,
+        session_id: SessionId,
+        *,
+        for_update: bool = False,
+    ) -> tuple[AuthSession, User | None] | None:
+        return await self._user_tx_storage.get_with_session(session_id, for_update=for_update)
+
+    async def refresh(self, session_id: SessionId, expiration: UtcDatetime) -> UtcDatetime:
+        return self._refresh_writer.schedule(session_id, expiration)
+
+    async def delete(self, session_id: SessionId) -> list[RevokedSession]:
+        revoked = await self._session_tx_storage.delete(session_id)
+        await self._transaction_manager.commit()
+        return revoked
+
+    async def delete_all_for_user(self, user_id: UserId) -> list[RevokedSession]:
+        revoked = await self._session_tx_storage.delete_all_for_user(user_id)
+        await self._transaction_manager.commit()
+        return revoked
@@ -8,6 +8,8 @@ from app.outbound.exceptions import StorageError
 
 DB_COMMIT_DONE: Final[str] = "Commit was done."
 DB_COMMIT_FAILED: Final[str] = "Commit failed."
+DB_RELEASE_DONE: Final[str] = "Connection was released."
+DB_RELEASE_FAILED: Final[str] = "Connection release failed."
 
 logger = logging.getLogger(__name__)
 
@@ -23,3 +25,12 @@ class AuthSqlaTransactionManager:
 
         except SQLAlchemyError as e:
             raise StorageError(DB_COMMIT_FAILED) from e
+
+    async def release(self) -> None:
+        """Commits instead of closing so loaded objects stay attached and can be changed later."""
+        try:
+            await self._session.commit()
+            logger.debug("%s.", DB_RELEASE_DONE)
+
+        except SQLAlchemyError as e:
+            raise StorageError(DB_RELEASE_FAILED) from e
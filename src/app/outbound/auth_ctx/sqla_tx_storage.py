@@ -1,11 +1,17 @@
-from sqlalchemy import delete
+from sqlalchemy import Delete, delete, insert, select
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.common.entities.types_ import UserId
+from app.core.common.value_objects.utc_datetime import UtcDatetime
 from app.outbound.auth_ctx.model import AuthSession, SessionId
+from app.outbound.auth_ctx.revocation_set import RevokedSession
 from app.outbound.auth_ctx.types_ import AuthAsyncSession
 from app.outbound.exceptions import StorageError
-from app.outbound.persistence_sqla.mappings.auth_session import auth_sessions_table
+from app.outbound.persistence_sqla.mappings.auth_session import (
+    auth_session_revocations_table,
+    auth_sessions_table,
+)
+from app.outbound.persistence_sqla.mappings.user import users_table
 
 
 class AuthSessionSqlaTxStorage:
@@ -18,37 +24,43 @@ class AuthSessionSqlaTxStorage:
         except SQLAlchemyError as e:
             raise StorageError from e
 
-    async def get_by_id(
-        self,
-        session_id: SessionId,
-        *,
-        for_update: bool = False,
-    ) -> AuthSession | None:
-        try:
-            return await self._session.get(
-                AuthSession,
-                session_id,
-                with_for_update=for_update,
-            )
-        except SQLAlchemyError as e:
-            raise StorageError from e
+    async def delete(self, session_id: SessionId) -> list[RevokedSession]:
+        return await self._revoke(delete(auth_sessions_table).where(auth_sessions_table.c.id == session_id))
 
-    async def update(self, auth_session: AuthSession) -> None:
-        try:
-            await self._session.merge(auth_session)
-        except SQLAlchemyError as e:
-            raise StorageError from e
+    async def delete_all_for_user(self, user_id: UserId) -> list[RevokedSession]:
+        return await self._revoke(delete(auth_sessions_table).where(auth_sessions_table.c.user_id == user_id))
 
-    async def delete(self, session_id: SessionId) -> None:
-        stmt = delete(auth_sessions_table).where(auth_sessions_table.c.id == session_id)
+    async def delete_oldest_for_user(self, user_id: UserId, *, keep: int) -> list[RevokedSession]:
+        """
+        Deletes all but the user's `keep` sessions that expire last, i.e. those least recently refreshed.
+        Locks the user row first, so concurrent log-ins of one user evict in turn and never overshoot.
+        """
+        lock_user = select(users_table.c.id).where(users_table.c.id == user_id).with_for_update(key_share=True)
+        oldest = (
+            select(auth_sessions_table.c.id)
+            .where(auth_sessions_table.c.user_id == user_id)
+            .order_by(auth_sessions_table.c.expiration.desc(), auth_sessions_table.c.id.desc())
+            .offset(keep)
+        )
         try:
-            await self._session.execute(stmt)
+            await self._session.execute(lock_user)
         except SQLAlchemyError as e:
             raise StorageError from e
+        return await self._revoke(
+            delete(auth_sessions_table).where(auth_sessions_table.c.id.in_(oldest.scalar_subquery()))
+        )
 
-    async def delete_all_for_user(self, user_id: UserId) -> None:
-        stmt = delete(auth_sessions_table).where(auth_sessions_table.c.user_id == user_id)
+    async def _revoke(self, stmt: Delete) -> list[RevokedSession]:
+        """Deletes and logs the sessions in one transaction, so other nodes can't miss the revocation."""
+        returning = stmt.returning(auth_sessions_table.c.id, auth_sessions_table.c.expiration)
         try:
-            await self._session.execute(stmt)
+            rows = (await self._session.execute(returning)).all()
+            revoked = [RevokedSession(session_id=SessionId(id_), expiration=UtcDatetime(exp)) for id_, exp in rows]
+            if revoked:
+                await self._session.execute(
+                    insert(auth_session_revocations_table),
+                    [{"session_id": r.session_id, "expiration": r.expiration.value} for r in revoked],
+                )
         except SQLAlchemyError as e:
             raise StorageError from e
+        return revoked
@@ -1,10 +1,14 @@
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.common.entities.types_ import UserId
 from app.core.common.entities.user import User
 from app.core.common.value_objects.username import Username
+from app.core.common.value_objects.utc_datetime import UtcDatetime
+from app.outbound.auth_ctx.model import AuthSession, SessionId
 from app.outbound.exceptions import StorageError
+from app.outbound.persistence_sqla.mappings.auth_session import auth_sessions_table
 from app.outbound.persistence_sqla.mappings.user import users_table
 
 
@@ -18,6 +22,48 @@ class AuthSqlaUserTxStorage:
         except SQLAlchemyError as e:
             raise StorageError from e
 
+    async def get_by_id(
+        self,
+        user_id: UserId,
+        *,
+        for_update: bool = False,
+    ) -> User | None:
+        try:
+            return await self._session.get(
+                User,
+                user_id,
+                with_for_update=for_update,
+            )
+        except SQLAlchemyError as e:
+            raise StorageError from e
+
+    async def get_with_session(
+        self,
+        session_id: SessionId,
+        *,
+        for_update: bool = False,
+    ) -> tuple[AuthSession, User] | None:
+        """
+        One round trip for the session and its user. The user is loaded into this UoW
+        (and locked, if asked) while the session comes back detached, as a plain value.
+        """
+        stmt = (
+            select(User, auth_sessions_table.c.expiration)
+            .join(auth_sessions_table, auth_sessions_table.c.user_id == users_table.c.id)
+            .where(auth_sessions_table.c.id == session_id)
+        )
+        if for_update:
+            stmt = stmt.with_for_update(of=users_table)
+        try:
+            row = (await self._session.execute(stmt)).one_or_none()
+        except SQLAlchemyError as e:
+            raise StorageError from e
+        if row is None:
+            return None
+        user, expiration = row
+        session = AuthSession(id_=session_id, user_id=user.id_, expiration=UtcDatetime(expiration))
+        return session, user
+
     async def get_by_username(
         self,
         username: Username,
@@ -32,3 +78,10 @@ class AuthSqlaUserTxStorage:
         except SQLAlchemyError as e:
             raise StorageError from e
         return result.scalar_one_or_none()
+
+    async def exists_by_username(self, username: Username) -> bool:
+        stmt = select(exists().where(users_table.c.username == username.value))
+        try:
+            return bool(await self._session.scalar(stmt))
+        except SQLAlchemyError as e:
+            raise StorageError from e
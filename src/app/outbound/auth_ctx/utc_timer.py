@@ -9,9 +9,15 @@ class AuthSessionUtcTimer:
         self,
         ttl: timedelta,
         refresh_threshold_ratio: float,
+        stateless_ttl: timedelta | None = None,
     ) -> None:
         self._ttl = ttl
         self._refresh_threshold_ratio = refresh_threshold_ratio
+        self._stateless_ttl = stateless_ttl
+
+    @property
+    def is_stateless(self) -> bool:
+        return self._stateless_ttl is not None
 
     @property
     def now(self) -> UtcDatetime:
@@ -27,3 +33,11 @@ class AuthSessionUtcTimer:
     def needs_refresh(self, session: AuthSession) -> bool:
         remaining = session.expiration.value - self.now.value
         return remaining <= self._ttl * self._refresh_threshold_ratio
+
+    def stateless_until(self, session: AuthSession) -> UtcDatetime | None:
+        if self._stateless_ttl is None:
+            return None
+        return min(UtcDatetime(self.now.value + self._stateless_ttl), session.expiration)
+
+    def is_before(self, moment: UtcDatetime) -> bool:
+        return self.now < moment
@@ -0,0 +1,49 @@
+"""auth_session_revocations
+
+Revision ID: 5b1e9d2c7a40
+Revises: c025baa8044e
+Create Date: 2026-10-18 10:15:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b1e9d2c7a40"
+down_revision: str | Sequence[str] | None = "c025baa8044e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "auth_session_revocations",
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False), nullable=False),
+        sa.Column("session_id", sa.String(), nullable=False),
+        sa.Column("expiration", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_auth_session_revocations")),
+    )
+    op.create_index(
+        op.f("ix_auth_session_revocations_expiration"),
+        "auth_session_revocations",
+        ["expiration"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_auth_session_revocations_revoked_at"),
+        "auth_session_revocations",
+        ["revoked_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_auth_session_revocations_revoked_at"), table_name="auth_session_revocations")
+    op.drop_index(op.f("ix_auth_session_revocations_expiration"), table_name="auth_session_revocations")
+    op.drop_table("auth_session_revocations")
@@ -0,0 +1,56 @@
+"""auth_sessions indexes
+
+Revision ID: 8f3a61d0b9c2
+Revises: 5b1e9d2c7a40
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8f3a61d0b9c2"
+down_revision: str | Sequence[str] | None = "5b1e9d2c7a40"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built without blocking writes to a live table; CONCURRENTLY can't run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_auth_sessions_user_id"),
+            "auth_sessions",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f("ix_auth_sessions_expiration"),
+            "auth_sessions",
+            ["expiration"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_auth_sessions_expiration"),
+            table_name="auth_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            op.f("ix_auth_sessions_user_id"),
+            table_name="auth_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
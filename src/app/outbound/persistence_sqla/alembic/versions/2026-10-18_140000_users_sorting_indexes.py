@@ -0,0 +1,46 @@
+"""users sorting indexes
+
+Revision ID: 3d7e2b9a4c15
+Revises: 8f3a61d0b9c2
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3d7e2b9a4c15"
+down_revision: str | Sequence[str] | None = "8f3a61d0b9c2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SORTING_FIELDS: tuple[str, ...] = ("username", "role", "is_active", "created_at", "updated_at")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built without blocking writes to a live table; CONCURRENTLY can't run inside a transaction.
+    with op.get_context().autocommit_block():
+        for field in SORTING_FIELDS:
+            op.create_index(
+                op.f(f"ix_users_{field}_id"),
+                "users",
+                [field, "id"],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for field in reversed(SORTING_FIELDS):
+            op.drop_index(
+                op.f(f"ix_users_{field}_id"),
+                table_name="users",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
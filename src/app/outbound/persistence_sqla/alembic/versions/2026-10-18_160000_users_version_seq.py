@@ -0,0 +1,28 @@
+"""users version sequence
+
+Revision ID: 9c4a7f1e2b63
+Revises: 3d7e2b9a4c15
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4a7f1e2b63"
+down_revision: str | Sequence[str] | None = "3d7e2b9a4c15"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.schema.CreateSequence(sa.Sequence("users_version_seq")))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(sa.schema.DropSequence(sa.Sequence("users_version_seq")))
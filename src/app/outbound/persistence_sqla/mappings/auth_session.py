@@ -1,4 +1,4 @@
-from sqlalchemy import UUID, Column, DateTime, ForeignKey, String, Table
+from sqlalchemy import UUID, BigInteger, Column, DateTime, ForeignKey, Identity, String, Table, func
 from sqlalchemy.orm import composite
 
 from app.core.common.value_objects.utc_datetime import UtcDatetime
@@ -14,8 +14,21 @@ auth_sessions_table = Table(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
+        # Revoke-all and the cascade from `users` look sessions up by user
+        index=True,
     ),
-    Column("expiration", DateTime(timezone=True), nullable=False),
+    # Expired-session reaping
+    Column("expiration", DateTime(timezone=True), nullable=False, index=True),
+)
+
+# Append-only log of deleted sessions, read by nodes that authenticate statelessly.
+auth_session_revocations_table = Table(
+    "auth_session_revocations",
+    mapper_registry.metadata,
+    Column("id", BigInteger, Identity(), primary_key=True),
+    Column("session_id", String, nullable=False),
+    Column("expiration", DateTime(timezone=True), nullable=False, index=True),
+    Column("revoked_at", DateTime(timezone=True), nullable=False, server_default=func.now(), index=True),
 )
 
 
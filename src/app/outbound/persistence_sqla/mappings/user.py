@@ -1,6 +1,6 @@
 from enum import StrEnum
 
-from sqlalchemy import UUID, Boolean, Column, DateTime, Enum, LargeBinary, String, Table
+from sqlalchemy import UUID, Boolean, Column, DateTime, Enum, Index, LargeBinary, Sequence, String, Table
 from sqlalchemy.orm import composite
 
 from app.core.common.entities.types_ import UserRole
@@ -35,8 +35,18 @@ users_table = Table(
     Column("is_active", Boolean, nullable=False),
     Column("created_at", DateTime(timezone=True), nullable=False),
     Column("updated_at", DateTime(timezone=True), nullable=False),
+    # One per `UserSortingField`, in the (field, id) order the listings sort and seek by;
+    # scanned backward for descending order
+    Index("ix_users_username_id", "username", "id"),
+    Index("ix_users_role_id", "role", "id"),
+    Index("ix_users_is_active_id", "is_active", "id"),
+    Index("ix_users_created_at_id", "created_at", "id"),
+    Index("ix_users_updated_at_id", "updated_at", "id"),
 )
 
+# Advanced after every committed change to a user; read listings are cached per value
+users_version_seq = Sequence("users_version_seq", metadata=mapper_registry.metadata)
+
 
 def map_users_table() -> None:
     mapper_registry.map_imperatively(
@@ -52,4 +62,8 @@ def map_users_table() -> None:
             "updated_at": composite(UtcDatetime, users_table.c.updated_at),
         },
         column_prefix="__",
+        # Optimistic check: UPDATE ... WHERE updated_at = <loaded value>; every change bumps it.
+        # Lets commands hash passwords without holding a row lock.
+        version_id_col=users_table.c.updated_at,
+        version_id_generator=False,
     )
@@ -0,0 +1,118 @@
+from typing import Any
+
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction, UOWTransaction
+
+_ISOLATION_LEVEL_KEY = "request_connection_isolation_level"
+
+
+class RequestConnection:
+    """
+    One pooled connection shared by the sessions of a request, held by one unit of work at a time.
+    - Checked out on first use, not when the request starts. The holding session runs its own transaction on it,
+      so a commit or rollback affects that session's work only.
+    - A session starting while another holds the connection takes it over if the holder has only read:
+      the holder's transaction is committed first, and its next statement starts a new transaction
+      with a new snapshot once the connection is free again.
+      Under read committed every statement takes a new snapshot anyway, so the holder cannot tell;
+      under a stricter isolation level the connection is never handed over.
+      Raw SQL such as `SET LOCAL` pins the connection like a write, but transaction-scoped state taken
+      by a plain select, such as `pg_advisory_xact_lock()`, is released by a handover.
+    - Otherwise the newcomer gets a dedicated connection for its transaction, as without sharing.
+    - Once the holder's transaction ends, the connection goes back to the pool,
+      so slow work between units of work holds no slot.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+        self._connection: Connection | None = None
+        self._holder: RequestConnectionSession | None = None
+        self._handing_over = False
+        self._dedicated: dict[RequestConnectionSession, Connection] = {}
+
+    def acquire(self, session: "RequestConnectionSession") -> Connection:
+        if session is self._holder and self._connection is not None:
+            return self._connection
+        dedicated = self._dedicated.get(session)
+        if dedicated is not None:
+            return dedicated
+        if self._holder is not None:
+            if not (self._holder.can_hand_over and self._reads_committed()):
+                connection = self._dedicated[session] = self._engine.connect()
+                return connection
+            self._handing_over = True
+            try:
+                self._holder.commit()
+            finally:
+                self._handing_over = False
+        if self._connection is None:
+            self._connection = self._engine.connect()
+        self._holder = session
+        return self._connection
+
+    def _reads_committed(self) -> bool:
+        connection = self._connection
+        if connection is None:
+            return True
+        level: str | None = connection.get_execution_options().get("isolation_level")
+        if level is None:
+            # The level the pooled connection runs at without overrides; asking costs a round trip, so once
+            if _ISOLATION_LEVEL_KEY not in connection.info:
+                connection.info[_ISOLATION_LEVEL_KEY] = connection.get_isolation_level()
+            level = connection.info[_ISOLATION_LEVEL_KEY]
+        return level == "READ COMMITTED"
+
+    def release(self, session: "RequestConnectionSession") -> None:
+        if session is self._holder:
+            self._holder = None
+            if not self._handing_over and self._connection is not None:
+                connection, self._connection = self._connection, None
+                connection.close()
+            return
+        dedicated = self._dedicated.pop(session, None)
+        if dedicated is not None:
+            dedicated.close()
+
+    def close(self) -> None:
+        """Returns every connection, discarding work of sessions that were never closed."""
+        connections = [*self._dedicated.values(), self._connection]
+        self._connection, self._holder = None, None
+        self._dedicated.clear()
+        for connection in connections:
+            if connection is not None:
+                connection.close()
+
+
+class RequestConnectionSession(Session):
+    """
+    Sync session for `AsyncSession(sync_session_class=...)` that runs on the request connection.
+    - Writes, flushes and locking reads pin the connection to this session until its transaction ends.
+    """
+
+    def __init__(self, *args: Any, request_connection: RequestConnection, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._request_connection = request_connection
+        self._has_written = False
+        event.listen(self, "after_transaction_end", self._on_transaction_end)
+        event.listen(self, "do_orm_execute", self._on_execute)
+        event.listen(self, "after_flush", self._on_flush)
+
+    @property
+    def can_hand_over(self) -> bool:
+        return not self._has_written and not (self.new or self.dirty or self.deleted)
+
+    def get_bind(self, *args: Any, **kwargs: Any) -> Connection:
+        return self._request_connection.acquire(self)
+
+    def _on_transaction_end(self, _session: Session, transaction: SessionTransaction) -> None:
+        if transaction.parent is None:
+            self._has_written = False
+            self._request_connection.release(self)
+
+    def _on_execute(self, state: ORMExecuteState) -> None:
+        # Row locks taken by FOR UPDATE are work a handover commit would give up.
+        if not state.is_select or getattr(state.statement, "_for_update_arg", None) is not None:
+            self._has_written = True
+
+    def _on_flush(self, _session: Session, _flush_context: UOWTransaction) -> None:
+        self._has_written = True
@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from dishka import Provider, Scope, provide
+
+from app.core.common.ports.password_hasher import PasswordHasher
+from app.main.config.loader import load_password_hasher_settings
+from app.main.config.settings import AppSettings
+from app.main.run import make_app
+from app.outbound.adapters.peppered_password_hasher import HasherThreadPoolExecutor, PasswordHashEngines
+from app.outbound.adapters.socket_password_hasher import SocketPasswordHasher
+
+
+class InProcessHasherForbiddenProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    def provide_executor(self) -> HasherThreadPoolExecutor:
+        raise AssertionError("Hasher threads built in daemon mode")
+
+    @provide
+    def provide_engines(self) -> PasswordHashEngines:
+        raise AssertionError("Hash engines calibrated in daemon mode")
+
+
+async def test_daemon_mode_builds_only_the_socket_client(tmp_path: Path) -> None:
+    settings = load_password_hasher_settings().model_copy(update={"DAEMON_SOCKET_PATH": tmp_path / "hasher.sock"})
+    app = make_app(
+        InProcessHasherForbiddenProvider(),
+        app_settings=AppSettings(DEBUG_MODE=False),
+        password_hasher_settings=settings,
+    )
+    container = app.state.dishka_container
+
+    try:
+        assert isinstance(await container.get(PasswordHasher), SocketPasswordHasher)
+    finally:
+        await container.close()
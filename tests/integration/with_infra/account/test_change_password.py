@@ -1,10 +1,12 @@
 import httpx2
+import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.common.services.user import UserService
 from app.core.common.value_objects.raw_password import RawPassword
 from tests.integration.with_infra.account.constants import CHANGE_PASSWORD_ENDPOINT
 from tests.integration.with_infra.authentication import authenticate
+from tests.integration.with_infra.concurrent_writer import ConcurrentWriterProvider
 from tests.integration.with_infra.factories import create_raw_password, create_user_with_password
 
 
@@ -87,3 +89,24 @@ async def test_returns_403_when_current_password_is_wrong(
     r = await it_client.put(CHANGE_PASSWORD_ENDPOINT, json=payload)
 
     assert r.status_code == 403
+
+
+@pytest.mark.parametrize("it_di_overrides", [(ConcurrentWriterProvider(),)])
+async def test_returns_409_when_user_changes_during_hashing(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_user_service: UserService,
+) -> None:
+    password = create_raw_password()
+    user = await create_user_with_password(it_user_service, raw_password=password)
+    it_session.add(user)
+    await it_session.commit()
+    await authenticate(it_client, user.username.value, password)
+    old_password_hash = user.password_hash
+    payload = {"current_password": password, "new_password": create_raw_password()}
+
+    r = await it_client.put(CHANGE_PASSWORD_ENDPOINT, json=payload)
+
+    assert r.status_code == 409
+    await it_session.refresh(user)
+    assert user.password_hash == old_password_hash
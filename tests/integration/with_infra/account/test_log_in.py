@@ -1,12 +1,22 @@
+from unittest.mock import Mock
+
 import httpx2
+from fastapi import FastAPI
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.common.services.user import UserService
 from app.core.common.value_objects.raw_password import RawPassword
 from app.core.common.value_objects.username import Username
+from app.core.common.value_objects.utc_datetime import UtcDatetime
+from app.main.config.loader import load_password_hasher_settings
+from app.main.config.settings import LoginThrottleSettings
+from app.outbound.adapters.password_hash_engines import BcryptEngine
+from app.outbound.adapters.peppered_password_hasher import PepperedPasswordHasher
+from app.outbound.auth_ctx.sqla_password_rehasher import PasswordRehasher, RehashJob
 from tests.integration.with_infra.account.constants import AUTH_COOKIE_NAME, LOG_IN_ENDPOINT
 from tests.integration.with_infra.authentication import authenticate
 from tests.integration.with_infra.factories import (
+    create_raw_now,
     create_raw_password,
     create_raw_username,
     create_user_with_password,
@@ -75,6 +85,27 @@ async def test_returns_401_when_password_is_wrong(
     assert r.status_code == 401
 
 
+async def test_returns_429_with_retry_after_when_failures_repeat(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_user_service: UserService,
+) -> None:
+    password = create_raw_password()
+    user = await create_user_with_password(it_user_service, raw_password=password)
+    it_session.add(user)
+    await it_session.commit()
+    wrong_payload = {"username": user.username.value, "password": create_raw_password()}
+    for _ in range(LoginThrottleSettings().USERNAME_FREE_FAILURES):
+        assert (await it_client.post(LOG_IN_ENDPOINT, json=wrong_payload)).status_code == 401
+    payload = {"username": user.username.value, "password": password}
+
+    r = await it_client.post(LOG_IN_ENDPOINT, json=payload)
+
+    assert r.status_code == 429
+    assert int(r.headers["Retry-After"]) >= 1
+    assert AUTH_COOKIE_NAME not in r.cookies
+
+
 async def test_returns_401_when_user_is_inactive(
     it_client: httpx2.AsyncClient,
     it_session: AsyncSession,
@@ -106,3 +137,61 @@ async def test_returns_403_when_already_authenticated(
     r = await it_client.post(LOG_IN_ENDPOINT, json=payload)
 
     assert r.status_code == 403
+
+
+def create_outdated_hasher() -> PepperedPasswordHasher:
+    settings = load_password_hasher_settings()
+    return PepperedPasswordHasher(
+        pepper=settings.PEPPER.encode(),
+        engines=(BcryptEngine(work_factor=4),),
+        executor=Mock(),
+        scheduler=Mock(),
+    )
+
+
+async def test_upgrades_password_hash_made_with_outdated_work_factor(
+    it_client: httpx2.AsyncClient,
+    it_fastapi_app: FastAPI,
+    it_session: AsyncSession,
+    it_user_service: UserService,
+) -> None:
+    outdated = create_outdated_hasher()
+    password = create_raw_password()
+    user = await create_user_with_password(it_user_service, raw_password=password)
+    user.password_hash = outdated.hash_sync(RawPassword(password))
+    it_session.add(user)
+    await it_session.commit()
+    payload = {"username": user.username.value, "password": password}
+
+    r = await it_client.post(LOG_IN_ENDPOINT, json=payload)
+    await (await it_fastapi_app.state.dishka_container.get(PasswordRehasher)).join()
+
+    assert r.status_code == 204
+    await it_session.refresh(user)
+    assert await outdated.needs_rehash(user.password_hash)
+    assert await it_user_service.is_password_valid(user, RawPassword(password))
+
+
+async def test_rehash_does_not_overwrite_password_changed_meanwhile(
+    it_fastapi_app: FastAPI,
+    it_session: AsyncSession,
+    it_user_service: UserService,
+) -> None:
+    outdated = create_outdated_hasher()
+    password = create_raw_password()
+    user = await create_user_with_password(it_user_service, raw_password=password)
+    verified_hash = user.password_hash = outdated.hash_sync(RawPassword(password))
+    it_session.add(user)
+    await it_session.commit()
+    await it_user_service.change_password(user, RawPassword(create_raw_password()), now=UtcDatetime(create_raw_now()))
+    await it_session.commit()
+    changed_hash = user.password_hash
+    sut = await it_fastapi_app.state.dishka_container.get(PasswordRehasher)
+
+    rehashed = await sut.rehash(
+        RehashJob(user_id=user.id_, verified_hash=verified_hash, raw_password=RawPassword(password)),
+    )
+
+    assert not rehashed
+    await it_session.refresh(user)
+    assert user.password_hash == changed_hash
@@ -5,6 +5,7 @@ from app.core.common.services.user import UserService
 from tests.integration.with_infra.account.constants import AUTH_COOKIE_NAME, LOG_OUT_ENDPOINT
 from tests.integration.with_infra.authentication import authenticate
 from tests.integration.with_infra.factories import create_raw_password, create_user_with_password
+from tests.integration.with_infra.users.constants import USERS_ENDPOINT
 
 
 async def test_returns_204_and_clears_cookie(
@@ -30,3 +31,23 @@ async def test_returns_401_when_not_authenticated(
     r = await it_client.delete(LOG_OUT_ENDPOINT)
 
     assert r.status_code == 401
+
+
+async def test_session_is_rejected_after_log_out(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_user_service: UserService,
+) -> None:
+    password = create_raw_password()
+    user = await create_user_with_password(it_user_service, raw_password=password)
+    it_session.add(user)
+    await it_session.commit()
+    await authenticate(it_client, user.username.value, password)
+    token = it_client.cookies[AUTH_COOKIE_NAME]
+    assert (await it_client.get(USERS_ENDPOINT)).status_code != 401
+    await it_client.delete(LOG_OUT_ENDPOINT)
+    it_client.cookies.set(AUTH_COOKIE_NAME, token)
+
+    r = await it_client.get(USERS_ENDPOINT)
+
+    assert r.status_code == 401
@@ -0,0 +1,81 @@
+import asyncio
+
+import httpx2
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.entities.user import User
+from app.core.common.services.user import UserService
+from app.main.config.settings import AppSettings, SessionSettings
+from app.main.run import make_app
+from app.outbound.persistence_sqla.mappings.auth_session import auth_sessions_table
+from tests.integration.with_infra.account.constants import AUTH_COOKIE_NAME, LOG_IN_ENDPOINT
+from tests.integration.with_infra.authentication import authenticate
+from tests.integration.with_infra.factories import create_raw_password, create_user_with_password
+from tests.integration.with_infra.users.constants import USERS_ENDPOINT
+
+MAX_PER_USER = 2
+
+
+@pytest.fixture
+def it_fastapi_app() -> FastAPI:
+    return make_app(
+        app_settings=AppSettings(DEBUG_MODE=False),
+        session_settings=SessionSettings(MAX_PER_USER=MAX_PER_USER),
+    )
+
+
+async def create_user(it_session: AsyncSession, it_user_service: UserService, password: str) -> User:
+    user = await create_user_with_password(it_user_service, raw_password=password)
+    it_session.add(user)
+    await it_session.commit()
+    return user
+
+
+async def count_sessions(it_session: AsyncSession, user: User) -> int:
+    stmt = select(func.count()).select_from(auth_sessions_table).where(auth_sessions_table.c.user_id == user.id_)
+    count: int = (await it_session.execute(stmt)).scalar_one()
+    return count
+
+
+async def test_log_in_beyond_cap_evicts_oldest_session(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_user_service: UserService,
+) -> None:
+    password = create_raw_password()
+    user = await create_user(it_session, it_user_service, password)
+    tokens = []
+    for _ in range(MAX_PER_USER + 1):
+        await authenticate(it_client, user.username.value, password)
+        tokens.append(it_client.cookies[AUTH_COOKIE_NAME])
+        it_client.cookies.clear()
+
+    assert await count_sessions(it_session, user) == MAX_PER_USER
+    it_client.cookies.set(AUTH_COOKIE_NAME, tokens[0])
+    assert (await it_client.get(USERS_ENDPOINT)).status_code == 401
+    it_client.cookies.set(AUTH_COOKIE_NAME, tokens[-1])
+    assert (await it_client.get(USERS_ENDPOINT)).status_code != 401
+
+
+@pytest.mark.usefixtures("it_client")
+async def test_concurrent_log_ins_do_not_overshoot_cap(
+    it_fastapi_app: FastAPI,
+    it_session: AsyncSession,
+    it_user_service: UserService,
+) -> None:
+    password = create_raw_password()
+    user = await create_user(it_session, it_user_service, password)
+    payload = {"username": user.username.value, "password": password}
+
+    async def log_in() -> int:
+        transport = httpx2.ASGITransport(app=it_fastapi_app)
+        async with httpx2.AsyncClient(transport=transport, base_url="http://test") as client:
+            return (await client.post(LOG_IN_ENDPOINT, json=payload)).status_code
+
+    statuses = await asyncio.gather(*(log_in() for _ in range(MAX_PER_USER + 3)))
+
+    assert set(statuses) == {204}
+    assert await count_sessions(it_session, user) == MAX_PER_USER
@@ -0,0 +1,35 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.common.services.user import UserService
+from app.outbound.auth_ctx.sqla_session_reaper import ExpiredSessionReaper
+from app.outbound.persistence_sqla.mappings.auth_session import auth_sessions_table
+from tests.integration.with_infra.factories import create_user_with_password
+
+
+async def test_removes_expired_sessions_in_batches(
+    it_session: AsyncSession,
+    it_sessionmaker: async_sessionmaker[AsyncSession],
+    it_user_service: UserService,
+) -> None:
+    user = await create_user_with_password(it_user_service)
+    it_session.add(user)
+    await it_session.commit()
+    now = datetime.now(UTC)
+    expirations = [now - timedelta(minutes=i) for i in range(1, 6)] + [now + timedelta(minutes=5)]
+    await it_session.execute(
+        insert(auth_sessions_table),
+        [{"id": uuid4().hex, "user_id": user.id_, "expiration": expiration} for expiration in expirations],
+    )
+    await it_session.commit()
+    sut = ExpiredSessionReaper(it_sessionmaker, batch_size=2, interval_s=3600, batch_pause_s=0)
+
+    removed = await sut.reap()
+
+    assert removed == 5
+    assert sut.removed == 5
+    remaining = (await it_session.scalars(select(auth_sessions_table.c.expiration))).all()
+    assert remaining == [expirations[-1]]
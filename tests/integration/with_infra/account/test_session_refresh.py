@@ -0,0 +1,53 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import httpx2
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.services.user import UserService
+from app.main.config.settings import AppSettings, SessionSettings
+from app.main.run import make_app
+from app.outbound.auth_ctx.sqla_refresh_writer import AuthSessionRefreshWriter
+from app.outbound.persistence_sqla.mappings.auth_session import auth_sessions_table
+from tests.integration.with_infra.account.constants import AUTH_COOKIE_NAME
+from tests.integration.with_infra.authentication import authenticate
+from tests.integration.with_infra.factories import create_raw_password, create_user_with_password
+from tests.integration.with_infra.users.constants import USERS_ENDPOINT
+
+
+@pytest.fixture
+def it_fastapi_app() -> FastAPI:
+    return make_app(
+        app_settings=AppSettings(DEBUG_MODE=False),
+        session_settings=SessionSettings(REFRESH_FLUSH_INTERVAL_S=3600),
+    )
+
+
+async def test_refresh_issues_cookie_at_once_and_writes_behind_once(
+    it_client: httpx2.AsyncClient,
+    it_fastapi_app: FastAPI,
+    it_session: AsyncSession,
+    it_user_service: UserService,
+) -> None:
+    password = create_raw_password()
+    user = await create_user_with_password(it_user_service, raw_password=password)
+    it_session.add(user)
+    await it_session.commit()
+    await authenticate(it_client, user.username.value, password)
+    almost_expired = datetime.now(UTC) + timedelta(seconds=10)
+    await it_session.execute(update(auth_sessions_table).values(expiration=almost_expired))
+    await it_session.commit()
+    writer = await it_fastapi_app.state.dishka_container.get(AuthSessionRefreshWriter)
+
+    responses = await asyncio.gather(*(it_client.get(USERS_ENDPOINT) for _ in range(3)))
+
+    issued = {r.cookies[AUTH_COOKIE_NAME] for r in responses if AUTH_COOKIE_NAME in r.cookies}
+    assert len(issued) == 1
+    assert writer.pending == 1
+    assert await writer.flush() == 1
+    stored = await it_session.scalar(select(auth_sessions_table.c.expiration))
+    assert stored is not None
+    assert stored > almost_expired + timedelta(seconds=30)
@@ -0,0 +1,70 @@
+import httpx2
+import pytest
+from dishka.exceptions import NoActiveFactoryError
+from fastapi import FastAPI
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.services.user import UserService
+from app.main.config.settings import AppSettings, SessionSettings
+from app.main.run import make_app
+from app.outbound.auth_ctx.kv_session_store import KeyValueClient
+from app.outbound.persistence_sqla.mappings.auth_session import auth_sessions_table
+from tests.integration.with_infra.account.constants import AUTH_COOKIE_NAME, LOG_OUT_ENDPOINT
+from tests.integration.with_infra.authentication import authenticate
+from tests.integration.with_infra.factories import create_raw_password, create_user_with_password
+from tests.integration.with_infra.users.constants import USERS_ENDPOINT
+
+
+@pytest.fixture
+def it_fastapi_app() -> FastAPI:
+    return make_app(
+        app_settings=AppSettings(DEBUG_MODE=False),
+        session_settings=SessionSettings(STORE="memory"),
+    )
+
+
+async def test_memory_store_authenticates_without_session_rows(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_user_service: UserService,
+) -> None:
+    password = create_raw_password()
+    user = await create_user_with_password(it_user_service, raw_password=password)
+    it_session.add(user)
+    await it_session.commit()
+
+    await authenticate(it_client, user.username.value, password)
+    r = await it_client.get(USERS_ENDPOINT)
+
+    assert r.status_code != 401
+    assert await it_session.scalar(select(func.count()).select_from(auth_sessions_table)) == 0
+
+
+async def test_memory_store_log_out_revokes_session(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_user_service: UserService,
+) -> None:
+    password = create_raw_password()
+    user = await create_user_with_password(it_user_service, raw_password=password)
+    it_session.add(user)
+    await it_session.commit()
+    await authenticate(it_client, user.username.value, password)
+    token = it_client.cookies[AUTH_COOKIE_NAME]
+
+    await it_client.delete(LOG_OUT_ENDPOINT)
+    it_client.cookies.set(AUTH_COOKIE_NAME, token)
+    r = await it_client.get(USERS_ENDPOINT)
+
+    assert r.status_code == 401
+
+
+async def test_sqla_store_builds_no_key_value_client() -> None:
+    container = make_app(app_settings=AppSettings(DEBUG_MODE=False)).state.dishka_container
+
+    try:
+        with pytest.raises(NoActiveFactoryError):
+            await container.get(KeyValueClient)
+    finally:
+        await container.close()
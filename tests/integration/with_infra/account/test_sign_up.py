@@ -1,4 +1,5 @@
 import httpx2
+import pytest
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -10,6 +11,7 @@ from app.core.common.value_objects.username import Username
 from app.outbound.persistence_sqla.mappings.user import users_table
 from tests.integration.with_infra.account.constants import SIGN_UP_ENDPOINT
 from tests.integration.with_infra.authentication import authenticate
+from tests.integration.with_infra.busy_hasher import BusyHasherProvider
 from tests.integration.with_infra.factories import (
     create_raw_password,
     create_raw_username,
@@ -75,6 +77,23 @@ async def test_returns_409_when_username_already_exists(
     assert count == 1
 
 
+@pytest.mark.parametrize("it_di_overrides", [(BusyHasherProvider(),)])
+async def test_returns_409_without_hashing_when_username_already_exists(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_user_service: UserService,
+) -> None:
+    username = create_raw_username()
+    user = create_user(it_user_service, raw_username=username)
+    it_session.add(user)
+    await it_session.commit()
+    payload = {"username": username, "password": create_raw_password()}
+
+    r = await it_client.post(SIGN_UP_ENDPOINT, json=payload)
+
+    assert r.status_code == 409
+
+
 async def test_returns_403_when_already_authenticated(
     it_client: httpx2.AsyncClient,
     it_session: AsyncSession,
@@ -0,0 +1,90 @@
+import httpx2
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.services.user import UserService
+from app.main.config.settings import AppSettings, SessionSettings
+from app.main.run import make_app
+from app.outbound.auth_ctx.jwt_processor import JwtProcessor
+from app.outbound.auth_ctx.sqla_revocation_feed import AuthSessionRevocationFeed
+from app.outbound.persistence_sqla.mappings.auth_session import (
+    auth_session_revocations_table,
+    auth_sessions_table,
+)
+from tests.integration.with_infra.account.constants import AUTH_COOKIE_NAME, LOG_OUT_ENDPOINT
+from tests.integration.with_infra.authentication import authenticate
+from tests.integration.with_infra.factories import create_raw_password, create_user_with_password
+from tests.integration.with_infra.users.constants import USERS_ENDPOINT
+
+
+@pytest.fixture
+def it_fastapi_app() -> FastAPI:
+    return make_app(
+        app_settings=AppSettings(DEBUG_MODE=False),
+        session_settings=SessionSettings(STATELESS=True, REVOCATION_POLL_INTERVAL_S=3600),
+    )
+
+
+async def log_in(it_client: httpx2.AsyncClient, it_session: AsyncSession, it_user_service: UserService) -> str:
+    password = create_raw_password()
+    user = await create_user_with_password(it_user_service, raw_password=password)
+    it_session.add(user)
+    await it_session.commit()
+    await authenticate(it_client, user.username.value, password)
+    return it_client.cookies[AUTH_COOKIE_NAME]
+
+
+async def test_authenticates_without_session_lookup(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_user_service: UserService,
+) -> None:
+    await log_in(it_client, it_session, it_user_service)
+    # Gone from the table but never logged as revoked: only a lookup would notice.
+    await it_session.execute(delete(auth_sessions_table))
+    await it_session.commit()
+
+    r = await it_client.get(USERS_ENDPOINT)
+
+    assert r.status_code != 401
+
+
+async def test_rejects_session_revoked_on_this_node(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_user_service: UserService,
+) -> None:
+    token = await log_in(it_client, it_session, it_user_service)
+    await it_client.delete(LOG_OUT_ENDPOINT)
+    it_client.cookies.set(AUTH_COOKIE_NAME, token)
+
+    r = await it_client.get(USERS_ENDPOINT)
+
+    assert r.status_code == 401
+
+
+async def test_rejects_session_revoked_on_another_node(
+    it_client: httpx2.AsyncClient,
+    it_fastapi_app: FastAPI,
+    it_session: AsyncSession,
+    it_user_service: UserService,
+) -> None:
+    token = await log_in(it_client, it_session, it_user_service)
+    jwt_processor = await it_fastapi_app.state.dishka_container.get(JwtProcessor)
+    claims = jwt_processor.decode(token)
+    assert claims is not None
+    expiration = (
+        await it_session.execute(delete(auth_sessions_table).returning(auth_sessions_table.c.expiration))
+    ).scalar_one()
+    await it_session.execute(
+        insert(auth_session_revocations_table).values(session_id=claims.session_id, expiration=expiration)
+    )
+    await it_session.commit()
+    feed = await it_fastapi_app.state.dishka_container.get(AuthSessionRevocationFeed)
+
+    assert await feed.poll() == 1
+    r = await it_client.get(USERS_ENDPOINT)
+
+    assert r.status_code == 401
@@ -0,0 +1,26 @@
+from dishka import Provider, Scope, provide
+
+from app.core.common.entities.types_ import UserPasswordHash
+from app.core.common.ports.password_hasher import PasswordHasher
+from app.core.common.value_objects.raw_password import RawPassword
+from app.outbound.adapters.exceptions import PasswordHasherBusyError
+
+
+class BusyPasswordHasher(PasswordHasher):
+    """Fails every call, so reaching the hasher shows up as 503."""
+
+    async def hash(self, raw_password: RawPassword) -> UserPasswordHash:
+        raise PasswordHasherBusyError
+
+    async def rehash(self, raw_password: RawPassword) -> UserPasswordHash:
+        raise PasswordHasherBusyError
+
+    async def verify(self, raw_password: RawPassword, hashed_password: UserPasswordHash) -> bool:
+        raise PasswordHasherBusyError
+
+    async def needs_rehash(self, hashed_password: UserPasswordHash) -> bool:
+        raise PasswordHasherBusyError
+
+
+class BusyHasherProvider(Provider):
+    password_hasher = provide(BusyPasswordHasher, provides=PasswordHasher, scope=Scope.APP)
@@ -0,0 +1,41 @@
+import hashlib
+
+from dishka import Provider, Scope, provide
+from sqlalchemy import func, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.common.entities.types_ import UserPasswordHash
+from app.core.common.ports.password_hasher import PasswordHasher
+from app.core.common.value_objects.raw_password import RawPassword
+from app.outbound.persistence_sqla.mappings.user import users_table
+
+
+class ConcurrentWriterPasswordHasher(PasswordHasher):
+    """Touches every user row while hashing, as a concurrent request would."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def hash(self, raw_password: RawPassword) -> UserPasswordHash:
+        async with self._session_factory() as session:
+            await session.execute(update(users_table).values(updated_at=func.now()))
+            await session.commit()
+        return UserPasswordHash(hashlib.sha256(raw_password.value).digest())
+
+    async def rehash(self, raw_password: RawPassword) -> UserPasswordHash:
+        return await self.hash(raw_password)
+
+    async def verify(self, raw_password: RawPassword, hashed_password: UserPasswordHash) -> bool:
+        return hashlib.sha256(raw_password.value).digest() == hashed_password
+
+    async def needs_rehash(self, hashed_password: UserPasswordHash) -> bool:
+        return False
+
+
+class ConcurrentWriterProvider(Provider):
+    @provide(scope=Scope.APP)
+    def provide_password_hasher(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> PasswordHasher:
+        return ConcurrentWriterPasswordHasher(session_factory)
@@ -0,0 +1,93 @@
+"""
+Guards that session revocation and reaping stay index scans on a large table.
+Seeding takes a while, so these run only with `-m slow`.
+"""
+
+import json
+from collections.abc import Iterator
+from typing import Any, Final, cast
+from uuid import UUID
+
+import pytest
+from sqlalchemy import ClauseElement, delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.outbound.persistence_sqla.mappings.auth_session import auth_sessions_table
+
+USER_COUNT: Final[int] = 100_000
+SESSIONS_PER_USER: Final[int] = 20
+
+pytestmark = pytest.mark.slow
+
+
+@pytest.fixture
+async def seeded_user_id(it_session: AsyncSession) -> UUID:
+    """Two million sessions over 100k users, one in twenty of them expired."""
+    await it_session.execute(
+        text(
+            "INSERT INTO users (id, username, password_hash, role, is_active, created_at, updated_at) "
+            "SELECT gen_random_uuid(), 'user' || n, '\\x00', 'user', true, now(), now() "
+            "FROM generate_series(1, :user_count) AS n"
+        ),
+        {"user_count": USER_COUNT},
+    )
+    await it_session.execute(
+        text(
+            "INSERT INTO auth_sessions (id, user_id, expiration) "
+            "SELECT md5(random()::text || s), u.id, now() + (CASE WHEN s = 1 THEN -1 ELSE 1 END) * interval '1 hour' "
+            "FROM users AS u CROSS JOIN generate_series(1, :per_user) AS s"
+        ),
+        {"per_user": SESSIONS_PER_USER},
+    )
+    await it_session.commit()
+    await it_session.execute(text("ANALYZE users, auth_sessions"))
+    user_id = await it_session.scalar(select(auth_sessions_table.c.user_id).limit(1))
+    assert isinstance(user_id, UUID)
+    return user_id
+
+
+async def explain(session: AsyncSession, stmt: ClauseElement) -> dict[str, Any]:
+    sql = stmt.compile(dialect=session.get_bind().dialect, compile_kwargs={"literal_binds": True})
+    plan = await session.scalar(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    parsed = json.loads(plan) if isinstance(plan, str) else plan
+    return cast(dict[str, Any], parsed[0]["Plan"])
+
+
+def walk(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from walk(child)
+
+
+def assert_index_scan(plan: dict[str, Any], index_name: str) -> None:
+    nodes = list(walk(plan))
+    assert not [n for n in nodes if n["Node Type"] == "Seq Scan" and n.get("Relation Name") == "auth_sessions"]
+    assert any(n.get("Index Name") == index_name for n in nodes)
+
+
+async def test_revoking_user_sessions_uses_user_id_index(
+    it_session: AsyncSession,
+    seeded_user_id: UUID,
+) -> None:
+    stmt = delete(auth_sessions_table).where(auth_sessions_table.c.user_id == seeded_user_id)
+
+    plan = await explain(it_session, stmt)
+
+    assert_index_scan(plan, "ix_auth_sessions_user_id")
+
+
+async def test_reaping_expired_sessions_uses_expiration_index(
+    it_session: AsyncSession,
+    seeded_user_id: UUID,
+) -> None:
+    expired = (
+        select(auth_sessions_table.c.id)
+        .where(auth_sessions_table.c.expiration < func.now())
+        .limit(1000)
+        .with_for_update(skip_locked=True)
+    )
+    stmt = delete(auth_sessions_table).where(auth_sessions_table.c.id.in_(expired.scalar_subquery()))
+
+    plan = await explain(it_session, stmt)
+
+    assert_index_scan(plan, "ix_auth_sessions_expiration")
@@ -0,0 +1,188 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import httpx2
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.util import greenlet_spawn
+
+from app.core.common.services.user import UserService
+from app.main.config.settings import AppSettings, SqlaSettings
+from app.main.run import make_app
+from app.outbound.persistence_sqla.mappings.auth_session import auth_sessions_table
+from app.outbound.persistence_sqla.mappings.user import users_table
+from app.outbound.persistence_sqla.request_connection import RequestConnection, RequestConnectionSession
+from tests.integration.with_infra.account.constants import CHANGE_PASSWORD_ENDPOINT, LOG_OUT_ENDPOINT
+from tests.integration.with_infra.authentication import authenticate
+from tests.integration.with_infra.factories import create_raw_password, create_user, create_user_with_password
+
+
+@pytest.fixture
+def it_fastapi_app() -> FastAPI:
+    return make_app(
+        app_settings=AppSettings(DEBUG_MODE=False),
+        sqla_settings=SqlaSettings(SHARED_CONNECTION=True),
+    )
+
+
+@dataclass
+class PoolUsage:
+    checkouts: int = 0
+    in_use: int = 0
+    peak: int = 0
+
+
+@contextmanager
+def track_pool(engine: AsyncEngine) -> Iterator[PoolUsage]:
+    usage = PoolUsage()
+
+    def on_checkout(*_: object) -> None:
+        usage.checkouts += 1
+        usage.in_use += 1
+        usage.peak = max(usage.peak, usage.in_use)
+
+    def on_checkin(*_: object) -> None:
+        usage.in_use -= 1
+
+    event.listen(engine.sync_engine, "checkout", on_checkout)
+    event.listen(engine.sync_engine, "checkin", on_checkin)
+    try:
+        yield usage
+    finally:
+        event.remove(engine.sync_engine, "checkout", on_checkout)
+        event.remove(engine.sync_engine, "checkin", on_checkin)
+
+
+async def test_log_out_touches_both_contexts_on_one_connection(
+    it_client: httpx2.AsyncClient,
+    it_fastapi_app: FastAPI,
+    it_session: AsyncSession,
+    it_user_service: UserService,
+) -> None:
+    password = create_raw_password()
+    user = await create_user_with_password(it_user_service, raw_password=password)
+    it_session.add(user)
+    await it_session.commit()
+    await authenticate(it_client, user.username.value, password)
+    engine = await it_fastapi_app.state.dishka_container.get(AsyncEngine)
+
+    with track_pool(engine) as usage:
+        r = await it_client.delete(LOG_OUT_ENDPOINT)
+
+    assert r.status_code == 204
+    assert usage.checkouts == 1
+    assert usage.in_use == 0
+    assert await it_session.scalar(select(func.count()).select_from(auth_sessions_table)) == 0
+
+
+async def test_connection_is_returned_while_hashing(
+    it_client: httpx2.AsyncClient,
+    it_fastapi_app: FastAPI,
+    it_session: AsyncSession,
+    it_user_service: UserService,
+) -> None:
+    password = create_raw_password()
+    user = await create_user_with_password(it_user_service, raw_password=password)
+    it_session.add(user)
+    await it_session.commit()
+    old_password_hash = user.password_hash
+    await authenticate(it_client, user.username.value, password)
+    engine = await it_fastapi_app.state.dishka_container.get(AsyncEngine)
+    payload = {"current_password": password, "new_password": create_raw_password()}
+
+    with track_pool(engine) as usage:
+        r = await it_client.put(CHANGE_PASSWORD_ENDPOINT, json=payload)
+
+    assert r.status_code == 204
+    assert usage.peak == 1
+    # Reading the user, writing the new hash, then bumping the users version once that is committed
+    assert usage.checkouts == 3
+    await it_session.refresh(user)
+    assert user.password_hash != old_password_hash
+
+
+@pytest.mark.parametrize("first_writes_early", [False, True], ids=["first-read-only", "first-wrote"])
+async def test_rollback_keeps_work_another_session_committed(
+    it_fastapi_app: FastAPI,
+    it_session: AsyncSession,
+    it_sessionmaker: async_sessionmaker[AsyncSession],
+    it_user_service: UserService,
+    first_writes_early: bool,
+) -> None:
+    engine = await it_fastapi_app.state.dishka_container.get(AsyncEngine)
+    request_connection = RequestConnection(engine.sync_engine)
+    first, second = (
+        it_sessionmaker(sync_session_class=RequestConnectionSession, request_connection=request_connection)
+        for _ in range(2)
+    )
+    committed, discarded = create_user(it_user_service), create_user(it_user_service)
+
+    try:
+        await first.scalar(select(func.count()).select_from(users_table))
+        if first_writes_early:
+            first.add(discarded)
+            await first.flush()
+        second.add(committed)
+        await second.commit()
+        if not first_writes_early:
+            first.add(discarded)
+            await first.flush()
+        await first.rollback()
+    finally:
+        await first.close()
+        await second.close()
+        await greenlet_spawn(request_connection.close)
+
+    usernames = set(await it_session.scalars(select(users_table.c.username)))
+    assert usernames == {committed.username.value}
+
+
+@pytest.mark.parametrize(
+    ("isolation_level", "expected_peak"),
+    [("READ COMMITTED", 1), ("REPEATABLE READ", 2)],
+    ids=["read-committed", "repeatable-read"],
+)
+async def test_holder_reads_again_after_another_session_committed(
+    it_fastapi_app: FastAPI,
+    it_sessionmaker: async_sessionmaker[AsyncSession],
+    it_user_service: UserService,
+    isolation_level: str,
+    expected_peak: int,
+) -> None:
+    engine = await it_fastapi_app.state.dishka_container.get(AsyncEngine)
+    request_connection = RequestConnection(engine.sync_engine.execution_options(isolation_level=isolation_level))
+    holder, newcomer = (
+        it_sessionmaker(sync_session_class=RequestConnectionSession, request_connection=request_connection)
+        for _ in range(2)
+    )
+    added = create_user(it_user_service)
+    count_users = select(func.count()).select_from(users_table)
+    current_tx = select(func.txid_current())
+
+    with track_pool(engine) as usage:
+        try:
+            count_before = (await holder.execute(count_users)).scalar_one()
+            tx_before = await holder.scalar(current_tx)
+            newcomer.add(added)
+            await newcomer.commit()
+            count_after = (await holder.execute(count_users)).scalar_one()
+            tx_after = await holder.scalar(current_tx)
+            await holder.commit()
+        finally:
+            await holder.close()
+            await newcomer.close()
+            await greenlet_spawn(request_connection.close)
+
+    assert usage.peak == expected_peak
+    assert usage.in_use == 0
+    if isolation_level == "READ COMMITTED":
+        # Handed over: the holder's reads go on in a new transaction and see the committed user
+        assert tx_after != tx_before
+        assert count_after == count_before + 1
+    else:
+        # Not handed over: the holder keeps its transaction and its snapshot
+        assert tx_after == tx_before
+        assert count_after == count_before
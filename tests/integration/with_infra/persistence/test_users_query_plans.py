@@ -0,0 +1,120 @@
+"""
+Guards that every user listing order, first page and cursor page alike, is served by an index scan
+on a large table rather than a sequential scan and sort.
+Seeding takes a while, so these run only with `-m slow`.
+"""
+
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Final, cast
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.queries.list_users import USER_CURSOR_VALUE_TYPES, UserSortingField
+from app.core.queries.query_support.keyset_pagination import KeysetCursor, KeysetPaginationParams
+from app.core.queries.query_support.offset_pagination import OffsetPaginationParams
+from app.core.queries.query_support.sorting import SortingOrder, SortingParams
+from app.core.queries.query_support.total_count import TotalCountMode
+from app.outbound.adapters.row_count_cache import RowCountCache
+from app.outbound.adapters.sqla_user_reader import SqlaUserReader
+
+USER_COUNT: Final[int] = 1_000_000
+LIMIT: Final[int] = 20
+
+pytestmark = pytest.mark.slow
+
+type Statement = tuple[str, Any]
+
+
+@pytest.fixture
+async def seeded(it_session: AsyncSession) -> None:
+    """A million users with mixed roles and activity and spread timestamps."""
+    await it_session.execute(
+        text(
+            "INSERT INTO users (id, username, password_hash, role, is_active, created_at, updated_at) "
+            "SELECT gen_random_uuid(), 'user' || n, '\\x00', "
+            "(ARRAY['user', 'admin', 'super_admin'])[1 + (n % 100 = 0)::int + (n = 1)::int], n % 10 <> 0, "
+            "now() - n * interval '1 minute', now() - (n::bigint * 7919 % :user_count) * interval '1 second' "
+            "FROM generate_series(1, :user_count) AS n"
+        ),
+        {"user_count": USER_COUNT},
+    )
+    await it_session.commit()
+    await it_session.execute(text("ANALYZE users"))
+    await it_session.commit()
+
+
+@contextmanager
+def captured_listings(session: AsyncSession) -> Iterator[list[Statement]]:
+    """Listing statements exactly as the reader sends them, with their parameters."""
+    statements: list[Statement] = []
+
+    def capture(*args: Any) -> None:
+        statement, parameters = args[2], args[3]
+        if "ORDER BY" in statement:
+            statements.append((statement, parameters))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+async def explain(session: AsyncSession, statement: Statement) -> dict[str, Any]:
+    sql, parameters = statement
+    connection = await session.connection()
+    plan = (await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}", parameters)).scalar_one()
+    parsed = json.loads(plan) if isinstance(plan, str) else plan
+    return cast(dict[str, Any], parsed[0]["Plan"])
+
+
+def walk(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from walk(child)
+
+
+def index_scan_problems(plan: dict[str, Any], index_name: str) -> list[str]:
+    nodes = list(walk(plan))
+    problems = [n["Node Type"] for n in nodes if n["Node Type"] in {"Seq Scan", "Sort", "Incremental Sort"}]
+    if not any(n.get("Index Name") == index_name for n in nodes):
+        problems.append(f"no scan of {index_name}")
+    return problems
+
+
+@pytest.mark.usefixtures("seeded")
+async def test_every_listing_order_uses_its_index(it_session: AsyncSession) -> None:
+    reader = SqlaUserReader(it_session, RowCountCache(ttl_s=0))
+    failures: dict[str, list[str]] = {}
+
+    for field in UserSortingField:
+        for order in SortingOrder:
+            sorting = SortingParams(field=field, order=order)
+            with captured_listings(it_session) as statements:
+                await reader.list_users(
+                    pagination=OffsetPaginationParams(limit=LIMIT, offset=0),
+                    sorting=sorting,
+                    total_count=TotalCountMode.NONE,
+                )
+                first_page = await reader.list_users_page(
+                    pagination=KeysetPaginationParams(limit=LIMIT, after=None),
+                    sorting=sorting,
+                )
+                assert first_page["next_cursor"] is not None
+                await reader.list_users_page(
+                    pagination=KeysetPaginationParams(
+                        limit=LIMIT, after=KeysetCursor.decode(first_page["next_cursor"], USER_CURSOR_VALUE_TYPES)
+                    ),
+                    sorting=sorting,
+                )
+            for mode, statement in zip(("offset", "first page", "next page"), statements, strict=True):
+                problems = index_scan_problems(await explain(it_session, statement), f"ix_users_{field}_id")
+                if problems:
+                    failures[f"{field} {order} {mode}"] = problems
+
+    assert not failures
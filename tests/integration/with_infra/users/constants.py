@@ -1,3 +1,4 @@
 from typing import Final
 
 USERS_ENDPOINT: Final[str] = "/api/v1/users/"
+EXPORT_USERS_ENDPOINT: Final[str] = "/api/v1/users/export"
@@ -0,0 +1,111 @@
+import csv
+import json
+
+import httpx2
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.common.entities.user import User
+from app.core.common.services.user import UserService
+from app.outbound.adapters.sqla_user_reader import SqlaUserReader
+from tests.integration.with_infra.authentication import authenticate
+from tests.integration.with_infra.factories import create_raw_password, create_user, create_user_with_password
+from tests.integration.with_infra.users.constants import EXPORT_USERS_ENDPOINT
+
+
+@pytest.fixture(autouse=True)
+def small_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(SqlaUserReader, "STREAM_BATCH_SIZE", 2)
+
+
+async def seed_users(it_session: AsyncSession, it_user_service: UserService, count: int) -> None:
+    it_session.add_all([create_user(it_user_service) for _ in range(count)])
+    await it_session.commit()
+
+
+async def test_streams_every_user_as_ndjson_in_id_order(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_admin: User,
+    it_user_service: UserService,
+) -> None:
+    await seed_users(it_session, it_user_service, 4)
+
+    r = await it_client.get(EXPORT_USERS_ENDPOINT)
+
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/x-ndjson"
+    users = [json.loads(line) for line in r.text.splitlines()]
+    assert len(users) == 5
+    assert [u["id"] for u in users] == sorted(u["id"] for u in users)
+    assert str(it_admin.id_) in {u["id"] for u in users}
+    assert set(users[0]) == {"id", "username", "role", "is_active", "created_at", "updated_at"}
+
+
+async def test_streams_csv_with_header(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_admin: User,
+    it_user_service: UserService,
+) -> None:
+    await seed_users(it_session, it_user_service, 2)
+
+    r = await it_client.get(EXPORT_USERS_ENDPOINT, params={"format": "csv"})
+
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(r.text.splitlines()))
+    assert len(rows) == 3
+    admin_row = next(row for row in rows if row["id"] == str(it_admin.id_))
+    assert admin_row["username"] == it_admin.username.value
+    assert admin_row["role"] == "admin"
+    assert admin_row["is_active"] == "true"
+
+
+async def test_resumes_after_given_id(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_admin: User,
+    it_user_service: UserService,
+) -> None:
+    await seed_users(it_session, it_user_service, 4)
+    full = [json.loads(line)["id"] for line in (await it_client.get(EXPORT_USERS_ENDPOINT)).text.splitlines()]
+
+    r = await it_client.get(EXPORT_USERS_ENDPOINT, params={"after_id": full[1]})
+
+    assert r.status_code == 200
+    assert [json.loads(line)["id"] for line in r.text.splitlines()] == full[2:]
+
+
+async def test_returns_empty_body_after_last_id(
+    it_client: httpx2.AsyncClient,
+    it_admin: User,
+) -> None:
+    r = await it_client.get(EXPORT_USERS_ENDPOINT, params={"after_id": str(it_admin.id_)})
+
+    assert r.status_code == 200
+    assert r.text == ""
+
+
+async def test_returns_401_when_not_authenticated(
+    it_client: httpx2.AsyncClient,
+) -> None:
+    r = await it_client.get(EXPORT_USERS_ENDPOINT)
+
+    assert r.status_code == 401
+
+
+async def test_returns_403_when_user_role(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_user_service: UserService,
+) -> None:
+    password = create_raw_password()
+    user = await create_user_with_password(it_user_service, raw_password=password)
+    it_session.add(user)
+    await it_session.commit()
+    await authenticate(it_client, user.username.value, password)
+
+    r = await it_client.get(EXPORT_USERS_ENDPOINT)
+
+    assert r.status_code == 403
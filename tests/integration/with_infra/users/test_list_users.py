@@ -1,15 +1,22 @@
 from datetime import timedelta
 
 import httpx2
+import pytest
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.common.entities.types_ import UserRole
 from app.core.common.entities.user import User
 from app.core.common.services.user import UserService
+from app.core.queries.list_users import UserSortingField
+from app.core.queries.query_support.sorting import SortingOrder
+from app.core.queries.query_support.total_count import TotalCountMode
+from app.outbound.persistence_sqla.mappings.user import users_version_seq
 from tests.integration.with_infra.authentication import authenticate
 from tests.integration.with_infra.factories import (
     create_raw_now,
     create_raw_password,
+    create_raw_username,
     create_user,
     create_user_with_password,
 )
@@ -122,6 +129,171 @@ async def test_returns_200_and_sorts_by_username_asc(
     assert users[2]["username"] == user_1.username.value
 
 
+async def test_omits_total_when_not_requested(
+    it_client: httpx2.AsyncClient,
+    it_admin: User,
+) -> None:
+    r = await it_client.get(USERS_ENDPOINT, params={"total_count": "none"})
+
+    assert r.status_code == 200
+    payload = r.json()
+    assert payload["total"] is None
+    assert len(payload["users"]) == 1
+
+
+@pytest.mark.parametrize("total_count", [mode for mode in TotalCountMode if mode != TotalCountMode.NONE])
+async def test_returns_total_of_full_and_empty_pages_in_every_mode(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_admin: User,
+    it_user_service: UserService,
+    total_count: TotalCountMode,
+) -> None:
+    it_session.add_all([create_user(it_user_service) for _ in range(3)])
+    await it_session.commit()
+    await it_session.execute(text("ANALYZE users"))
+    await it_session.commit()
+
+    full = await it_client.get(USERS_ENDPOINT, params={"limit": 2, "total_count": total_count.value})
+    empty = await it_client.get(USERS_ENDPOINT, params={"offset": 10, "total_count": total_count.value})
+
+    assert full.json()["total"] == 4
+    assert empty.json()["total"] == 4
+
+
+async def test_cached_total_lags_behind_new_users(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_admin: User,
+    it_user_service: UserService,
+) -> None:
+    it_session.add_all([create_user(it_user_service) for _ in range(2)])
+    await it_session.commit()
+    params: dict[str, str | int] = {"limit": 1, "total_count": "cached"}
+    first = await it_client.get(USERS_ENDPOINT, params=params)
+    it_session.add(create_user(it_user_service))
+    await it_session.commit()
+
+    cached = await it_client.get(USERS_ENDPOINT, params=params)
+    exact = await it_client.get(USERS_ENDPOINT, params={"limit": 1})
+
+    assert first.json()["total"] == 3
+    assert cached.json()["total"] == 3
+    assert exact.json()["total"] == 4
+
+
+@pytest.mark.parametrize("sorting_order", list(SortingOrder))
+@pytest.mark.parametrize("sorting_field", list(UserSortingField))
+async def test_cursor_pages_match_offset_listing(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_admin: User,
+    it_user_service: UserService,
+    sorting_field: UserSortingField,
+    sorting_order: SortingOrder,
+) -> None:
+    now = create_raw_now()
+    # Ties on every field, broken by ID.
+    users = [
+        create_user(
+            it_user_service,
+            role=UserRole.ADMIN if i % 3 == 0 else UserRole.USER,
+            is_active=i % 2 == 0,
+            raw_now=now - timedelta(hours=i // 2),
+        )
+        for i in range(6)
+    ]
+    it_session.add_all(users)
+    await it_session.commit()
+    sorting = {"sorting_field": sorting_field.value, "sorting_order": sorting_order.value}
+    expected = [u["id"] for u in (await it_client.get(USERS_ENDPOINT, params=sorting)).json()["users"]]
+
+    seen: list[str] = []
+    params: dict[str, str | int | bool] = {**sorting, "limit": 2, "paginate_by_cursor": True}
+    while True:
+        r = await it_client.get(USERS_ENDPOINT, params=params)
+        assert r.status_code == 200
+        payload = r.json()
+        assert "total" not in payload
+        seen.extend(u["id"] for u in payload["users"])
+        if payload["next_cursor"] is None:
+            break
+        params = {**sorting, "limit": 2, "cursor": payload["next_cursor"]}
+
+    assert seen == expected
+
+
+async def test_returns_400_when_cursor_is_from_another_sorting(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_admin: User,
+    it_user_service: UserService,
+) -> None:
+    it_session.add_all([create_user(it_user_service) for _ in range(2)])
+    await it_session.commit()
+    r = await it_client.get(USERS_ENDPOINT, params={"limit": 1, "paginate_by_cursor": True})
+    cursor = r.json()["next_cursor"]
+
+    r = await it_client.get(USERS_ENDPOINT, params={"cursor": cursor, "sorting_field": "username"})
+
+    assert r.status_code == 400
+
+
+async def test_returns_400_when_cursor_is_malformed(
+    it_client: httpx2.AsyncClient,
+    it_admin: User,
+) -> None:
+    r = await it_client.get(USERS_ENDPOINT, params={"cursor": "not-a-cursor"})
+
+    assert r.status_code == 400
+
+
+async def test_repeated_listing_is_reused_until_a_command_changes_users(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_admin: User,
+    it_user_service: UserService,
+) -> None:
+    first = await it_client.get(USERS_ENDPOINT)
+    # Written behind the commands' back: the cached listing doesn't see it.
+    it_session.add(create_user(it_user_service))
+    await it_session.commit()
+
+    cached = await it_client.get(USERS_ENDPOINT)
+    payload = {"username": create_raw_username(), "password": create_raw_password(), "role": "user"}
+    assert (await it_client.post(USERS_ENDPOINT, json=payload)).status_code == 201
+    refreshed = await it_client.get(USERS_ENDPOINT)
+
+    assert first.json()["total"] == 1
+    assert cached.json() == first.json()
+    assert refreshed.json()["total"] == 3
+
+
+@pytest.mark.parametrize("fresh_sequence", [True, False], ids=["fresh", "advanced"])
+async def test_cached_listing_is_dropped_when_another_process_bumps_the_version(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_admin: User,
+    it_user_service: UserService,
+    fresh_sequence: bool,
+) -> None:
+    if fresh_sequence:
+        # As right after the migration: the first bump must change the version too
+        await it_session.execute(text(f"ALTER SEQUENCE {users_version_seq.name} RESTART"))
+        await it_session.commit()
+    first = await it_client.get(USERS_ENDPOINT)
+    # As a command on another worker does: commit, then bump the shared version.
+    it_session.add(create_user(it_user_service))
+    await it_session.commit()
+    await it_session.execute(select(users_version_seq.next_value()))
+    await it_session.commit()
+
+    refreshed = await it_client.get(USERS_ENDPOINT)
+
+    assert first.json()["total"] == 1
+    assert refreshed.json()["total"] == 2
+
+
 async def test_returns_401_when_not_authenticated(
     it_client: httpx2.AsyncClient,
 ) -> None:
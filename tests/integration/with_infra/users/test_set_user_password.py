@@ -1,4 +1,5 @@
 import httpx2
+import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.common.entities.types_ import UserRole
@@ -6,6 +7,7 @@ from app.core.common.entities.user import User
 from app.core.common.services.user import UserService
 from app.core.common.value_objects.raw_password import RawPassword
 from tests.integration.with_infra.authentication import authenticate
+from tests.integration.with_infra.concurrent_writer import ConcurrentWriterProvider
 from tests.integration.with_infra.factories import (
     create_raw_password,
     create_raw_user_id,
@@ -103,3 +105,23 @@ async def test_returns_404_when_user_not_found(
     r = await it_client.put(f"{USERS_ENDPOINT}{create_raw_user_id()}/password/", json=payload)
 
     assert r.status_code == 404
+
+
+@pytest.mark.parametrize("it_di_overrides", [(ConcurrentWriterProvider(),)])
+async def test_returns_409_when_user_changes_during_hashing(
+    it_client: httpx2.AsyncClient,
+    it_session: AsyncSession,
+    it_admin: User,
+    it_user_service: UserService,
+) -> None:
+    target = create_user(it_user_service)
+    it_session.add(target)
+    await it_session.commit()
+    old_password_hash = target.password_hash
+    payload = {"password": create_raw_password()}
+
+    r = await it_client.put(f"{USERS_ENDPOINT}{target.id_}/password/", json=payload)
+
+    assert r.status_code == 409
+    await it_session.refresh(target)
+    assert target.password_hash == old_password_hash
@@ -0,0 +1,89 @@
+"""
+Measures the database lookup behind each authenticated request, per authentication path:
+the user by ID, which stateless mode still loads, next to the session joined with its user.
+Each call runs in a fresh session, as each request does.
+
+Requires a migrated database reachable with the usual `POSTGRES_*` settings.
+Seeded rows are removed afterward.
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from typing import Final
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.common.entities.types_ import UserId
+from app.main.config.loader import load_postgres_settings
+from app.outbound.auth_ctx.model import SessionId
+from app.outbound.auth_ctx.sqla_user_tx_storage import AuthSqlaUserTxStorage
+from app.outbound.persistence_sqla.mappings.all import map_tables
+
+RUNS: Final[int] = 2_000
+PREFIX: Final[str] = "bench-"
+
+
+def report(line: str) -> None:
+    sys.stdout.write(f"{line}\n")
+
+
+async def median_us(
+    session_maker: async_sessionmaker[AsyncSession],
+    lookup: Callable[[AuthSqlaUserTxStorage], Awaitable[object]],
+) -> float:
+    timings = []
+    for _ in range(RUNS):
+        async with session_maker() as session:
+            started = time.perf_counter()
+            assert await lookup(AuthSqlaUserTxStorage(session)) is not None
+            timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1_000_000
+
+
+async def main_async() -> None:
+    map_tables()
+    engine = create_async_engine(load_postgres_settings().dsn)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    user_id, session_id = UserId(uuid4()), SessionId(f"{PREFIX}{uuid4().hex}")
+    try:
+        async with session_maker() as session:
+            await session.execute(
+                text(
+                    "INSERT INTO users (id, username, password_hash, role, is_active, created_at, updated_at) "
+                    "VALUES (:id, :username, '\\x00'::bytea, 'user', true, now(), now())"
+                ),
+                {"id": user_id, "username": f"{PREFIX}{user_id.hex[:8]}"},
+            )
+            await session.execute(
+                text(
+                    "INSERT INTO auth_sessions (id, user_id, expiration) "
+                    "VALUES (:id, :user_id, now() + interval '1 day')"
+                ),
+                {"id": session_id, "user_id": user_id},
+            )
+            await session.commit()
+
+        report(f"{'lookup':>18} {'us/call':>9}  (median of {RUNS})")
+        for name, lookup in (
+            ("user by ID", lambda storage: storage.get_by_id(user_id)),
+            ("session with user", lambda storage: storage.get_with_session(session_id)),
+        ):
+            report(f"{name:>18} {await median_us(session_maker, lookup):>9.1f}")
+    finally:
+        async with session_maker() as session:
+            await session.execute(text("DELETE FROM users WHERE id = :id"), {"id": user_id})
+            await session.commit()
+        await engine.dispose()
+
+
+def main() -> None:
+    asyncio.run(main_async())
+
+
+if __name__ == "__main__":
+    main()
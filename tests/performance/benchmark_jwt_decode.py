@@ -0,0 +1,38 @@
+import sys
+import timeit
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from uuid import uuid4
+
+from app.core.common.entities.types_ import UserId
+from app.core.common.value_objects.utc_datetime import UtcDatetime
+from app.outbound.auth_ctx.jwt_processor import JwtProcessor
+from app.outbound.auth_ctx.model import AuthSession, SessionId
+
+SECRET = "benchmark-secret-benchmark-secret"
+NUMBER = 100_000
+
+
+def report(line: str) -> None:
+    sys.stdout.write(f"{line}\n")
+
+
+def main() -> None:
+    uncached = JwtProcessor(secret=SECRET, algorithm="HS256")
+    cached = JwtProcessor(secret=SECRET, algorithm="HS256", cache_max_entries=10_000)
+    session = AuthSession(
+        id_=SessionId(uuid4().hex),
+        user_id=UserId(uuid4()),
+        expiration=UtcDatetime(datetime.now(UTC) + timedelta(minutes=5)),
+    )
+    token = uncached.encode(session)
+    cached.decode(token)
+
+    report(f"{'decode':>9} {'us/call':>9}  (best of 5 x {NUMBER})")
+    for name, processor in (("verify", uncached), ("memoized", cached)):
+        best_s = min(timeit.repeat(partial(processor.decode, token), number=NUMBER, repeat=5))
+        report(f"{name:>9} {best_s / NUMBER * 1_000_000:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Measures `list_users` latency for a first page against table size, for each way of computing the total,
+next to the former single query with a window count.
+
+Requires a migrated database reachable with the usual `POSTGRES_*` settings.
+Seeded users are removed afterward.
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Final
+
+from sqlalchemy import func, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.queries.query_support.offset_pagination import OffsetPaginationParams
+from app.core.queries.query_support.sorting import SortingOrder, SortingParams
+from app.core.queries.query_support.total_count import TotalCountMode
+from app.main.config.loader import load_postgres_settings
+from app.outbound.adapters.row_count_cache import RowCountCache
+from app.outbound.adapters.sqla_user_reader import SqlaUserReader
+
+TABLE_SIZES: Final[tuple[int, ...]] = (1_000, 10_000, 100_000, 1_000_000)
+RUNS: Final[int] = 20
+PREFIX: Final[str] = "bench-totals-"
+PAGINATION: Final = OffsetPaginationParams(limit=20, offset=0)
+SORTING: Final = SortingParams(field="updated_at", order=SortingOrder.DESC)
+
+
+def report(line: str) -> None:
+    sys.stdout.write(f"{line}\n")
+
+
+async def seed(session: AsyncSession, start: int, stop: int) -> None:
+    await session.execute(
+        text(
+            "INSERT INTO users (id, username, password_hash, role, is_active, created_at, updated_at) "
+            "SELECT gen_random_uuid(), :prefix || g, '\\x00'::bytea, 'user', true, "
+            "now() - g * interval '1 second', now() - g * interval '1 second' "
+            "FROM generate_series(:start, :stop - 1) AS g",
+        ),
+        {"prefix": PREFIX, "start": start, "stop": stop},
+    )
+    await session.commit()
+    await session.execute(text("ANALYZE users"))
+    await session.commit()
+
+
+async def median_ms(call: Callable[[], Awaitable[object]]) -> float:
+    await call()
+    timings = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        await call()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+async def measure(session: AsyncSession) -> list[float]:
+    reader = SqlaUserReader(session, RowCountCache(ttl_s=3600))
+    # Baseline: every row read and sorted to count them alongside the page.
+    window_stmt = (
+        reader._select_users(SORTING)  # noqa: SLF001
+        .add_columns(func.count().over().label("total"))
+        .limit(PAGINATION.limit)
+    )
+    timings = [await median_ms(partial(session.execute, window_stmt))]
+    for mode in TotalCountMode:
+        list_users = partial(reader.list_users, pagination=PAGINATION, sorting=SORTING, total_count=mode)
+        timings.append(await median_ms(list_users))
+    return timings
+
+
+async def main_async() -> None:
+    engine = create_async_engine(load_postgres_settings().dsn)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    report(f"{'rows':>10} {'window':>9} " + " ".join(f"{mode.value:>9}" for mode in TotalCountMode) + "  (median ms)")
+    try:
+        async with session_maker() as session:
+            seeded = 0
+            for size in TABLE_SIZES:
+                await seed(session, seeded, size)
+                seeded = size
+                timings = await measure(session)
+                report(f"{size:>10} " + " ".join(f"{timing:>9.2f}" for timing in timings))
+    finally:
+        async with session_maker() as session:
+            await session.execute(text("DELETE FROM users WHERE username LIKE :pattern"), {"pattern": f"{PREFIX}%"})
+            await session.commit()
+        await engine.dispose()
+
+
+def main() -> None:
+    asyncio.run(main_async())
+
+
+if __name__ == "__main__":
+    main()
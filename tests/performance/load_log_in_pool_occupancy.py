@@ -0,0 +1,137 @@
+"""
+Fires a burst of concurrent log-ins and samples connection pool occupancy,
+while readiness probes measure how long other endpoints wait for a connection.
+
+Requires a migrated database reachable with the usual `POSTGRES_*` settings.
+Seeded users are removed afterward.
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import Final, cast
+
+import asgi_lifespan
+import httpx2
+from dishka import AsyncContainer
+from fastapi import FastAPI
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from app.core.common.entities.types_ import UserId
+from app.core.common.services.user import UserService
+from app.main.config.logging_ import LoggingLevel
+from app.main.config.settings import AppSettings
+from app.main.run import make_app
+from app.outbound.persistence_sqla.mappings.user import users_table
+from tests.integration.with_infra.account.constants import LOG_IN_ENDPOINT
+from tests.integration.with_infra.factories import create_raw_password, create_user_with_password
+
+CONCURRENT_LOG_INS: Final[int] = 32
+PROBE_INTERVAL_S: Final[float] = 0.05
+SAMPLE_INTERVAL_S: Final[float] = 0.005
+READINESS_ENDPOINT: Final[str] = "/healthz/"
+
+
+async def seed_users(container: AsyncContainer, count: int) -> list[tuple[UserId, str, str]]:
+    user_service = await container.get(UserService)
+    session_maker = await container.get(async_sessionmaker[AsyncSession])
+    password = create_raw_password()
+    users = [await create_user_with_password(user_service, raw_password=password) for _ in range(count)]
+    async with session_maker() as session:
+        session.add_all(users)
+        await session.commit()
+    return [(user.id_, user.username.value, password) for user in users]
+
+
+async def drop_users(container: AsyncContainer, user_ids: list[UserId]) -> None:
+    session_maker = await container.get(async_sessionmaker[AsyncSession])
+    async with session_maker() as session:
+        await session.execute(delete(users_table).where(users_table.c.id.in_(user_ids)))
+        await session.commit()
+
+
+async def sample_pool(pool: QueuePool, samples: list[int], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        samples.append(pool.checkedout())
+        await asyncio.sleep(SAMPLE_INTERVAL_S)
+
+
+def report(line: str) -> None:
+    sys.stdout.write(f"{line}\n")
+
+
+def make_client(app: FastAPI) -> httpx2.AsyncClient:
+    return httpx2.AsyncClient(
+        transport=httpx2.ASGITransport(app=app, raise_app_exceptions=False), base_url="http://test"
+    )
+
+
+async def log_in(app: FastAPI, username: str, password: str) -> int:
+    """Own client per log-in: a shared cookie jar would make later log-ins already authenticated."""
+    async with make_client(app) as client:
+        r = await client.post(LOG_IN_ENDPOINT, json={"username": username, "password": password})
+    return r.status_code
+
+
+async def probe(
+    client: httpx2.AsyncClient,
+    latencies: list[float],
+    statuses: list[int],
+    stop: asyncio.Event,
+) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        r = await client.get(READINESS_ENDPOINT)
+        latencies.append(time.perf_counter() - started)
+        statuses.append(r.status_code)
+        await asyncio.sleep(PROBE_INTERVAL_S)
+
+
+async def run(app: FastAPI) -> None:
+    container: AsyncContainer = app.state.dishka_container
+    engine = await container.get(AsyncEngine)
+    pool = cast(QueuePool, engine.pool)
+    credentials = await seed_users(container, CONCURRENT_LOG_INS)
+    samples: list[int] = []
+    probe_latencies: list[float] = []
+    probe_statuses: list[int] = []
+    stop = asyncio.Event()
+    try:
+        async with make_client(app) as client:
+            background = asyncio.gather(
+                sample_pool(pool, samples, stop),
+                probe(client, probe_latencies, probe_statuses, stop),
+            )
+            started = time.perf_counter()
+            statuses = await asyncio.gather(*(log_in(app, username, pwd) for _, username, pwd in credentials))
+            elapsed = time.perf_counter() - started
+            stop.set()
+            await background
+    finally:
+        await drop_users(container, [user_id for user_id, _, _ in credentials])
+
+    report(f"log-ins: {len(statuses)} in {elapsed:.2f}s, statuses: {dict(Counter(statuses))}")
+    report(f"pool size: {pool.size()}, overflow: {pool.overflow()}")
+    report(f"checked out: peak {max(samples)}, mean {statistics.fmean(samples):.2f}")
+    report(
+        f"readiness probe latency: median {statistics.median(probe_latencies) * 1000:.1f} ms, "
+        f"max {max(probe_latencies) * 1000:.1f} ms, statuses: {dict(Counter(probe_statuses))}"
+    )
+
+
+async def main_async() -> None:
+    app = make_app(app_settings=AppSettings(LOGGING_LEVEL=LoggingLevel.WARNING))
+    async with asgi_lifespan.LifespanManager(app):
+        await run(app)
+
+
+def main() -> None:
+    asyncio.run(main_async())
+
+
+if __name__ == "__main__":
+    main()
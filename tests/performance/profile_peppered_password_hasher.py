@@ -3,22 +3,22 @@ from unittest.mock import Mock
 from line_profiler import LineProfiler
 
 from app.core.common.value_objects.raw_password import RawPassword
-from app.outbound.adapters.bcrypt_password_hasher import BcryptPasswordHasher
+from app.outbound.adapters.password_hash_engines import BcryptEngine
+from app.outbound.adapters.peppered_password_hasher import PepperedPasswordHasher
 
 
-def profile_password_hashing(hasher: BcryptPasswordHasher) -> None:
+def profile_password_hashing(hasher: PepperedPasswordHasher) -> None:
     raw_password = RawPassword("raw_password")
     hashed = hasher.hash_sync(raw_password)
     hasher.verify_sync(raw_password, hashed)
 
 
 def main() -> None:
-    hasher = BcryptPasswordHasher(
+    hasher = PepperedPasswordHasher(
         pepper=b"Cayenne!",
-        work_factor=11,
+        engines=(BcryptEngine(work_factor=11),),
         executor=Mock(),
-        semaphore=Mock(),
-        semaphore_wait_timeout_s=1,
+        scheduler=Mock(),
     )
     profiler = LineProfiler()
     profiler.add_function(profile_password_hashing)
@@ -27,3 +27,17 @@ async def test_error_handling_prod_contract(
     r = await smoke_client.get("/nonexistent/")
 
     assert r.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.parametrize("path", ["/hasherz/", "/session-cachez/"])
+async def test_internal_stats_hidden_in_prod(
+    smoke_client: httpx2.AsyncClient,
+    smoke_app: FastAPI,
+    path: str,
+) -> None:
+    if smoke_app.debug:
+        pytest.skip("Not applicable when DEBUG=true")
+
+    r = await smoke_client.get(path)
+
+    assert r.status_code == status.HTTP_404_NOT_FOUND
@@ -4,4 +4,6 @@ from unittest.mock import AsyncMock
 
 class PasswordHasherMock(Protocol):
     hash: AsyncMock
+    rehash: AsyncMock
     verify: AsyncMock
+    needs_rehash: AsyncMock
@@ -9,5 +9,11 @@ class StubPasswordHasher(PasswordHasher):
     async def hash(self, raw_password: RawPassword) -> UserPasswordHash:
         return UserPasswordHash(hashlib.sha256(raw_password.value).digest())
 
+    async def rehash(self, raw_password: RawPassword) -> UserPasswordHash:
+        return await self.hash(raw_password)
+
     async def verify(self, raw_password: RawPassword, hashed_password: UserPasswordHash) -> bool:
         return await self.hash(raw_password) == hashed_password
+
+    async def needs_rehash(self, hashed_password: UserPasswordHash) -> bool:
+        return False
@@ -138,6 +138,28 @@ async def test_changes_password() -> None:
     assert user.updated_at == updated_at
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("needs_rehash", [True, False])
+async def test_rehashes_password_only_when_needed(
+    needs_rehash: bool,
+    password_hasher: PasswordHasherMock,
+) -> None:
+    sut = create_user_service(password_hasher=password_hasher)
+    created_at = create_now()
+    user = create_user(now=created_at)
+    initial_hash = user.password_hash
+    new_hash = create_password_hash()
+    password_hasher.needs_rehash.return_value = needs_rehash
+    password_hasher.rehash.return_value = new_hash
+    updated_at = create_now()
+
+    rehashed = await sut.rehash_password_if_needed(user, create_raw_password(), now=updated_at)
+
+    assert rehashed is needs_rehash
+    assert user.password_hash == (new_hash if needs_rehash else initial_hash)
+    assert user.updated_at == (updated_at if needs_rehash else created_at)
+
+
 @pytest.mark.parametrize(
     ("initial_role", "target_is_admin", "expected_role"),
     [
@@ -0,0 +1,81 @@
+import base64
+import json
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import Any, Final
+from uuid import uuid4
+
+import pytest
+
+from app.core.queries.query_support.exceptions import PaginationError
+from app.core.queries.query_support.keyset_pagination import CursorValue, KeysetCursor, KeysetPaginationParams
+from app.core.queries.query_support.sorting import SortingOrder
+
+
+class Color(StrEnum):
+    RED = "red"
+
+
+VALUE_TYPES: Final[dict[str, type[CursorValue]]] = {"name": str, "color": Color, "flag": bool, "at": datetime}
+AT = datetime(2026, 1, 1, 12, 30, 15, 123456, tzinfo=UTC)
+
+
+def make_token(field: Any, value: Any, id_: Any = None) -> str:
+    raw = json.dumps([field, "asc", value, str(uuid4()) if id_ is None else id_])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [("name", "alice"), ("color", Color.RED), ("flag", True), ("flag", False), ("at", AT)],
+)
+def test_cursor_round_trips(field: str, value: CursorValue) -> None:
+    cursor = KeysetCursor(field=field, order=SortingOrder.DESC, value=value, id=uuid4())
+
+    assert KeysetCursor.decode(cursor.encode(), VALUE_TYPES) == cursor
+
+
+def test_enum_value_is_decoded_as_member() -> None:
+    cursor = KeysetCursor.decode(make_token("color", "red"), VALUE_TYPES)
+
+    assert cursor.value is Color.RED
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "W10", "WyJmIiwiYXNjIiwxLCJ4Il0"])
+def test_malformed_cursor_is_rejected(token: str) -> None:
+    with pytest.raises(PaginationError):
+        KeysetCursor.decode(token, VALUE_TYPES)
+
+
+@pytest.mark.parametrize(
+    ("field", "value", "id_"),
+    [
+        pytest.param("name", True, None, id="bool-for-str"),
+        pytest.param("name", {"dt": AT.isoformat()}, None, id="datetime-for-str"),
+        pytest.param("color", "blue", None, id="unknown-enum-member"),
+        pytest.param("color", False, None, id="bool-for-enum"),
+        pytest.param("flag", "true", None, id="str-for-bool"),
+        pytest.param("flag", 1, None, id="int-for-bool"),
+        pytest.param("at", "2026-01-01T00:00:00+00:00", None, id="str-for-datetime"),
+        pytest.param("at", {"dt": "2026-01-01T00:00:00"}, None, id="naive-datetime"),
+        pytest.param("at", {"dt": 1}, None, id="non-str-datetime"),
+        pytest.param("at", {}, None, id="empty-datetime"),
+        pytest.param("unknown", "alice", None, id="unknown-field"),
+        pytest.param(["name"], "alice", None, id="non-str-field"),
+        pytest.param("name", "alice", 1, id="non-str-id"),
+        pytest.param("name", "alice", "not-a-uuid", id="malformed-id"),
+    ],
+)
+def test_cursor_with_mistyped_value_is_rejected(field: Any, value: Any, id_: Any) -> None:
+    with pytest.raises(PaginationError):
+        KeysetCursor.decode(make_token(field, value, id_), VALUE_TYPES)
+
+
+def test_limit_must_be_greater_than_0() -> None:
+    with pytest.raises(PaginationError):
+        KeysetPaginationParams(limit=0, after=None)
+
+
+def test_limit_cannot_exceed_max_int32() -> None:
+    with pytest.raises(PaginationError):
+        KeysetPaginationParams(limit=KeysetPaginationParams.MAX_INT32 + 1, after=None)
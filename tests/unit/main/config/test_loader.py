@@ -1,9 +1,12 @@
+from pathlib import Path
+
 import pytest
 
 from app.main.config.loader import (
     load_app_settings,
     load_cookie_settings,
     load_jwt_settings,
+    load_login_throttle_settings,
     load_password_hasher_settings,
     load_postgres_settings,
     load_session_settings,
@@ -59,6 +62,10 @@ def test_load_sqla_settings_reads_env_vars(monkeypatch: pytest.MonkeyPatch) -> N
     monkeypatch.setenv("SQLA_ECHO_POOL", "true")
     monkeypatch.setenv("SQLA_POOL_SIZE", "123456789")
     monkeypatch.setenv("SQLA_MAX_OVERFLOW", "987654321")
+    monkeypatch.setenv("SQLA_SHARED_CONNECTION", "true")
+    monkeypatch.setenv("SQLA_COUNT_CACHE_TTL_S", "12.5")
+    monkeypatch.setenv("SQLA_LIST_CACHE_TTL_S", "2.5")
+    monkeypatch.setenv("SQLA_LIST_CACHE_MAX_ENTRIES", "64")
 
     sut = load_sqla_settings()
 
@@ -66,40 +73,134 @@ def test_load_sqla_settings_reads_env_vars(monkeypatch: pytest.MonkeyPatch) -> N
     assert sut.ECHO_POOL is True
     assert sut.POOL_SIZE == 123456789
     assert sut.MAX_OVERFLOW == 987654321
+    assert sut.SHARED_CONNECTION is True
+    assert sut.COUNT_CACHE_TTL_S == 12.5
+    assert sut.LIST_CACHE_TTL_S == 2.5
+    assert sut.LIST_CACHE_MAX_ENTRIES == 64
 
 
 def test_load_password_hasher_settings_reads_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("PASSWORD_PEPPER", "test-pepper-test-pepper-test-pepper")
+    monkeypatch.setenv("PASSWORD_ALGORITHM", "argon2id")
     monkeypatch.setenv("PASSWORD_WORK_FACTOR", "123456789")
+    monkeypatch.setenv("PASSWORD_CALIBRATION_BUDGET_MS", "250.5")
+    monkeypatch.setenv("PASSWORD_ARGON2_TIME_COST", "3")
+    monkeypatch.setenv("PASSWORD_ARGON2_MEMORY_COST_KIB", "65536")
+    monkeypatch.setenv("PASSWORD_ARGON2_PARALLELISM", "4")
+    monkeypatch.setenv("PASSWORD_SCRYPT_LOG2_N", "15")
+    monkeypatch.setenv("PASSWORD_SCRYPT_R", "16")
+    monkeypatch.setenv("PASSWORD_SCRYPT_P", "2")
     monkeypatch.setenv("PASSWORD_MAX_THREADS", "987654321")
+    monkeypatch.setenv("PASSWORD_MIN_THREADS", "123")
+    monkeypatch.setenv("PASSWORD_LATENCY_TOLERANCE", "2.5")
     monkeypatch.setenv("PASSWORD_SEMAPHORE_WAIT_TIMEOUT_S", "1.23456789")
+    monkeypatch.setenv("PASSWORD_DAEMON_SOCKET_PATH", "/run/hasher.sock")
+    monkeypatch.setenv("PASSWORD_DAEMON_TIMEOUT_S", "9.87654321")
 
     sut = load_password_hasher_settings()
 
     assert sut.PEPPER == "test-pepper-test-pepper-test-pepper"
+    assert sut.ALGORITHM == "argon2id"
     assert sut.WORK_FACTOR == 123456789
+    assert sut.CALIBRATION_BUDGET_MS == 250.5
+    assert sut.ARGON2_TIME_COST == 3
+    assert sut.ARGON2_MEMORY_COST_KIB == 65536
+    assert sut.ARGON2_PARALLELISM == 4
+    assert sut.SCRYPT_LOG2_N == 15
+    assert sut.SCRYPT_R == 16
+    assert sut.SCRYPT_P == 2
     assert sut.MAX_THREADS == 987654321
+    assert sut.MIN_THREADS == 123
+    assert sut.LATENCY_TOLERANCE == 2.5
     assert sut.SEMAPHORE_WAIT_TIMEOUT_S == 1.23456789
+    assert sut.DAEMON_SOCKET_PATH == Path("/run/hasher.sock")
+    assert sut.DAEMON_TIMEOUT_S == 9.87654321
 
 
 def test_load_jwt_settings_reads_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("JWT_SECRET", "test-secret-test-secret-test-secret")
     monkeypatch.setenv("JWT_ALGORITHM", "HS384")
+    monkeypatch.setenv("JWT_VERIFY_CACHE_MAX_ENTRIES", "2048")
 
     sut = load_jwt_settings()
 
     assert sut.SECRET == "test-secret-test-secret-test-secret"
     assert sut.ALGORITHM == "HS384"
+    assert sut.VERIFY_CACHE_MAX_ENTRIES == 2048
 
 
 def test_load_session_settings_reads_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("SESSION_TTL_MIN", "123465789")
     monkeypatch.setenv("SESSION_REFRESH_THRESHOLD_RATIO", "0.123456789")
+    monkeypatch.setenv("SESSION_MAX_PER_USER", "3")
+    monkeypatch.setenv("SESSION_STORE", "kv")
+    monkeypatch.setenv("SESSION_MEMORY_STORE_SHARDS", "8")
+    monkeypatch.setenv("SESSION_KV_HOST", "kv.internal")
+    monkeypatch.setenv("SESSION_KV_PORT", "6380")
+    monkeypatch.setenv("SESSION_KV_POOL_SIZE", "4")
+    monkeypatch.setenv("SESSION_KV_TIMEOUT_S", "0.5")
+    monkeypatch.setenv("SESSION_REFRESH_FLUSH_INTERVAL_S", "0.25")
+    monkeypatch.setenv("SESSION_REAPER_INTERVAL_S", "90")
+    monkeypatch.setenv("SESSION_REAPER_BATCH_SIZE", "250")
+    monkeypatch.setenv("SESSION_REAPER_BATCH_PAUSE_S", "0.05")
+    monkeypatch.setenv("SESSION_CACHE_MAX_ENTRIES", "4321")
+    monkeypatch.setenv("SESSION_CACHE_TTL_S", "12.5")
+    monkeypatch.setenv("SESSION_STATELESS", "true")
+    monkeypatch.setenv("SESSION_STATELESS_TOKEN_TTL_S", "45")
+    monkeypatch.setenv("SESSION_REVOCATION_POLL_INTERVAL_S", "0.5")
+    monkeypatch.setenv("SESSION_REVOCATION_FILTER_CAPACITY", "2048")
 
     sut = load_session_settings()
 
     assert sut.TTL_MIN == 123465789
     assert sut.REFRESH_THRESHOLD_RATIO == 0.123456789
+    assert sut.MAX_PER_USER == 3
+    assert sut.STORE == "kv"
+    assert sut.MEMORY_STORE_SHARDS == 8
+    assert sut.KV_HOST == "kv.internal"
+    assert sut.KV_PORT == 6380
+    assert sut.KV_POOL_SIZE == 4
+    assert sut.KV_TIMEOUT_S == 0.5
+    assert sut.REFRESH_FLUSH_INTERVAL_S == 0.25
+    assert sut.REAPER_INTERVAL_S == 90
+    assert sut.REAPER_BATCH_SIZE == 250
+    assert sut.REAPER_BATCH_PAUSE_S == 0.05
+    assert sut.CACHE_MAX_ENTRIES == 4321
+    assert sut.CACHE_TTL_S == 12.5
+    assert sut.STATELESS is True
+    assert sut.STATELESS_TOKEN_TTL_S == 45
+    assert sut.REVOCATION_POLL_INTERVAL_S == 0.5
+    assert sut.REVOCATION_FILTER_CAPACITY == 2048
+
+
+def test_load_login_throttle_settings_reads_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("LOGIN_THROTTLE_USERNAME_BURST", "7")
+    monkeypatch.setenv("LOGIN_THROTTLE_USERNAME_REFILL_PER_MIN", "1.5")
+    monkeypatch.setenv("LOGIN_THROTTLE_ACCOUNT_BURST", "40")
+    monkeypatch.setenv("LOGIN_THROTTLE_ACCOUNT_REFILL_PER_MIN", "12.5")
+    monkeypatch.setenv("LOGIN_THROTTLE_CLIENT_BURST", "70")
+    monkeypatch.setenv("LOGIN_THROTTLE_CLIENT_REFILL_PER_MIN", "15.5")
+    monkeypatch.setenv("LOGIN_THROTTLE_USERNAME_FREE_FAILURES", "3")
+    monkeypatch.setenv("LOGIN_THROTTLE_ACCOUNT_FREE_FAILURES", "15")
+    monkeypatch.setenv("LOGIN_THROTTLE_CLIENT_FREE_FAILURES", "30")
+    monkeypatch.setenv("LOGIN_THROTTLE_BACKOFF_BASE_S", "0.5")
+    monkeypatch.setenv("LOGIN_THROTTLE_BACKOFF_MAX_S", "60")
+    monkeypatch.setenv("LOGIN_THROTTLE_MAX_KEYS", "1000")
+
+    sut = load_login_throttle_settings()
+
+    assert sut.USERNAME_BURST == 7
+    assert sut.USERNAME_REFILL_PER_MIN == 1.5
+    assert sut.ACCOUNT_BURST == 40
+    assert sut.ACCOUNT_REFILL_PER_MIN == 12.5
+    assert sut.CLIENT_BURST == 70
+    assert sut.CLIENT_REFILL_PER_MIN == 15.5
+    assert sut.USERNAME_FREE_FAILURES == 3
+    assert sut.ACCOUNT_FREE_FAILURES == 15
+    assert sut.CLIENT_FREE_FAILURES == 30
+    assert sut.BACKOFF_BASE_S == 0.5
+    assert sut.BACKOFF_MAX_S == 60
+    assert sut.MAX_KEYS == 1000
 
 
 def test_load_cookie_settings_reads_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -16,3 +16,9 @@ def test_ttl_property_builds_timedelta(ttl_min: int, expected: timedelta) -> Non
     sut = SessionSettings(TTL_MIN=ttl_min)
 
     assert sut.ttl == expected
+
+
+def test_session_cache_is_off_by_default() -> None:
+    sut = SessionSettings()
+
+    assert sut.CACHE_TTL_S == 0
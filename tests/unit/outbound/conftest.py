@@ -1,15 +1,13 @@
-import asyncio
 from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 
 import pytest
 
-from app.outbound.adapters.bcrypt_password_hasher import (
-    BcryptPasswordHasher,
-    HasherSemaphore,
-    HasherThreadPoolExecutor,
-)
+from app.outbound.adapters.gradient_limit import GradientLimit
+from app.outbound.adapters.hasher_scheduler import HasherScheduler
+from app.outbound.adapters.password_hash_engines import BcryptEngine
+from app.outbound.adapters.peppered_password_hasher import HasherThreadPoolExecutor, PepperedPasswordHasher
 
 
 @pytest.fixture(scope="session")
@@ -27,20 +25,20 @@ def hasher_threadpool_executor(
 
 
 @pytest.fixture
-def hasher_semaphore(hasher_max_threads: int) -> HasherSemaphore:
-    return HasherSemaphore(asyncio.Semaphore(hasher_max_threads))
+def hasher_scheduler(hasher_max_threads: int) -> HasherScheduler:
+    limit = GradientLimit(initial_limit=hasher_max_threads, min_limit=1, max_limit=hasher_max_threads)
+    return HasherScheduler(limit=limit, wait_timeout_s=3)
 
 
 @pytest.fixture
-def bcrypt_password_hasher(
+def peppered_password_hasher(
     hasher_threadpool_executor: HasherThreadPoolExecutor,
-    hasher_semaphore: HasherSemaphore,
-) -> partial[BcryptPasswordHasher]:
+    hasher_scheduler: HasherScheduler,
+) -> partial[PepperedPasswordHasher]:
     return partial(
-        BcryptPasswordHasher,
-        work_factor=11,
+        PepperedPasswordHasher,
+        engines=(BcryptEngine(work_factor=11),),
         pepper=b"Habanero",
         executor=hasher_threadpool_executor,
-        semaphore=hasher_semaphore,
-        semaphore_wait_timeout_s=3,
+        scheduler=hasher_scheduler,
     )
@@ -0,0 +1,129 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from app.core.common.entities.types_ import UserId
+from app.core.common.value_objects.utc_datetime import UtcDatetime
+from app.outbound.auth_ctx.model import AuthSession, SessionId
+from app.outbound.auth_ctx.session_cache import AuthSessionCache
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = NOW.timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_session(
+    *,
+    user_id: UserId | None = None,
+    expires_in: timedelta = timedelta(minutes=5),
+) -> AuthSession:
+    return AuthSession(
+        id_=SessionId(uuid4().hex),
+        user_id=user_id if user_id is not None else UserId(uuid4()),
+        expiration=UtcDatetime(NOW + expires_in),
+    )
+
+
+def test_returns_copy_of_cached_session() -> None:
+    sut = AuthSessionCache(max_entries=10, ttl_s=30, clock=FakeClock())
+    session = create_session()
+    sut.put(session, epoch=sut.epoch)
+
+    cached = sut.get(session.id_)
+
+    assert cached is not None
+    assert cached is not session
+    assert (cached.id_, cached.user_id, cached.expiration) == (session.id_, session.user_id, session.expiration)
+    assert (sut.hits, sut.misses) == (1, 0)
+
+
+def test_counts_misses() -> None:
+    sut = AuthSessionCache(max_entries=10, ttl_s=30, clock=FakeClock())
+
+    assert sut.get(SessionId("missing")) is None
+    assert (sut.hits, sut.misses) == (0, 1)
+
+
+def test_entry_expires_after_ttl() -> None:
+    clock = FakeClock()
+    sut = AuthSessionCache(max_entries=10, ttl_s=30, clock=clock)
+    session = create_session()
+    sut.put(session, epoch=sut.epoch)
+
+    clock.now += 30
+
+    assert sut.get(session.id_) is None
+
+
+def test_entry_does_not_outlive_session() -> None:
+    clock = FakeClock()
+    sut = AuthSessionCache(max_entries=10, ttl_s=30, clock=clock)
+    session = create_session(expires_in=timedelta(seconds=10))
+    sut.put(session, epoch=sut.epoch)
+
+    clock.now += 10
+
+    assert sut.get(session.id_) is None
+
+
+def test_evicts_least_recently_used() -> None:
+    sut = AuthSessionCache(max_entries=2, ttl_s=30, clock=FakeClock())
+    first, second, third = create_session(), create_session(), create_session()
+    sut.put(first, epoch=sut.epoch)
+    sut.put(second, epoch=sut.epoch)
+    sut.get(first.id_)
+
+    sut.put(third, epoch=sut.epoch)
+
+    assert sut.get(first.id_) is not None
+    assert sut.get(second.id_) is None
+    assert sut.get(third.id_) is not None
+
+
+def test_invalidates_session() -> None:
+    sut = AuthSessionCache(max_entries=10, ttl_s=30, clock=FakeClock())
+    session = create_session()
+    sut.put(session, epoch=sut.epoch)
+
+    sut.invalidate(session.id_)
+
+    assert sut.get(session.id_) is None
+
+
+def test_invalidates_all_sessions_of_user() -> None:
+    sut = AuthSessionCache(max_entries=10, ttl_s=30, clock=FakeClock())
+    user_id = UserId(uuid4())
+    own = [create_session(user_id=user_id), create_session(user_id=user_id)]
+    other = create_session()
+    for session in [*own, other]:
+        sut.put(session, epoch=sut.epoch)
+
+    sut.invalidate_user(user_id)
+
+    assert all(sut.get(session.id_) is None for session in own)
+    assert sut.get(other.id_) is not None
+
+
+def test_drops_fill_started_before_invalidation() -> None:
+    sut = AuthSessionCache(max_entries=10, ttl_s=30, clock=FakeClock())
+    session = create_session()
+    epoch = sut.epoch
+
+    sut.invalidate_user(session.user_id)
+    sut.put(session, epoch=epoch)
+
+    assert sut.get(session.id_) is None
+
+
+def test_zero_ttl_disables_caching() -> None:
+    sut = AuthSessionCache(max_entries=10, ttl_s=0, clock=FakeClock())
+    session = create_session()
+
+    sut.put(session, epoch=sut.epoch)
+
+    assert sut.get(session.id_) is None
@@ -0,0 +1,40 @@
+from app.outbound.adapters.gradient_limit import GradientLimit
+
+
+def test_grows_while_latency_is_steady_and_limit_is_used() -> None:
+    sut = GradientLimit(initial_limit=2, min_limit=1, max_limit=16)
+
+    for _ in range(100):
+        sut.update(latency_s=0.1, in_flight=sut.limit)
+
+    assert sut.limit == 16
+
+
+def test_does_not_grow_while_limit_is_underused() -> None:
+    sut = GradientLimit(initial_limit=4, min_limit=1, max_limit=16)
+
+    for _ in range(50):
+        sut.update(latency_s=0.1, in_flight=1)
+
+    assert sut.limit == 4
+
+
+def test_shrinks_when_latency_rises_above_tolerance() -> None:
+    sut = GradientLimit(initial_limit=8, min_limit=1, max_limit=8)
+    for _ in range(50):
+        sut.update(latency_s=0.1, in_flight=8)
+
+    for _ in range(20):
+        sut.update(latency_s=0.4, in_flight=8)
+
+    assert sut.limit < 8
+
+
+def test_stays_within_bounds() -> None:
+    sut = GradientLimit(initial_limit=100, min_limit=2, max_limit=4)
+    assert sut.limit == 4
+
+    for _ in range(200):
+        sut.update(latency_s=10.0, in_flight=4)
+
+    assert sut.limit >= 2
@@ -0,0 +1,112 @@
+import asyncio
+from collections.abc import AsyncIterator
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from app.outbound.adapters.exceptions import PasswordHasherBusyError, PasswordHasherProtocolError
+from app.outbound.adapters.hasher_daemon import HasherDaemon, read_frame, write_frame
+from app.outbound.adapters.password_hash_engines import BcryptEngine
+from app.outbound.adapters.peppered_password_hasher import PepperedPasswordHasher
+from app.outbound.adapters.socket_password_hasher import SocketPasswordHasher
+from tests.unit.core.common.services.factories import create_raw_password
+
+
+@pytest.fixture
+async def socket_path(
+    tmp_path: Path,
+    peppered_password_hasher: partial[PepperedPasswordHasher],
+) -> AsyncIterator[Path]:
+    path = tmp_path / "hasher.sock"
+    daemon = HasherDaemon(peppered_password_hasher(engines=(BcryptEngine(4),)))
+    server = await daemon.start(path)
+    yield path
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_hashes_and_verifies_through_daemon(socket_path: Path) -> None:
+    sut = SocketPasswordHasher(socket_path=socket_path, timeout_s=5)
+    pwd = create_raw_password()
+
+    hashed = await sut.hash(pwd)
+
+    assert await sut.verify(raw_password=pwd, hashed_password=hashed)
+    assert not await sut.verify(raw_password=create_raw_password("bruteforce"), hashed_password=hashed)
+
+
+@pytest.mark.asyncio
+async def test_rehashes_through_daemon(socket_path: Path) -> None:
+    sut = SocketPasswordHasher(socket_path=socket_path, timeout_s=5)
+    pwd = create_raw_password()
+
+    hashed = await sut.rehash(pwd)
+
+    assert await sut.verify(raw_password=pwd, hashed_password=hashed)
+
+
+@pytest.mark.asyncio
+async def test_reports_aggregate_stats(socket_path: Path) -> None:
+    sut = SocketPasswordHasher(socket_path=socket_path, timeout_s=5)
+    await asyncio.gather(*(sut.hash(create_raw_password()) for _ in range(3)))
+
+    stats = await sut.stats()
+
+    assert stats["hashed"] == 3
+    assert stats["in_use"] == 0
+
+
+@pytest.mark.asyncio
+async def test_unreachable_daemon_counts_as_busy(tmp_path: Path) -> None:
+    sut = SocketPasswordHasher(socket_path=tmp_path / "missing.sock", timeout_s=1)
+
+    with pytest.raises(PasswordHasherBusyError):
+        await sut.hash(create_raw_password())
+
+
+@pytest.mark.asyncio
+async def test_daemon_refuses_malformed_request(socket_path: Path) -> None:
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    await write_frame(writer, {"op": "hash"})
+
+    response = await read_frame(reader)
+
+    writer.close()
+    assert response is not None
+    assert response["error"] == "bad_request"
+    assert "password" in response["message"]
+
+
+@pytest.mark.asyncio
+async def test_refused_request_is_not_reported_as_busy(tmp_path: Path) -> None:
+    async def refuse(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await read_frame(reader)
+        await write_frame(writer, {"ok": False, "error": "bad_request", "message": "KeyError: 'password'"})
+        writer.close()
+
+    path = tmp_path / "hasher.sock"
+    server = await asyncio.start_unix_server(refuse, path=path)
+    sut = SocketPasswordHasher(socket_path=path, timeout_s=5)
+
+    with pytest.raises(PasswordHasherProtocolError):
+        await sut.hash(create_raw_password())
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_cancels_job_when_client_hangs_up(
+    tmp_path: Path,
+    peppered_password_hasher: partial[PepperedPasswordHasher],
+) -> None:
+    path = tmp_path / "hasher.sock"
+    server = await HasherDaemon(peppered_password_hasher(engines=(BcryptEngine(12),))).start(path)
+    sut = SocketPasswordHasher(socket_path=path, timeout_s=0.05)
+
+    with pytest.raises(PasswordHasherBusyError):
+        await sut.hash(create_raw_password())
+    stats = await SocketPasswordHasher(socket_path=path, timeout_s=5).stats()
+
+    assert stats["abandoned"] == 1
+    assert "hashed" not in stats
+    server.close()
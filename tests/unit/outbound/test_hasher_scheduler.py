@@ -0,0 +1,255 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+import pytest
+
+from app.outbound.adapters.exceptions import PasswordHasherBusyError
+from app.outbound.adapters.gradient_limit import GradientLimit
+from app.outbound.adapters.hasher_scheduler import HasherPriority, HasherScheduler
+
+
+class FakeClock:
+    """Ticks on every read, so each job takes a little time."""
+
+    def __init__(self, tick_s: float = 0.01) -> None:
+        self.now = 0.0
+        self._tick_s = tick_s
+
+    def __call__(self) -> float:
+        self.now += self._tick_s
+        return self.now
+
+
+class FakeExecutor(Executor):
+    """Runs a submitted job only when the test finishes it, in submission order."""
+
+    def __init__(self) -> None:
+        self.pending: list[tuple[Future[Any], Callable[[], Any]]] = []
+
+    def submit[**P, T](self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> Future[T]:
+        future: Future[T] = Future()
+        self.pending.append((future, partial(fn, *args, **kwargs)))
+        return future
+
+    async def finish_next(self) -> None:
+        future, job = self.pending.pop(0)
+        if future.set_running_or_notify_cancel():
+            future.set_result(job())
+        await settle()
+
+    async def finish_all(self) -> None:
+        while self.pending:
+            await self.finish_next()
+
+
+def create_scheduler(
+    wait_timeout_s: float,
+    capacity: int = 1,
+    clock: Callable[[], float] = time.perf_counter,
+) -> HasherScheduler:
+    limit = GradientLimit(initial_limit=capacity, min_limit=capacity, max_limit=capacity)
+    return HasherScheduler(limit=limit, wait_timeout_s=wait_timeout_s, clock=clock)
+
+
+def submit(
+    sut: HasherScheduler,
+    executor: FakeExecutor,
+    priority: HasherPriority,
+    client: str,
+    served: list[str],
+) -> asyncio.Task[None]:
+    return asyncio.create_task(sut.run(priority, client, executor, served.append, client))
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_serves_verify_before_hash() -> None:
+    sut = create_scheduler(wait_timeout_s=1, clock=FakeClock())
+    executor = FakeExecutor()
+    served: list[str] = []
+    tasks = []
+    for priority, client in [
+        (HasherPriority.HASH, "holder"),
+        (HasherPriority.HASH, "signup"),
+        (HasherPriority.VERIFY, "login"),
+    ]:
+        tasks.append(submit(sut, executor, priority, client, served))
+        await settle()
+
+    await executor.finish_all()
+    await asyncio.gather(*tasks)
+
+    assert served == ["holder", "login", "signup"]
+
+
+@pytest.mark.asyncio
+async def test_alternates_between_clients_of_same_priority() -> None:
+    sut = create_scheduler(wait_timeout_s=1, clock=FakeClock())
+    executor = FakeExecutor()
+    served: list[str] = []
+    tasks = []
+    for client in ["holder", "noisy", "noisy", "noisy", "quiet"]:
+        tasks.append(submit(sut, executor, HasherPriority.VERIFY, client, served))
+        await settle()
+
+    await executor.finish_all()
+    await asyncio.gather(*tasks)
+
+    assert served == ["holder", "noisy", "quiet", "noisy", "noisy"]
+
+
+@pytest.mark.asyncio
+async def test_rejects_without_queuing_when_estimated_wait_exceeds_deadline() -> None:
+    clock = FakeClock(tick_s=0)
+    sut = create_scheduler(wait_timeout_s=1, clock=clock)
+    executor = FakeExecutor()
+    slow = submit(sut, executor, HasherPriority.HASH, "slow", [])
+    await settle()
+    clock.now += 2.0
+    await executor.finish_next()
+    await slow
+    holder = submit(sut, executor, HasherPriority.HASH, "holder", [])
+    await settle()
+
+    with pytest.raises(PasswordHasherBusyError):
+        await sut.run(HasherPriority.HASH, "late", executor, lambda: None)
+
+    assert sut.avg_duration_s == 2.0
+    assert sut.waiting == 0
+    await executor.finish_all()
+    await holder
+
+
+@pytest.mark.asyncio
+async def test_rehash_runs_on_free_permit_and_never_queues() -> None:
+    sut = create_scheduler(wait_timeout_s=1, clock=FakeClock())
+    executor = FakeExecutor()
+    served: list[str] = []
+    rehash = submit(sut, executor, HasherPriority.REHASH, "idle", served)
+    await settle()
+    await executor.finish_all()
+    await rehash
+    holder = submit(sut, executor, HasherPriority.HASH, "holder", served)
+    await settle()
+
+    with pytest.raises(PasswordHasherBusyError):
+        await sut.run(HasherPriority.REHASH, "busy", executor, lambda: None)
+
+    assert sut.waiting == 0
+    await executor.finish_all()
+    await holder
+    assert served == ["idle", "holder"]
+
+
+@pytest.mark.asyncio
+async def test_times_out_waiting_for_permit() -> None:
+    sut = create_scheduler(wait_timeout_s=0.01, clock=FakeClock())
+    executor = FakeExecutor()
+    holder = submit(sut, executor, HasherPriority.HASH, "holder", [])
+    await settle()
+
+    with pytest.raises(PasswordHasherBusyError):
+        await sut.run(HasherPriority.HASH, "late", executor, lambda: None)
+
+    assert sut.waiting == 0
+    await executor.finish_all()
+    await holder
+    assert sut.in_use == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_permit() -> None:
+    sut = create_scheduler(wait_timeout_s=1, clock=FakeClock())
+    executor = FakeExecutor()
+    served: list[str] = []
+    tasks = []
+    for client in ["holder", "gone", "survivor"]:
+        tasks.append(submit(sut, executor, HasherPriority.HASH, client, served))
+        await settle()
+
+    tasks[1].cancel()
+    await executor.finish_all()
+    await asyncio.gather(tasks[0], tasks[2])
+
+    assert served == ["holder", "survivor"]
+    assert sut.in_use == 0
+    assert sut.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_admits_more_jobs_at_once_when_limit_grows() -> None:
+    limit = GradientLimit(initial_limit=1, min_limit=1, max_limit=4)
+    sut = HasherScheduler(limit=limit, wait_timeout_s=1, clock=FakeClock())
+    executor = FakeExecutor()
+    served: list[str] = []
+    tasks = []
+    for i in range(12):
+        tasks.append(submit(sut, executor, HasherPriority.VERIFY, f"client-{i}", served))
+        await settle()
+    assert len(executor.pending) == 1
+
+    # Steady durations: the limit grows while every permit is in use.
+    most_at_once = 1
+    while executor.pending:
+        await executor.finish_next()
+        most_at_once = max(most_at_once, len(executor.pending))
+    await asyncio.gather(*tasks)
+
+    assert sut.limit > 1
+    assert most_at_once > 1
+    assert len(served) == 12
+    assert sut.in_use == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_keeps_permit_until_running_job_finishes() -> None:
+    sut = create_scheduler(wait_timeout_s=1)
+    started = threading.Event()
+    unblock = threading.Event()
+
+    def job() -> None:
+        started.set()
+        unblock.wait()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        caller = asyncio.create_task(sut.run(HasherPriority.HASH, "gone", executor, job))
+        await asyncio.to_thread(started.wait)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+
+        assert sut.in_use == 1
+        unblock.set()
+
+    await settle()
+    assert sut.in_use == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_drops_job_that_has_not_started() -> None:
+    sut = create_scheduler(wait_timeout_s=1, capacity=2)
+    unblock = threading.Event()
+    ran: list[str] = []
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        blocker = asyncio.create_task(sut.run(HasherPriority.HASH, "a", executor, unblock.wait))
+        queued = asyncio.create_task(sut.run(HasherPriority.HASH, "b", executor, ran.append, "b"))
+        await settle()
+        queued.cancel()
+        await settle()
+
+        assert sut.in_use == 1
+        unblock.set()
+        await blocker
+
+    assert ran == []
+    assert sut.in_use == 0
@@ -0,0 +1,105 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import jwt
+import pytest
+
+from app.core.common.entities.types_ import UserId
+from app.core.common.value_objects.utc_datetime import UtcDatetime
+from app.outbound.auth_ctx.jwt_processor import JwtProcessor
+from app.outbound.auth_ctx.model import AuthSession, SessionId
+
+SECRET = "test-secret-test-secret-test-secret"
+NOW = datetime.now(UTC)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = NOW.timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingDecode:
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.calls = 0
+        self._decode = jwt.decode
+        monkeypatch.setattr(jwt, "decode", self)
+
+    def __call__(self, *args: object, **kwargs: object) -> dict[str, object]:
+        self.calls += 1
+        return self._decode(*args, **kwargs)  # type: ignore[arg-type]
+
+
+def create_token(processor: JwtProcessor, *, expires_in: timedelta = timedelta(minutes=5)) -> str:
+    session = AuthSession(
+        id_=SessionId(uuid4().hex),
+        user_id=UserId(uuid4()),
+        expiration=UtcDatetime(NOW + expires_in),
+    )
+    return processor.encode(session)
+
+
+def test_repeated_token_is_verified_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    sut = JwtProcessor(secret=SECRET, algorithm="HS256", cache_max_entries=10, clock=FakeClock())
+    token = create_token(sut)
+    decode = CountingDecode(monkeypatch)
+
+    first = sut.decode(token)
+    second = sut.decode(token)
+
+    assert first is not None
+    assert second == first
+    assert decode.calls == 1
+
+
+def test_cached_token_is_rejected_once_expired() -> None:
+    clock = FakeClock()
+    sut = JwtProcessor(secret=SECRET, algorithm="HS256", cache_max_entries=10, clock=clock)
+    token = create_token(sut, expires_in=timedelta(hours=1))
+    assert sut.decode(token) is not None
+
+    clock.now += timedelta(hours=1).total_seconds()
+
+    assert sut.decode(token) is None
+    assert sut.cached_tokens == 0
+
+
+def test_invalid_tokens_are_not_cached() -> None:
+    sut = JwtProcessor(secret=SECRET, algorithm="HS256", cache_max_entries=10, clock=FakeClock())
+    forged = JwtProcessor(secret=SECRET[::-1], algorithm="HS256")
+
+    for _ in range(100):
+        assert sut.decode(create_token(forged)) is None
+        assert sut.decode(uuid4().hex) is None
+
+    assert sut.cached_tokens == 0
+
+
+def test_cache_evicts_least_recently_used(monkeypatch: pytest.MonkeyPatch) -> None:
+    sut = JwtProcessor(secret=SECRET, algorithm="HS256", cache_max_entries=2, clock=FakeClock())
+    first, second, third = (create_token(sut) for _ in range(3))
+    sut.decode(first)
+    sut.decode(second)
+    sut.decode(first)
+    sut.decode(third)
+    decode = CountingDecode(monkeypatch)
+
+    sut.decode(first)
+    sut.decode(second)
+
+    assert sut.cached_tokens == 2
+    assert decode.calls == 1
+
+
+def test_zero_max_entries_disables_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    sut = JwtProcessor(secret=SECRET, algorithm="HS256", cache_max_entries=0)
+    token = create_token(sut)
+    decode = CountingDecode(monkeypatch)
+
+    sut.decode(token)
+    sut.decode(token)
+
+    assert decode.calls == 2
+    assert sut.cached_tokens == 0
@@ -0,0 +1,115 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+from app.core.common.entities.types_ import UserId
+from app.core.common.value_objects.utc_datetime import UtcDatetime
+from app.outbound.auth_ctx.kv_session_store import KeyValueAuthSessionStore
+from app.outbound.auth_ctx.memory_kv_client import ShardedMemoryKeyValueClient
+from app.outbound.auth_ctx.model import AuthSession, SessionId
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = NOW.timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_store(clock: FakeClock) -> tuple[KeyValueAuthSessionStore, ShardedMemoryKeyValueClient]:
+    client = ShardedMemoryKeyValueClient(shard_count=4, clock=clock)
+    user_tx_storage = Mock(get_by_id=AsyncMock(return_value=None))
+    return KeyValueAuthSessionStore(client, user_tx_storage, clock=clock), client
+
+
+def create_session(user_id: UserId, *, expires_in: timedelta = timedelta(minutes=5)) -> AuthSession:
+    return AuthSession(id_=SessionId(uuid4().hex), user_id=user_id, expiration=UtcDatetime(NOW + expires_in))
+
+
+async def test_added_session_is_found() -> None:
+    sut, _ = create_store(FakeClock())
+    session = create_session(UserId(uuid4()))
+
+    assert await sut.add(session, max_per_user=3) == []
+    loaded = await sut.get_with_user(session.id_)
+
+    assert loaded is not None
+    assert (loaded[0].id_, loaded[0].user_id, loaded[0].expiration) == (
+        session.id_,
+        session.user_id,
+        session.expiration,
+    )
+
+
+async def test_add_beyond_cap_evicts_earliest_expiring() -> None:
+    sut, _ = create_store(FakeClock())
+    user_id = UserId(uuid4())
+    oldest = create_session(user_id, expires_in=timedelta(minutes=1))
+    newer = create_session(user_id, expires_in=timedelta(minutes=2))
+    await sut.add(oldest, max_per_user=2)
+    await sut.add(newer, max_per_user=2)
+
+    evicted = await sut.add(create_session(user_id), max_per_user=2)
+
+    assert [revoked.session_id for revoked in evicted] == [oldest.id_]
+    assert await sut.get_with_user(oldest.id_) is None
+    assert await sut.get_with_user(newer.id_) is not None
+
+
+async def test_session_expires_with_its_key() -> None:
+    clock = FakeClock()
+    sut, _ = create_store(clock)
+    session = create_session(UserId(uuid4()), expires_in=timedelta(seconds=30))
+    await sut.add(session, max_per_user=3)
+
+    clock.now += 30
+
+    assert await sut.get_with_user(session.id_) is None
+    assert await sut.delete_all_for_user(session.user_id) == []
+
+
+async def test_delete_all_for_user_removes_every_session() -> None:
+    sut, _ = create_store(FakeClock())
+    user_id = UserId(uuid4())
+    sessions = [create_session(user_id) for _ in range(3)]
+    for session in sessions:
+        await sut.add(session, max_per_user=3)
+    other = create_session(UserId(uuid4()))
+    await sut.add(other, max_per_user=3)
+
+    revoked = await sut.delete_all_for_user(user_id)
+
+    assert {r.session_id for r in revoked} == {s.id_ for s in sessions}
+    for session in sessions:
+        assert await sut.get_with_user(session.id_) is None
+    assert await sut.get_with_user(other.id_) is not None
+
+
+async def test_refresh_extends_session() -> None:
+    clock = FakeClock()
+    sut, _ = create_store(clock)
+    session = create_session(UserId(uuid4()), expires_in=timedelta(seconds=30))
+    await sut.add(session, max_per_user=3)
+    extended = UtcDatetime(NOW + timedelta(minutes=5))
+
+    assert await sut.refresh(session.id_, extended) == extended
+    clock.now += 60
+
+    loaded = await sut.get_with_user(session.id_)
+    assert loaded is not None
+    assert loaded[0].expiration == extended
+    assert [r.session_id for r in await sut.delete_all_for_user(session.user_id)] == [session.id_]
+
+
+async def test_refresh_does_not_bring_back_deleted_session() -> None:
+    sut, _ = create_store(FakeClock())
+    session = create_session(UserId(uuid4()))
+    await sut.add(session, max_per_user=3)
+    await sut.delete(session.id_)
+
+    await sut.refresh(session.id_, UtcDatetime(NOW + timedelta(minutes=10)))
+
+    assert await sut.get_with_user(session.id_) is None
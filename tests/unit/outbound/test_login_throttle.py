@@ -0,0 +1,238 @@
+import pytest
+
+from app.core.common.value_objects.username import Username
+from app.outbound.auth_ctx.exceptions import LoginThrottledError
+from app.outbound.auth_ctx.login_throttle import (
+    ClientAddress,
+    InMemoryLoginThrottleStore,
+    KeyValueLoginThrottleStore,
+    LoginThrottle,
+    LoginThrottleStore,
+    ThrottlePolicy,
+    ThrottleState,
+)
+from app.outbound.auth_ctx.memory_kv_client import ShardedMemoryKeyValueClient
+
+USERNAME = Username("alice")
+CLIENT = ClientAddress("203.0.113.7")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_throttle(
+    clock: FakeClock,
+    *,
+    username_burst: int = 5,
+    account_burst: int = 50,
+    client_burst: int = 100,
+    free_failures: int = 3,
+    account_free_failures: int | None = None,
+    client_free_failures: int | None = None,
+    store: LoginThrottleStore | None = None,
+) -> LoginThrottle:
+    return LoginThrottle(
+        store if store is not None else InMemoryLoginThrottleStore(max_keys=100),
+        username_policy=ThrottlePolicy(burst=username_burst, refill_per_s=1.0, free_failures=free_failures),
+        account_policy=ThrottlePolicy(
+            burst=account_burst,
+            refill_per_s=1.0,
+            free_failures=account_free_failures if account_free_failures is not None else free_failures,
+        ),
+        client_policy=ThrottlePolicy(
+            burst=client_burst,
+            refill_per_s=1.0,
+            free_failures=client_free_failures if client_free_failures is not None else free_failures,
+        ),
+        backoff_base_s=2.0,
+        backoff_max_s=60.0,
+        clock=clock,
+    )
+
+
+async def test_rejects_when_bucket_is_empty_and_refills_over_time() -> None:
+    clock = FakeClock()
+    sut = create_throttle(clock, username_burst=2)
+    await sut.acquire(USERNAME, CLIENT)
+    await sut.acquire(USERNAME, CLIENT)
+
+    with pytest.raises(LoginThrottledError) as exc_info:
+        await sut.acquire(USERNAME, CLIENT)
+
+    assert exc_info.value.retry_after_s == pytest.approx(1.0)
+    clock.now += 1.0
+    await sut.acquire(USERNAME, CLIENT)
+
+
+async def test_username_key_ignores_case() -> None:
+    sut = create_throttle(FakeClock(), username_burst=1)
+    await sut.acquire(Username("Alice"), CLIENT)
+
+    with pytest.raises(LoginThrottledError):
+        await sut.acquire(Username("alice"), CLIENT)
+
+
+async def test_client_bucket_is_shared_across_usernames() -> None:
+    sut = create_throttle(FakeClock(), client_burst=2)
+    await sut.acquire(Username("alice"), CLIENT)
+    await sut.acquire(Username("bobby"), CLIENT)
+
+    with pytest.raises(LoginThrottledError):
+        await sut.acquire(Username("carol"), CLIENT)
+
+    await sut.acquire(Username("carol"), ClientAddress("198.51.100.1"))
+
+
+async def test_rejection_does_not_charge_other_keys() -> None:
+    sut = create_throttle(FakeClock(), username_burst=1, client_burst=2)
+    await sut.acquire(USERNAME, CLIENT)
+
+    for _ in range(3):
+        with pytest.raises(LoginThrottledError):
+            await sut.acquire(USERNAME, CLIENT)
+
+    await sut.acquire(Username("bobby"), CLIENT)
+
+
+async def test_blocks_with_exponential_backoff_after_free_failures() -> None:
+    clock = FakeClock()
+    sut = create_throttle(clock, free_failures=2)
+
+    await sut.record_failure(USERNAME, CLIENT)
+    await sut.record_failure(USERNAME, CLIENT)
+    await sut.acquire(USERNAME, CLIENT)
+    await sut.record_failure(USERNAME, CLIENT)
+    with pytest.raises(LoginThrottledError) as first:
+        await sut.acquire(USERNAME, CLIENT)
+    clock.now += 2.0
+    await sut.acquire(USERNAME, CLIENT)
+    await sut.record_failure(USERNAME, CLIENT)
+    with pytest.raises(LoginThrottledError) as second:
+        await sut.acquire(USERNAME, CLIENT)
+
+    assert first.value.retry_after_s == pytest.approx(2.0)
+    assert second.value.retry_after_s == pytest.approx(4.0)
+
+
+async def test_last_free_failure_is_not_penalised() -> None:
+    sut = create_throttle(FakeClock(), free_failures=3)
+
+    for _ in range(3):
+        await sut.record_failure(USERNAME, CLIENT)
+    await sut.acquire(USERNAME, CLIENT)
+    await sut.record_failure(USERNAME, CLIENT)
+
+    with pytest.raises(LoginThrottledError):
+        await sut.acquire(USERNAME, CLIENT)
+
+
+async def test_backoff_is_capped() -> None:
+    clock = FakeClock()
+    sut = create_throttle(clock, free_failures=1)
+
+    for _ in range(20):
+        await sut.record_failure(USERNAME, None)
+
+    with pytest.raises(LoginThrottledError) as exc_info:
+        await sut.acquire(USERNAME, None)
+    assert exc_info.value.retry_after_s == pytest.approx(60.0)
+
+
+async def test_pair_bucket_is_kept_per_client() -> None:
+    sut = create_throttle(FakeClock(), free_failures=2, account_free_failures=10)
+    for _ in range(3):
+        await sut.record_failure(USERNAME, CLIENT)
+
+    with pytest.raises(LoginThrottledError):
+        await sut.acquire(USERNAME, CLIENT)
+
+    await sut.acquire(USERNAME, ClientAddress("198.51.100.1"))
+
+
+async def test_username_bucket_spans_clients() -> None:
+    sut = create_throttle(FakeClock(), free_failures=10, account_free_failures=3)
+    for n in range(4):
+        await sut.record_failure(USERNAME, ClientAddress(f"198.51.100.{n}"))
+
+    with pytest.raises(LoginThrottledError):
+        await sut.acquire(USERNAME, ClientAddress("198.51.100.99"))
+
+    await sut.acquire(Username("bobby"), ClientAddress("198.51.100.99"))
+
+
+async def test_username_burst_spans_clients() -> None:
+    sut = create_throttle(FakeClock(), account_burst=3)
+    for n in range(3):
+        await sut.acquire(USERNAME, ClientAddress(f"198.51.100.{n}"))
+
+    with pytest.raises(LoginThrottledError):
+        await sut.acquire(USERNAME, ClientAddress("198.51.100.99"))
+
+
+async def test_success_clears_pair_failures_only() -> None:
+    sut = create_throttle(FakeClock(), free_failures=1, account_free_failures=2, client_free_failures=10)
+    await sut.record_failure(USERNAME, CLIENT)
+
+    await sut.record_success(USERNAME, CLIENT)
+    await sut.record_failure(USERNAME, CLIENT)
+    await sut.acquire(USERNAME, CLIENT)
+    await sut.record_failure(USERNAME, ClientAddress("198.51.100.1"))
+
+    with pytest.raises(LoginThrottledError):
+        await sut.acquire(USERNAME, CLIENT)
+
+
+async def test_failures_are_forgotten_after_max_backoff() -> None:
+    clock = FakeClock()
+    sut = create_throttle(clock, free_failures=1)
+    await sut.record_failure(USERNAME, None)
+
+    clock.now += 60.0
+    await sut.record_failure(USERNAME, None)
+
+    await sut.acquire(USERNAME, None)
+
+
+async def test_store_evicts_least_recently_used_keys() -> None:
+    sut = InMemoryLoginThrottleStore(max_keys=2)
+    state = ThrottleState(tokens=1.0, updated_at=0.0)
+    await sut.put("a", state, ttl_s=1.0)
+    await sut.put("b", state, ttl_s=1.0)
+    await sut.get("a")
+
+    await sut.put("c", state, ttl_s=1.0)
+
+    assert await sut.get("a") == state
+    assert await sut.get("b") is None
+    assert await sut.get("c") == state
+
+
+async def test_key_value_store_is_shared_between_throttles() -> None:
+    clock = FakeClock()
+    client = ShardedMemoryKeyValueClient(shard_count=2, clock=clock)
+    node_a = create_throttle(clock, username_burst=1, store=KeyValueLoginThrottleStore(client))
+    node_b = create_throttle(clock, username_burst=1, store=KeyValueLoginThrottleStore(client))
+    await node_a.acquire(USERNAME, CLIENT)
+
+    with pytest.raises(LoginThrottledError):
+        await node_b.acquire(USERNAME, CLIENT)
+
+
+async def test_key_value_store_forgets_state_after_it_stops_mattering() -> None:
+    clock = FakeClock()
+    store = KeyValueLoginThrottleStore(ShardedMemoryKeyValueClient(shard_count=2, clock=clock))
+    sut = create_throttle(clock, free_failures=1, store=store)
+    await sut.record_failure(USERNAME, CLIENT)
+    assert await store.get(f"client:{CLIENT}") is not None
+
+    # Client bucket: 100 tokens at 1 per second outlast the 60 s of backoff.
+    clock.now += 100.0
+
+    assert await store.get(f"client:{CLIENT}") is None
+    assert await store.get(f"username:alice:client:{CLIENT}") is None
+    assert await store.get("username:alice") is None
@@ -0,0 +1,96 @@
+import time
+
+import bcrypt
+import pytest
+
+from app.outbound.adapters.password_hash_engines import (
+    Argon2idEngine,
+    BcryptEngine,
+    PasswordHashEngine,
+    ScryptEngine,
+)
+
+
+@pytest.mark.parametrize(
+    ("sut", "prefix"),
+    [
+        pytest.param(BcryptEngine(4), b"$2b$", id="bcrypt"),
+        pytest.param(Argon2idEngine(time_cost=1, memory_cost_kib=64, parallelism=1), b"$argon2id$", id="argon2id"),
+        pytest.param(ScryptEngine(log2_n=4, r=8, p=1), b"$scrypt$", id="scrypt"),
+    ],
+)
+def test_round_trips_and_identifies_own_format(sut: PasswordHashEngine, prefix: bytes) -> None:
+    hashed = sut.hash(b"secret")
+
+    assert hashed.startswith(prefix)
+    assert sut.identifies(hashed)
+    assert sut.verify(b"secret", hashed)
+    assert not sut.verify(b"guess", hashed)
+    assert not sut.needs_rehash(hashed)
+
+
+@pytest.mark.parametrize(
+    ("current", "tuned"),
+    [
+        pytest.param(BcryptEngine(4), BcryptEngine(5), id="bcrypt"),
+        pytest.param(
+            Argon2idEngine(time_cost=1, memory_cost_kib=64, parallelism=1),
+            Argon2idEngine(time_cost=1, memory_cost_kib=128, parallelism=2),
+            id="argon2id",
+        ),
+        pytest.param(ScryptEngine(log2_n=4, r=8, p=1), ScryptEngine(log2_n=5, r=8, p=1), id="scrypt"),
+    ],
+)
+def test_needs_rehash_after_retuning(current: PasswordHashEngine, tuned: PasswordHashEngine) -> None:
+    hashed = current.hash(b"secret")
+
+    assert tuned.identifies(hashed)
+    assert tuned.needs_rehash(hashed)
+    assert tuned.verify(b"secret", hashed)
+
+
+@pytest.mark.parametrize(
+    ("sut", "hashed"),
+    [
+        pytest.param(BcryptEngine(4), b"$2b$04$garbage", id="bcrypt"),
+        pytest.param(
+            Argon2idEngine(time_cost=1, memory_cost_kib=64, parallelism=1), b"$argon2id$garbage", id="argon2id"
+        ),
+        pytest.param(ScryptEngine(log2_n=4, r=8, p=1), b"$scrypt$garbage", id="scrypt"),
+        pytest.param(ScryptEngine(log2_n=4, r=8, p=1), b"$scrypt$ln=4,r=8$c2FsdA$a2V5", id="scrypt-missing-param"),
+        pytest.param(ScryptEngine(log2_n=4, r=8, p=1), b"$scrypt$ln=99,r=8,p=1$c2FsdA$a2V5", id="scrypt-out-of-range"),
+    ],
+)
+def test_malformed_hash_fails_verification_and_needs_rehash(sut: PasswordHashEngine, hashed: bytes) -> None:
+    assert sut.identifies(hashed)
+    assert not sut.verify(b"secret", hashed)
+    assert sut.needs_rehash(hashed)
+
+
+def test_calibrated_engine_keeps_hashes_one_step_away() -> None:
+    sut = BcryptEngine(6, min_work_factor=4)
+
+    assert not sut.needs_rehash(BcryptEngine(5).hash(b"secret"))
+    assert not sut.needs_rehash(BcryptEngine(7).hash(b"secret"))
+    assert sut.needs_rehash(BcryptEngine(4).hash(b"secret"))
+
+
+def test_calibrated_engine_rehashes_below_floor() -> None:
+    sut = BcryptEngine(5, min_work_factor=5)
+
+    assert sut.needs_rehash(BcryptEngine(4).hash(b"secret"))
+
+
+def test_calibration_stays_within_budget() -> None:
+    budget_s = 0.05
+
+    work_factor = BcryptEngine.calibrate_work_factor(b"probe", budget_s=budget_s, min_work_factor=4)
+
+    assert work_factor >= 4
+    started = time.perf_counter()
+    bcrypt.hashpw(b"probe", bcrypt.gensalt(rounds=work_factor))
+    assert time.perf_counter() - started < 4 * budget_s
+
+
+def test_calibration_never_goes_below_floor() -> None:
+    assert BcryptEngine.calibrate_work_factor(b"probe", budget_s=0, min_work_factor=4) == 4
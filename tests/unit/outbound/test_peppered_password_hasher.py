@@ -0,0 +1,116 @@
+from functools import partial
+
+import pytest
+
+from app.core.common.entities.types_ import UserPasswordHash
+from app.outbound.adapters.password_hash_engines import Argon2idEngine, BcryptEngine, ScryptEngine
+from app.outbound.adapters.peppered_password_hasher import PepperedPasswordHasher
+from tests.unit.core.common.services.factories import create_raw_password
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_verifies_correct_password(
+    peppered_password_hasher: partial[PepperedPasswordHasher],
+) -> None:
+    sut = peppered_password_hasher()
+    pwd = create_raw_password()
+
+    hashed = await sut.hash(pwd)
+
+    assert await sut.verify(raw_password=pwd, hashed_password=hashed)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_does_not_verify_incorrect_password(
+    peppered_password_hasher: partial[PepperedPasswordHasher],
+) -> None:
+    sut = peppered_password_hasher()
+    correct_pwd = create_raw_password("secure")
+    incorrect_pwd = create_raw_password("bruteforce")
+
+    hashed = await sut.hash(correct_pwd)
+
+    assert not await sut.verify(raw_password=incorrect_pwd, hashed_password=hashed)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_supports_passwords_longer_than_bcrypt_limit(
+    peppered_password_hasher: partial[PepperedPasswordHasher],
+) -> None:
+    bcrypt_limit = 72
+    sut = peppered_password_hasher()
+    pwd = create_raw_password("x" * (bcrypt_limit + 1))
+
+    hashed = await sut.hash(pwd)
+
+    assert await sut.verify(raw_password=pwd, hashed_password=hashed)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_hashes_are_unique_for_same_password(
+    peppered_password_hasher: partial[PepperedPasswordHasher],
+) -> None:
+    sut = peppered_password_hasher()
+    pwd = create_raw_password()
+
+    assert await sut.hash(pwd) != await sut.hash(pwd)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_different_peppers_fail_verification(
+    peppered_password_hasher: partial[PepperedPasswordHasher],
+) -> None:
+    pwd = create_raw_password()
+    hasher1 = peppered_password_hasher(pepper=b"PepperA")
+    hasher2 = peppered_password_hasher(pepper=b"PepperB")
+
+    hashed = await hasher1.hash(pwd)
+
+    assert await hasher1.verify(raw_password=pwd, hashed_password=hashed)
+    assert not await hasher2.verify(raw_password=pwd, hashed_password=hashed)
+
+
+@pytest.mark.asyncio
+async def test_needs_rehash_when_primary_parameters_differ(
+    peppered_password_hasher: partial[PepperedPasswordHasher],
+) -> None:
+    pwd = create_raw_password()
+    hashed = await peppered_password_hasher(engines=(BcryptEngine(4),)).hash(pwd)
+
+    assert not await peppered_password_hasher(engines=(BcryptEngine(4),)).needs_rehash(hashed)
+    assert await peppered_password_hasher(engines=(BcryptEngine(5),)).needs_rehash(hashed)
+
+
+@pytest.mark.asyncio
+async def test_verifies_legacy_format_and_asks_to_migrate_it(
+    peppered_password_hasher: partial[PepperedPasswordHasher],
+) -> None:
+    bcrypt_engine = BcryptEngine(4)
+    argon2_engine = Argon2idEngine(time_cost=1, memory_cost_kib=64, parallelism=1)
+    scrypt_engine = ScryptEngine(log2_n=4, r=8, p=1)
+    pwd = create_raw_password()
+    legacy_hash = await peppered_password_hasher(engines=(bcrypt_engine,)).hash(pwd)
+    sut = peppered_password_hasher(engines=(argon2_engine, bcrypt_engine, scrypt_engine))
+
+    assert await sut.verify(raw_password=pwd, hashed_password=legacy_hash)
+    assert await sut.needs_rehash(legacy_hash)
+
+    migrated = await sut.hash(pwd)
+
+    assert migrated.startswith(b"$argon2id$")
+    assert await sut.verify(raw_password=pwd, hashed_password=migrated)
+    assert not await sut.needs_rehash(migrated)
+
+
+@pytest.mark.asyncio
+async def test_does_not_verify_unknown_format(
+    peppered_password_hasher: partial[PepperedPasswordHasher],
+) -> None:
+    sut = peppered_password_hasher(engines=(BcryptEngine(4),))
+
+    assert not await sut.verify(raw_password=create_raw_password(), hashed_password=UserPasswordHash(b"$md5$x"))
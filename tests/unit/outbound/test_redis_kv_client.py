@@ -0,0 +1,112 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from app.outbound.auth_ctx.memory_kv_client import ShardedMemoryKeyValueClient
+from app.outbound.auth_ctx.redis_kv_client import RedisKeyValueClient
+from app.outbound.exceptions import StorageError
+
+
+class StandInServer:
+    """Speaks just enough of the Redis protocol for the client, backed by the in-memory client."""
+
+    def __init__(self) -> None:
+        self.backend = ShardedMemoryKeyValueClient(shard_count=2)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                command = await self._read_command(reader)
+                writer.write(await self._reply(command))
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    @staticmethod
+    async def _read_command(reader: asyncio.StreamReader) -> list[str]:
+        count = int((await reader.readuntil(b"\r\n"))[1:-2])
+        args = []
+        for _ in range(count):
+            length = int((await reader.readuntil(b"\r\n"))[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2].decode())
+        return args
+
+    async def _reply(self, command: list[str]) -> bytes:
+        name, *args = command
+        if name == "MGET":
+            values = await self.backend.get_many(args)
+            return b"*%d\r\n" % len(values) + b"".join(self._bulk(v) for v in values)
+        if name == "SET":
+            key, value, *options = args
+            written = await self.backend.put(
+                key,
+                value,
+                ttl_s=int(options[options.index("PX") + 1]) / 1000,
+                only_existing="XX" in options,
+            )
+            return b"+OK\r\n" if written else b"$-1\r\n"
+        if name == "DEL":
+            await self.backend.delete(args)
+            return b":%d\r\n" % len(args)
+        if name == "SADD":
+            await self.backend.set_add(args[0], args[1], ttl_s=3600)
+            return b":1\r\n"
+        if name == "PEXPIRE":
+            return b":1\r\n"
+        if name == "SREM":
+            await self.backend.set_remove(args[0], args[1:])
+            return b":1\r\n"
+        if name == "SMEMBERS":
+            members = sorted(await self.backend.set_members(args[0]))
+            return b"*%d\r\n" % len(members) + b"".join(self._bulk(m) for m in members)
+        return b"-ERR unknown command '%s'\r\n" % name.encode()
+
+    @staticmethod
+    def _bulk(value: str | None) -> bytes:
+        if value is None:
+            return b"$-1\r\n"
+        data = value.encode()
+        return b"$%d\r\n%s\r\n" % (len(data), data)
+
+
+@pytest.fixture
+async def redis_client() -> AsyncIterator[RedisKeyValueClient]:
+    server = await asyncio.start_server(StandInServer().handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    client = RedisKeyValueClient(host="127.0.0.1", port=port, pool_size=2, timeout_s=1)
+    yield client
+    await client.close()
+    server.close()
+    await server.wait_closed()
+
+
+async def test_round_trips_values_and_sets(redis_client: RedisKeyValueClient) -> None:
+    assert await redis_client.put("a", "1", ttl_s=60)
+    assert not await redis_client.put("b", "2", ttl_s=60, only_existing=True)
+    await redis_client.set_add("s", "x", ttl_s=60)
+    await redis_client.set_add("s", "y", ttl_s=60)
+    await redis_client.set_remove("s", ["x"])
+
+    assert await redis_client.get_many(["a", "b"]) == ["1", None]
+    assert await redis_client.set_members("s") == {"y"}
+
+    await redis_client.delete(["a"])
+    assert await redis_client.get_many(["a"]) == [None]
+
+
+async def test_concurrent_commands_share_pool(redis_client: RedisKeyValueClient) -> None:
+    await asyncio.gather(*(redis_client.put(f"k{i}", str(i), ttl_s=60) for i in range(20)))
+
+    assert await redis_client.get_many([f"k{i}" for i in range(20)]) == [str(i) for i in range(20)]
+
+
+async def test_unreachable_server_raises_storage_error() -> None:
+    server = await asyncio.start_server(StandInServer().handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    server.close()
+    await server.wait_closed()
+    sut = RedisKeyValueClient(host="127.0.0.1", port=port, pool_size=1, timeout_s=1)
+
+    with pytest.raises(StorageError):
+        await sut.get_many(["a"])
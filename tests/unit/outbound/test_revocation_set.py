@@ -0,0 +1,62 @@
+from datetime import UTC, datetime, timedelta
+
+from app.core.common.value_objects.utc_datetime import UtcDatetime
+from app.outbound.auth_ctx.model import SessionId
+from app.outbound.auth_ctx.revocation_set import BloomFilter, RevocationSet, RevokedSession
+
+NOW = UtcDatetime(datetime(2026, 1, 1, tzinfo=UTC))
+
+
+def revoked(session_id: str, *, expires_in: timedelta = timedelta(minutes=5)) -> RevokedSession:
+    return RevokedSession(session_id=SessionId(session_id), expiration=UtcDatetime(NOW.value + expires_in))
+
+
+def test_bloom_filter_has_no_false_negatives() -> None:
+    sut = BloomFilter(capacity=1000, false_positive_rate=0.01)
+    items = [f"session-{i}" for i in range(1000)]
+
+    for item in items:
+        sut.add(item)
+
+    assert all(item in sut for item in items)
+
+
+def test_bloom_filter_keeps_false_positive_rate_near_target() -> None:
+    sut = BloomFilter(capacity=1000, false_positive_rate=0.01)
+    for i in range(1000):
+        sut.add(f"session-{i}")
+
+    false_positives = sum(f"other-{i}" in sut for i in range(10_000))
+
+    assert false_positives < 300
+
+
+def test_contains_only_revoked_sessions() -> None:
+    sut = RevocationSet(capacity=10)
+
+    sut.add(revoked("revoked"))
+
+    assert SessionId("revoked") in sut
+    assert SessionId("active") not in sut
+
+
+def test_prune_drops_expired_sessions() -> None:
+    sut = RevocationSet(capacity=10)
+    sut.add(revoked("expiring", expires_in=timedelta(seconds=10)))
+    sut.add(revoked("lasting"))
+
+    sut.prune(UtcDatetime(NOW.value + timedelta(seconds=10)))
+
+    assert SessionId("expiring") not in sut
+    assert SessionId("lasting") in sut
+    assert len(sut) == 1
+
+
+def test_grows_past_capacity() -> None:
+    sut = RevocationSet(capacity=4)
+
+    for i in range(100):
+        sut.add(revoked(f"session-{i}"))
+
+    assert len(sut) == 100
+    assert all(SessionId(f"session-{i}") in sut for i in range(100))
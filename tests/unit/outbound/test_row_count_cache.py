@@ -0,0 +1,36 @@
+from app.outbound.adapters.row_count_cache import RowCountCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_returns_count_until_stale() -> None:
+    clock = FakeClock()
+    sut = RowCountCache(ttl_s=30, clock=clock)
+    sut.put("users", 42)
+
+    clock.now = 29.9
+    assert sut.get("users") == 42
+
+    clock.now = 30
+    assert sut.get("users") is None
+
+
+def test_keeps_counts_per_key() -> None:
+    sut = RowCountCache(ttl_s=30, clock=FakeClock())
+    sut.put("users", 1)
+    sut.put("sessions", 2)
+
+    assert (sut.get("users"), sut.get("sessions"), sut.get("other")) == (1, 2, None)
+
+
+def test_zero_ttl_disables_caching() -> None:
+    sut = RowCountCache(ttl_s=0, clock=FakeClock())
+    sut.put("users", 42)
+
+    assert sut.get("users") is None
@@ -0,0 +1,71 @@
+from app.core.queries.ports.user_reader import ListUsersQm
+from app.outbound.adapters.user_list_cache import UserListCache
+
+VERSION = 7
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_listing(total: int = 0) -> ListUsersQm:
+    return ListUsersQm(users=[], total=total, limit=20, offset=0)
+
+
+def test_returns_listing_stored_for_current_version() -> None:
+    sut = UserListCache(max_entries=10, ttl_s=30, clock=FakeClock())
+    listing = create_listing()
+    sut.put(("offset", 20), listing, version=VERSION)
+
+    assert sut.get(("offset", 20), version=VERSION) is listing
+    assert sut.get(("offset", 10), version=VERSION) is None
+
+
+def test_newer_version_drops_listing() -> None:
+    sut = UserListCache(max_entries=10, ttl_s=30, clock=FakeClock())
+    sut.put(("offset", 20), create_listing(), version=VERSION)
+
+    assert sut.get(("offset", 20), version=VERSION + 1) is None
+    assert sut.get(("offset", 20), version=VERSION) is None
+
+
+def test_listing_read_before_a_bump_is_not_served() -> None:
+    sut = UserListCache(max_entries=10, ttl_s=30, clock=FakeClock())
+
+    sut.put(("offset", 20), create_listing(), version=VERSION)
+
+    assert sut.get(("offset", 20), version=VERSION + 1) is None
+
+
+def test_listing_goes_stale_after_ttl() -> None:
+    clock = FakeClock()
+    sut = UserListCache(max_entries=10, ttl_s=30, clock=clock)
+    sut.put(("offset", 20), create_listing(), version=VERSION)
+
+    clock.now = 30
+
+    assert sut.get(("offset", 20), version=VERSION) is None
+
+
+def test_evicts_least_recently_used_beyond_max_entries() -> None:
+    sut = UserListCache(max_entries=2, ttl_s=30, clock=FakeClock())
+    sut.put(("a",), create_listing(1), version=VERSION)
+    sut.put(("b",), create_listing(2), version=VERSION)
+    sut.get(("a",), version=VERSION)
+
+    sut.put(("c",), create_listing(3), version=VERSION)
+
+    assert sut.get(("b",), version=VERSION) is None
+    assert sut.get(("a",), version=VERSION) is not None
+    assert sut.get(("c",), version=VERSION) is not None
+
+
+def test_zero_ttl_disables_caching() -> None:
+    sut = UserListCache(max_entries=10, ttl_s=0, clock=FakeClock())
+    sut.put(("offset", 20), create_listing(), version=VERSION)
+
+    assert sut.get(("offset", 20), version=VERSION) is None